@@ -10,7 +10,7 @@ from itertools import chain
 import logging
 import logging.handlers
 import mimetypes
-from operator import contains, itemgetter
+from operator import attrgetter, contains, itemgetter
 import os
 import platform
 import sys
@@ -87,21 +87,26 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.json import json_bytes
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
+    SetupPhases,
+    SetupSpan,
     # _setup_started is marked as protected to make it clear
     # that it is not part of the public API and should not be used
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
     _setup_started,
+    async_get_setup_spans,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from .util.async_ import create_eager_task
+from .util.file import WriteError, write_utf8_file
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
@@ -127,6 +132,9 @@ DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
+# Chrome trace of the startup written to the config dir in debug mode
+STARTUP_TRACE_FILE = "startup_trace.json"
+
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
@@ -761,23 +769,26 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    integration_cache: dict[str, loader.Integration] | None = None,
 ) -> None:
-    """Set up multiple domains. Log on failure."""
+    """Set up multiple domains. Log on failure.
+
+    When the integrations are passed, the setup of each domain only starts
+    once the domains it depends on in the same batch have been set up.
+    """
     # Avoid creating tasks for domains that were setup in a previous stage
     domains_not_yet_setup = domains - hass.config.components
-    # Create setup tasks for base platforms first since everything will have
-    # to wait to be imported, and the sooner we can get the base platforms
-    # loaded the sooner we can start loading the rest of the integrations.
-    futures = {
-        domain: hass.async_create_task_internal(
-            async_setup_component(hass, domain, config),
+    futures: dict[str, asyncio.Future[bool]] = {}
+    for domain, prerequisites in _async_order_by_dependencies(
+        domains_not_yet_setup, integration_cache or {}
+    ):
+        futures[domain] = hass.async_create_task_internal(
+            _async_setup_when_ready(
+                hass, domain, config, [futures[dep] for dep in prerequisites]
+            ),
             f"setup component {domain}",
             eager_start=True,
         )
-        for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
-        )
-    }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
     for idx, domain in enumerate(futures):
         result = results[idx]
@@ -789,6 +800,84 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_setup_when_ready(
+    hass: core.HomeAssistant,
+    domain: str,
+    config: dict[str, Any],
+    prerequisites: list[asyncio.Future[bool]],
+) -> bool:
+    """Set up a domain once the domains it depends on have been set up."""
+    if prerequisites:
+        await asyncio.wait(prerequisites)
+    return await async_setup_component(hass, domain, config)
+
+
+def _async_order_by_dependencies(
+    domains: set[str], integration_cache: dict[str, loader.Integration]
+) -> list[tuple[str, set[str]]]:
+    """Order domains so they come after the domains they depend on.
+
+    Returns the domains with the domains in the batch they have to wait for.
+    Base platforms come first since everything will have to wait for them to
+    be imported. The remaining domains are ordered by the longest chain of
+    domains waiting on them so the critical path is started as soon as
+    possible.
+    """
+    prerequisites = {
+        domain: {
+            dep
+            for dep in chain(itg.dependencies, itg.after_dependencies)
+            if dep in domains
+        }
+        if (itg := integration_cache.get(domain)) is not None
+        else set()
+        for domain in domains
+    }
+    dependents: defaultdict[str, set[str]] = defaultdict(set)
+    for domain, deps in prerequisites.items():
+        for dep in deps:
+            dependents[dep].add(domain)
+
+    chain_lengths: dict[str, int] = {}
+
+    def _chain_length(domain: str) -> int:
+        if (length := chain_lengths.get(domain)) is None:
+            # Guard against circular after dependencies
+            chain_lengths[domain] = 0
+            length = chain_lengths[domain] = 1 + max(
+                map(_chain_length, dependents[domain]), default=0
+            )
+        return length
+
+    def _sort_key(domain: str) -> tuple[bool, int, str]:
+        return (SETUP_ORDER_SORT_KEY(domain), _chain_length(domain), domain)
+
+    waiting = {domain: set(deps) for domain, deps in prerequisites.items()}
+    ready = sorted(
+        (domain for domain, deps in waiting.items() if not deps), key=_sort_key
+    )
+    ordered: list[tuple[str, set[str]]] = []
+    while waiting:
+        if not ready:
+            # Circular after dependencies, setup will sort them out
+            domain = max(waiting, key=_sort_key)
+            prerequisites[domain].difference_update(waiting)
+            ready.append(domain)
+        domain = ready.pop()
+        del waiting[domain]
+        ordered.append((domain, prerequisites[domain]))
+        unblocked = False
+        for dependent in dependents[domain]:
+            if (deps := waiting.get(dependent)) is not None:
+                deps.discard(domain)
+                if not deps:
+                    ready.append(dependent)
+                    unblocked = True
+        if unblocked:
+            ready.sort(key=_sort_key)
+    return ordered
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -953,6 +1042,7 @@ async def _async_set_up_integrations(
     """Set up all the integrations."""
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
+    stage_spans: list[tuple[str, float, float]] = []
 
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
@@ -1002,7 +1092,11 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            stage_started = monotonic()
+            await async_setup_multi_components(
+                hass, domain_group, config, integration_cache
+            )
+            stage_spans.append((name, stage_started, monotonic()))
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1010,35 +1104,44 @@ async def _async_set_up_integrations(
     # Start setup
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
+        stage_started = monotonic()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, integration_cache
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
+        stage_spans.append(("stage 1", stage_started, monotonic()))
 
     # Add after dependencies when setting up stage 2 domains
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
+        stage_started = monotonic()
         try:
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, integration_cache
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
                 hass._active_tasks,  # noqa: SLF001
             )
+        stage_spans.append(("stage 2", stage_started, monotonic()))
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
+    stage_started = monotonic()
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
             await hass.async_block_till_done()
@@ -1047,6 +1150,7 @@ async def _async_set_up_integrations(
             "Setup timed out for bootstrap waiting on %s - moving forward",
             hass._active_tasks,  # noqa: SLF001
         )
+    stage_spans.append(("wrap up", stage_started, monotonic()))
 
     watcher.async_stop()
 
@@ -1056,3 +1160,117 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug(
+            "Setup stage times: %s",
+            {name: end - start for name, start, end in stage_spans},
+        )
+
+    setup_spans = async_get_setup_spans(hass)
+    if critical_path := _async_get_critical_path(setup_spans, integration_cache):
+        _LOGGER.info(
+            "Startup critical path: %s",
+            " -> ".join(
+                f"{span.integration} ({span.finished - span.started:.2f}s)"
+                for span in critical_path
+            ),
+        )
+    if hass.config.debug:
+        trace = _async_startup_trace(hass, stage_spans, setup_spans, critical_path)
+        with contextlib.suppress(WriteError):
+            await hass.async_add_executor_job(
+                write_utf8_file,
+                hass.config.path(STARTUP_TRACE_FILE),
+                json_bytes(trace),
+                False,
+                "wb",
+            )
+
+
+@core.callback
+def _async_get_critical_path(
+    setup_spans: list[SetupSpan], integration_cache: dict[str, loader.Integration]
+) -> list[SetupSpan]:
+    """Return the chain of domains which gated the end of startup.
+
+    Starting from the domain which finished setting up last, follow the
+    dependency which finished setting up last before the domain started.
+    """
+    setups = {
+        span.integration: span
+        for span in setup_spans
+        if span.group is None and span.phase is SetupPhases.SETUP
+    }
+    if not setups:
+        return []
+    span = max(setups.values(), key=attrgetter("finished"))
+    critical_path = [span]
+    while (integration := integration_cache.get(span.integration)) is not None and (
+        gating := [
+            setups[dep]
+            for dep in chain(integration.dependencies, integration.after_dependencies)
+            if dep in setups and setups[dep].finished <= span.started
+        ]
+    ):
+        span = max(gating, key=attrgetter("finished"))
+        critical_path.append(span)
+    critical_path.reverse()
+    return critical_path
+
+
+@core.callback
+def _async_startup_trace(
+    hass: core.HomeAssistant,
+    stage_spans: list[tuple[str, float, float]],
+    setup_spans: list[SetupSpan],
+    critical_path: list[SetupSpan],
+) -> dict[str, Any]:
+    """Return the startup in the Chrome trace event format."""
+    origin = min(
+        chain(
+            (start for _, start, _ in stage_spans),
+            (span.started for span in setup_spans),
+        )
+    )
+    events: list[dict[str, Any]] = []
+    threads: dict[str, int] = {}
+
+    def _add(name: str, category: str, thread: str, start: float, end: float) -> None:
+        if (tid := threads.get(thread)) is None:
+            tid = threads[thread] = len(threads)
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": thread},
+                }
+            )
+        events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round((start - origin) * 1_000_000),
+                "dur": round((end - start) * 1_000_000),
+            }
+        )
+
+    for name, start, end in stage_spans:
+        _add(name, "stage", "bootstrap", start, end)
+    for span in setup_spans:
+        thread = span.integration
+        if span.group is not None:
+            thread = f"{thread} ({span.group})"
+        _add(span.integration, span.phase, thread, span.started, span.finished)
+
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "critical_path": [span.integration for span in critical_path],
+            "setup_timings": async_get_setup_timings(hass),
+        },
+    }
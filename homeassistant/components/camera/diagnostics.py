@@ -25,7 +25,11 @@ async def async_get_config_entry_diagnostics(
             camera = _get_camera_from_entity_id(hass, entity.entity_id)
         except HomeAssistantError:
             continue
-        diagnostics[entity.entity_id] = (
-            camera.stream.get_diagnostics() if camera.stream else {}
-        )
+        if (stream := camera.stream) is None:
+            diagnostics[entity.entity_id] = {}
+            continue
+        diagnostics[entity.entity_id] = {
+            **stream.get_diagnostics(),
+            "metrics": stream.get_metrics(),
+        }
     return diagnostics
@@ -89,6 +89,7 @@ class DhcpMatchers:
 
     registered_devices_domains: set[str]
     no_oui_matchers: dict[str, list[DHCPMatcher]]
+    no_oui_hostname_patterns: dict[str, re.Pattern]
     oui_matchers: dict[str, list[DHCPMatcher]]
 
 
@@ -102,6 +103,10 @@ def async_index_integration_matchers(
     1. Registered devices
     2. Devices with no OUI - index by first char of lower() hostname
     3. Devices with OUI - index by OUI
+
+    The hostname globs of each no OUI bucket are also compiled into a
+    single regex so hostnames that cannot match any of them are rejected
+    without checking every matcher in the bucket.
     """
     registered_devices_domains: set[str] = set()
     no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
@@ -123,6 +128,12 @@ def async_index_integration_matchers(
     return DhcpMatchers(
         registered_devices_domains=registered_devices_domains,
         no_oui_matchers=no_oui_matchers,
+        no_oui_hostname_patterns={
+            first_char: _compile_fnmatch_any(
+                tuple(matcher[HOSTNAME] for matcher in matchers)
+            )
+            for first_char, matchers in no_oui_matchers.items()
+        },
         oui_matchers=oui_matchers,
     )
 
@@ -256,8 +267,15 @@ class WatcherBase:
         lowercase_hostname_first_char = (
             lowercase_hostname[0] if len(lowercase_hostname) else ""
         )
+        no_oui_matchers: list[DHCPMatcher] = []
+        if (
+            hostname_pattern := matchers.no_oui_hostname_patterns.get(
+                lowercase_hostname_first_char
+            )
+        ) and hostname_pattern.match(lowercase_hostname):
+            no_oui_matchers = matchers.no_oui_matchers[lowercase_hostname_first_char]
         for matcher in itertools.chain(
-            matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
+            no_oui_matchers,
             matchers.oui_matchers.get(oui, ()),
         ):
             domain = matcher["domain"]
@@ -420,6 +438,11 @@ def _compile_fnmatch(pattern: str) -> re.Pattern:
     return re.compile(translate(pattern))
 
 
+def _compile_fnmatch_any(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile fnmatch patterns into a single regex matching any of them."""
+    return re.compile("|".join(translate(pattern) for pattern in patterns))
+
+
 @lru_cache(maxsize=1024, typed=True)
 def _memorized_fnmatch(name: str, pattern: str) -> bool:
     """Memorized version of fnmatch that has a larger lru_cache.
@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Seconds to wait for a client to read a history chunk before giving up
+HISTORY_CHUNK_DRAIN_TIMEOUT = 30
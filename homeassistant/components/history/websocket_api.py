@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -39,7 +40,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_DRAIN_TIMEOUT,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -94,6 +99,52 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    after: history.HistoryChunkPosition | None,
+) -> tuple[bytes | None, history.HistoryChunkPosition | None]:
+    """Fetch a chunk of history significant_states and convert it to json in the executor."""
+    with session_scope(hass=hass, read_only=True) as session:
+        chunk, after = history.get_significant_states_chunk_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+            after,
+        )
+    if not chunk:
+        return None, after
+    return (
+        json_bytes(messages.event_message(msg_id, {"states": chunk, "partial": True})),
+        after,
+    )
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history."""
+    connection.send_result(msg["id"], {})
+    if msg.get("chunk_size"):
+        connection.send_message(messages.event_message(msg["id"], {"states": {}}))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,6 +155,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunk_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -130,7 +182,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,12 +202,62 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunk_size := msg.get("chunk_size"):
+        # The result is followed by a series of partial event messages
+        # holding at most chunk_size states each and a final empty event
+        msg_id: int = msg["id"]
+        connection.send_result(msg_id, {})
+        cancelled = asyncio.Event()
+        connection.subscriptions[msg_id] = cancelled.set
+        instance = get_instance(hass)
+        after: history.HistoryChunkPosition | None = None
+        try:
+            while True:
+                message, after = await instance.async_add_executor_job(
+                    _ws_get_significant_states_chunk,
+                    hass,
+                    msg_id,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                    chunk_size,
+                    after,
+                )
+                if cancelled.is_set():
+                    return
+                if message:
+                    connection.send_message(message)
+                if after is None:
+                    break
+                # Wait for the client to catch up before fetching the next
+                # chunk, no database connection is held while waiting
+                try:
+                    async with asyncio.timeout(HISTORY_CHUNK_DRAIN_TIMEOUT):
+                        await connection.wait_for_drain()
+                except TimeoutError:
+                    connection.send_error(
+                        msg_id,
+                        websocket_api.ERR_TIMEOUT,
+                        "Timed out waiting for the client to read the history",
+                    )
+                    return
+                if cancelled.is_set():
+                    return
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        connection.send_message(messages.event_message(msg_id, {"states": {}}))
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections import deque
 import functools
 import logging
@@ -73,7 +72,9 @@ class MQTTDiscoveryPayload(dict[str, Any]):
 
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry from already discovered list."""
-    hass.data[DATA_MQTT].discovery_already_discovered.discard(discovery_hash)
+    mqtt_data = hass.data[DATA_MQTT]
+    mqtt_data.discovery_already_discovered.discard(discovery_hash)
+    mqtt_data.discovery_raw_payloads.pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
@@ -190,7 +191,8 @@ async def async_start(  # noqa: C901
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
-    platform_setup_lock: dict[str, asyncio.Lock] = {}
+    # Payloads waiting for the set up of their platform to finish
+    pending_platform_setup: dict[str, list[MQTTDiscoveryPayload]] = {}
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
@@ -204,16 +206,17 @@ async def async_start(  # noqa: C901
             hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), discovery_payload
         )
 
-    async def _async_component_setup(
-        component: str, discovery_payload: MQTTDiscoveryPayload
-    ) -> None:
-        """Perform component set up."""
-        async with platform_setup_lock.setdefault(component, asyncio.Lock()):
-            if component not in mqtt_data.platforms_loaded:
-                await async_forward_entry_setup_and_setup_discovery(
-                    hass, config_entry, {component}
-                )
-        _async_add_component(discovery_payload)
+    async def _async_component_setup(component: str) -> None:
+        """Perform component set up and add the pending components."""
+        try:
+            await async_forward_entry_setup_and_setup_discovery(
+                hass, config_entry, {component}
+            )
+        except Exception:
+            pending_platform_setup.pop(component)
+            raise
+        for discovery_payload in pending_platform_setup.pop(component):
+            _async_add_component(discovery_payload)
 
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
@@ -242,6 +245,25 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = f"{node_id} {object_id}" if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        if (
+            payload
+            and discovery_hash in mqtt_data.discovery_already_discovered
+            and discovery_hash not in mqtt_data.discovery_pending_discovered
+            and mqtt_data.discovery_raw_payloads.get(discovery_hash) == payload
+        ):
+            # The broker replays all retained configs when we (re)connect,
+            # skip parsing the ones that did not change since they were applied
+            _LOGGER.debug(
+                "Component has already been discovered: %s %s, payload unchanged",
+                component,
+                discovery_id,
+            )
+            return
+
         if payload:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
@@ -256,11 +278,8 @@ async def async_start(  # noqa: C901
         else:
             discovery_payload = MQTTDiscoveryPayload({})
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = f"{node_id} {object_id}" if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if discovery_payload:
+            mqtt_data.discovery_raw_payloads[discovery_hash] = payload
             # Attach MQTT topic to the payload, used for debug prints
             setattr(
                 discovery_payload,
@@ -275,6 +294,8 @@ async def async_start(  # noqa: C901
             setattr(discovery_payload, "discovery_data", discovery_data)
 
             discovery_payload[CONF_PLATFORM] = "mqtt"
+        else:
+            mqtt_data.discovery_raw_payloads.pop(discovery_hash, None)
 
         if discovery_hash in mqtt_data.discovery_pending_discovered:
             pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
@@ -324,10 +345,13 @@ async def async_start(  # noqa: C901
             }
 
         if component not in mqtt_data.platforms_loaded and payload:
-            # Load component first
-            config_entry.async_create_task(
-                hass, _async_component_setup(component, payload)
-            )
+            # Load component first, components discovered while the platform
+            # is set up are added together when the set up is done
+            if component in pending_platform_setup:
+                pending_platform_setup[component].append(payload)
+            else:
+                pending_platform_setup[component] = [payload]
+                config_entry.async_create_task(hass, _async_component_setup(component))
         elif already_discovered:
             # Dispatch update
             message = f"Component has already been discovered: {component} {discovery_id}, sending update"
@@ -416,6 +440,7 @@ async def async_stop(hass: HomeAssistant) -> None:
     for unsub in mqtt_data.discovery_unsubscribe:
         unsub()
     mqtt_data.discovery_unsubscribe = []
+    mqtt_data.discovery_raw_payloads.clear()
     for key, unsub in list(mqtt_data.integration_unsubscribe.items()):
         unsub()
         mqtt_data.integration_unsubscribe.pop(key)
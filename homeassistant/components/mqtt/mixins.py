@@ -254,6 +254,14 @@ def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    discovered_entities: list[Entity] = []
+
+    @callback
+    def _async_add_discovered_entities() -> None:
+        """Add the entities discovered in the last loop iteration in one call."""
+        entities = discovered_entities.copy()
+        discovered_entities.clear()
+        async_add_entities(entities)
 
     @callback
     def _async_setup_entity_entry_from_discovery(
@@ -271,9 +279,12 @@ def async_setup_entity_entry_helper(
                 entity_class = schema_class_mapping[config[CONF_SCHEMA]]
             if TYPE_CHECKING:
                 assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
+            entity = entity_class(hass, config, entry, discovery_payload.discovery_data)
+            if not discovered_entities:
+                # Retained discovery messages arrive in bursts, adding them
+                # together avoids scheduling a platform task for each entity
+                hass.loop.call_soon(_async_add_discovered_entities)
+            discovered_entities.append(entity)
         except vol.Invalid as err:
             _handle_discovery_failure(hass, discovery_payload)
             async_handle_schema_error(discovery_payload, err)
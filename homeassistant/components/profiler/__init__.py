@@ -17,16 +17,23 @@ from lru import LRU
 from typing_extensions import Generator
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    LOOP_LATENCY,
+    LOOP_LATENCY_TOP_OFFENDERS,
+    SIGNAL_LOOP_LATENCY_UPDATED,
+)
+from .loop_latency import LoopLatencyProfiler
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +47,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_LOOP_LATENCY = "start_loop_latency"
+SERVICE_STOP_LOOP_LATENCY = "stop_loop_latency"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,8 +72,12 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_LOOP_LATENCY,
+    SERVICE_STOP_LOOP_LATENCY,
 )
 
+PLATFORMS = [Platform.SENSOR]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
@@ -74,6 +87,7 @@ CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+LOOP_LATENCY_INTERVAL_SUB = "loop_latency_interval_subscription"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,7 +98,8 @@ async def async_setup_entry(  # noqa: C901
 ) -> bool:
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
-    domain_data = hass.data[DOMAIN] = {}
+    loop_latency = LoopLatencyProfiler(hass)
+    domain_data = hass.data[DOMAIN] = {LOOP_LATENCY: loop_latency}
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -260,6 +275,45 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    @callback
+    def _async_send_top_offenders() -> None:
+        """Rank the offenders once for all the sensors."""
+        async_dispatcher_send(
+            hass,
+            SIGNAL_LOOP_LATENCY_UPDATED,
+            loop_latency.async_top_offenders(LOOP_LATENCY_TOP_OFFENDERS),
+        )
+
+    @callback
+    def _async_start_loop_latency(call: ServiceCall) -> None:
+        if LOOP_LATENCY_INTERVAL_SUB in domain_data:
+            raise HomeAssistantError("Loop latency sampling already started")
+
+        @callback
+        def _async_loop_latency_updated(*_: Any) -> None:
+            _async_send_top_offenders()
+
+        loop_latency.async_start()
+        cancel_track = async_track_time_interval(
+            hass, _async_loop_latency_updated, call.data[CONF_SCAN_INTERVAL]
+        )
+
+        @callback
+        def _cancel():
+            cancel_track()
+            loop_latency.async_stop()
+            _async_send_top_offenders()
+
+        domain_data[LOOP_LATENCY_INTERVAL_SUB] = _cancel
+        _async_loop_latency_updated()
+
+    @callback
+    def _async_stop_loop_latency(call: ServiceCall) -> None:
+        if LOOP_LATENCY_INTERVAL_SUB not in domain_data:
+            raise HomeAssistantError("Loop latency sampling not running")
+
+        domain_data.pop(LOOP_LATENCY_INTERVAL_SUB)()
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,19 +436,78 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOOP_LATENCY,
+        _async_start_loop_latency,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+                ): cv.time_period
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOOP_LATENCY,
+        _async_stop_loop_latency,
+    )
+
+    websocket_api.async_register_command(hass, websocket_loop_latency)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
-    if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
-        hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    for sub in (LOG_INTERVAL_SUB, LOOP_LATENCY_INTERVAL_SUB):
+        if sub in hass.data[DOMAIN]:
+            hass.data[DOMAIN][sub]()
     hass.data.pop(DOMAIN)
     return True
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/loop_latency",
+        vol.Optional("limit", default=LOOP_LATENCY_TOP_OFFENDERS): vol.All(
+            int, vol.Range(min=1)
+        ),
+    }
+)
+def websocket_loop_latency(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the jobs with the highest event loop latency."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+    loop_latency: LoopLatencyProfiler = hass.data[DOMAIN][LOOP_LATENCY]
+    connection.send_result(
+        msg["id"],
+        {
+            "running": loop_latency.running,
+            "top_offenders": loop_latency.async_top_offenders(msg["limit"]),
+        },
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
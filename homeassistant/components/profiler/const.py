@@ -1,4 +1,15 @@
 """Consts used by profiler."""
 
+from typing import Any
+
+from homeassistant.util.signal_type import SignalType
+
 DOMAIN = "profiler"
 DEFAULT_NAME = "Profiler"
+
+LOOP_LATENCY = "loop_latency"
+LOOP_LATENCY_TOP_OFFENDERS = 5
+# Sent with the top offenders ranked by p99 latency
+SIGNAL_LOOP_LATENCY_UPDATED: SignalType[list[dict[str, Any]]] = SignalType(
+    "profiler_loop_latency_updated"
+)
@@ -0,0 +1,148 @@
+"""Measure how long jobs run in the event loop."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import functools
+from time import perf_counter
+from typing import Any
+
+from lru import LRU
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+
+# Only the most recent samples of each target are kept to calculate
+# the percentiles so memory use stays flat while sampling runs for days
+MAX_SAMPLES_PER_TARGET = 1000
+MAX_CACHED_JOB_NAMES = 4096
+
+
+@dataclass(slots=True)
+class _TargetStats:
+    """Timings of a single job target."""
+
+    samples: deque[float] = field(
+        default_factory=lambda: deque(maxlen=MAX_SAMPLES_PER_TARGET)
+    )
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+def _percentile(sorted_samples: list[float], percentile: float) -> float:
+    """Return the percentile of sorted samples."""
+    return sorted_samples[
+        min(len(sorted_samples) - 1, int(len(sorted_samples) * percentile))
+    ]
+
+
+def _job_target_name(hassjob: HassJob) -> str:
+    """Return a name for the target of a job that is stable across calls."""
+    target: Any = hassjob.target
+    while isinstance(target, functools.partial):
+        target = target.func
+    qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+    if module := getattr(target, "__module__", None):
+        return f"{module}.{qualname}"
+    return qualname
+
+
+class LoopLatencyProfiler:
+    """Measure the wall time of every job run in the event loop.
+
+    All listeners of the event bus and all callbacks scheduled by the
+    async_track_* helpers are run with HomeAssistant.async_run_hass_job.
+    While the profiler is running, that method is replaced on the
+    instance with one that times each call, so nothing is added to the
+    hot path when it is stopped.
+
+    For coroutine jobs only the part that runs eagerly is timed, which
+    is the part that blocks the event loop. Time spent in jobs that are
+    run by a job is only counted for the inner job.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self._stats: dict[str, _TargetStats] = {}
+        self._job_names: LRU[HassJob, str] = LRU(MAX_CACHED_JOB_NAMES)
+        self._nested = 0.0
+        self._started: float | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the profiler is running."""
+        return self._started is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start timing jobs."""
+        if self._started is not None:
+            return
+        self._stats.clear()
+        self._nested = 0.0
+        self._started = perf_counter()
+        hass = self.hass
+        wrapped = self._wrap_run_hass_job(hass.async_run_hass_job)
+        hass.async_run_hass_job = wrapped  # type: ignore[method-assign]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop timing jobs."""
+        if self._started is None:
+            return
+        self._started = None
+        del self.hass.async_run_hass_job
+        self._job_names.clear()
+
+    def _wrap_run_hass_job(
+        self, run_hass_job: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Wrap async_run_hass_job to time each job."""
+        stats = self._stats
+        job_names = self._job_names
+
+        def _async_run_hass_job(
+            hassjob: HassJob, *args: Any, background: bool = False
+        ) -> Any:
+            outer_nested = self._nested
+            self._nested = 0.0
+            start = perf_counter()
+            try:
+                return run_hass_job(hassjob, *args, background=background)
+            finally:
+                elapsed = perf_counter() - start
+                if (name := job_names.get(hassjob)) is None:
+                    name = job_names[hassjob] = _job_target_name(hassjob)
+                if (target_stats := stats.get(name)) is None:
+                    target_stats = stats[name] = _TargetStats()
+                duration = elapsed - self._nested
+                target_stats.samples.append(duration)
+                target_stats.count += 1
+                target_stats.total += duration
+                if duration > target_stats.max:
+                    target_stats.max = duration
+                self._nested = outer_nested + elapsed
+
+        return _async_run_hass_job
+
+    @callback
+    def async_top_offenders(self, limit: int) -> list[dict[str, Any]]:
+        """Return the targets with the highest p99 latency in milliseconds."""
+        offenders: list[dict[str, Any]] = []
+        for name, target_stats in self._stats.items():
+            samples = sorted(target_stats.samples)
+            offenders.append(
+                {
+                    "target": name,
+                    "count": target_stats.count,
+                    "p50": round(_percentile(samples, 0.5) * 1000, 3),
+                    "p99": round(_percentile(samples, 0.99) * 1000, 3),
+                    "max": round(target_stats.max * 1000, 3),
+                    "total": round(target_stats.total * 1000, 3),
+                }
+            )
+        offenders.sort(key=lambda offender: offender["p99"], reverse=True)
+        return offenders[:limit]
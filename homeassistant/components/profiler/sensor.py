@@ -0,0 +1,110 @@
+"""Sensor platform for the Profiler integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    DEFAULT_NAME,
+    DOMAIN,
+    LOOP_LATENCY,
+    LOOP_LATENCY_TOP_OFFENDERS,
+    SIGNAL_LOOP_LATENCY_UPDATED,
+)
+from .loop_latency import LoopLatencyProfiler
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Profiler sensors."""
+    loop_latency: LoopLatencyProfiler = hass.data[DOMAIN][LOOP_LATENCY]
+    offenders = loop_latency.async_top_offenders(LOOP_LATENCY_TOP_OFFENDERS)
+    async_add_entities(
+        LoopLatencyOffenderSensor(loop_latency, entry.entry_id, rank, offenders)
+        for rank in range(1, LOOP_LATENCY_TOP_OFFENDERS + 1)
+    )
+
+
+class LoopLatencyOffenderSensor(SensorEntity):
+    """The p99 latency of the job target at a rank of the top offenders.
+
+    The target at a rank changes over time so the sensor has no state class.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_translation_key = "loop_latency_offender"
+
+    def __init__(
+        self,
+        loop_latency: LoopLatencyProfiler,
+        entry_id: str,
+        rank: int,
+        offenders: list[dict[str, Any]],
+    ) -> None:
+        """Initialize the sensor."""
+        self._loop_latency = loop_latency
+        self._rank = rank
+        self._attr_unique_id = f"{entry_id}-loop_latency_offender_{rank}"
+        self._attr_translation_placeholders = {"rank": str(rank)}
+        self._attr_device_info = DeviceInfo(
+            name=DEFAULT_NAME,
+            identifiers={(DOMAIN, entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        self._offender: dict[str, Any] | None = None
+        self._async_update_offender(offenders)
+
+    @property
+    def available(self) -> bool:
+        """Return if loop latency sampling is running."""
+        return self._loop_latency.running
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p99 latency of the offender."""
+        return self._offender["p99"] if self._offender else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the target and the other timings of the offender."""
+        if not self._offender:
+            return None
+        return {key: value for key, value in self._offender.items() if key != "p99"}
+
+    async def async_added_to_hass(self) -> None:
+        """Register signal listener when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LOOP_LATENCY_UPDATED, self._async_update
+            )
+        )
+
+    @callback
+    def _async_update_offender(self, offenders: list[dict[str, Any]]) -> None:
+        """Update the offender at the rank of this sensor."""
+        self._offender = (
+            offenders[self._rank - 1] if len(offenders) >= self._rank else None
+        )
+
+    @callback
+    def _async_update(self, offenders: list[dict[str, Any]]) -> None:
+        """Update the sensor when new timings are available."""
+        self._async_update_offender(offenders)
+        self.async_write_ha_state()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
@@ -26,7 +27,7 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
 )
-from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES, ATTR_HUMIDITY
 from homeassistant.components.light import ATTR_BRIGHTNESS
 from homeassistant.components.sensor import SensorDeviceClass
@@ -49,7 +50,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -107,8 +114,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -122,6 +127,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
+        hass,
         entity_filter,
         namespace,
         climate_units,
@@ -130,24 +136,34 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+    hass.bus.listen(EVENT_STATE_CHANGED, metrics.async_handle_state_changed_event)
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
-        metrics.handle_entity_registry_updated,
+        metrics.async_handle_entity_registry_updated,
     )
 
     for state in hass.states.all():
         if entity_filter(state.entity_id):
             metrics.handle_state(state)
 
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
+
     return True
 
 
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    Events are queued in the event loop and applied in batches in the
+    executor, one batch per loop iteration at most. The metrics of the
+    entities are kept in a registry of their own so their exposition can
+    be cached until a batch changed them, while the process and platform
+    metrics of the default registry are rendered on every scrape.
+    """
 
     def __init__(
         self,
+        hass: HomeAssistant,
         entity_filter: entityfilter.EntityFilter,
         namespace: str,
         climate_units: UnitOfTemperature,
@@ -156,6 +172,7 @@ class PrometheusMetrics:
         default_metric: str | None,
     ) -> None:
         """Initialize Prometheus Metrics."""
+        self.hass = hass
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -177,15 +194,92 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
         self._climate_units = climate_units
+        self._registry = prometheus_client.CollectorRegistry(auto_describe=True)
+        self._entity_labels: dict[str, dict[str, Any]] = {}
+        self._pending: list[tuple[Callable[[Event[Any]], bool], Event[Any]]] = []
+        self._batch_task: asyncio.Task[None] | None = None
+        # Bumped after every change to the metrics of the entities
+        self._generation = 0
+        self._exposition: tuple[int, bytes] | None = None
+
+    @callback
+    def async_handle_state_changed_event(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Queue a state change to be applied with the next batch."""
+        self._async_queue_event(self.handle_state_changed_event, event)
+
+    @callback
+    def async_handle_entity_registry_updated(
+        self, event: Event[EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Queue an entity registry update to be applied with the next batch."""
+        self._async_queue_event(self.handle_entity_registry_updated, event)
+
+    @callback
+    def _async_queue_event(
+        self, handler: Callable[[Event[Any]], bool], event: Event[Any]
+    ) -> None:
+        """Queue an event and schedule a batch if none is pending."""
+        self._pending.append((handler, event))
+        if self._batch_task is None:
+            self._batch_task = self.hass.async_create_task(
+                self._async_handle_pending(), "prometheus batch", eager_start=False
+            )
+
+    async def _async_handle_pending(self) -> None:
+        """Apply the queued events, one batch at a time to keep them in order."""
+        try:
+            while self._pending:
+                pending, self._pending = self._pending, []
+                await self.hass.async_add_executor_job(self._handle_batch, pending)
+        finally:
+            self._batch_task = None
+
+    def _handle_batch(
+        self, pending: list[tuple[Callable[[Event[Any]], bool], Event[Any]]]
+    ) -> None:
+        """Apply a batch of events to the metrics."""
+        changed = False
+        for handler, event in pending:
+            try:
+                if handler(event):
+                    changed = True
+            except Exception:
+                _LOGGER.exception("Error handling %s", event)
+                # The metrics may have been partially updated
+                changed = True
+        if changed:
+            self._generation += 1
+
+    def generate_latest(self) -> bytes:
+        """Return the exposition of all metrics.
+
+        The metrics of the entities are only rendered again when they
+        changed since the last call.
+        """
+        generation = self._generation
+        if (exposition := self._exposition) is None or exposition[0] != generation:
+            # A batch applied while rendering bumps the generation
+            # again, so a partial render is never served twice
+            exposition = self._exposition = (
+                generation,
+                prometheus_client.generate_latest(self._registry),
+            )
+        default_exposition = prometheus_client.generate_latest(
+            prometheus_client.REGISTRY
+        )
+        return default_exposition + exposition[1]
 
-    def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
-        """Handle new messages from the bus."""
+    def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> bool:
+        """Handle new messages from the bus, return if the metrics changed."""
         if (state := event.data.get("new_state")) is None:
-            return
+            self._entity_labels.pop(event.data["entity_id"], None)
+            return False
 
         if not self._filter(state.entity_id):
             _LOGGER.debug("Filtered out entity %s", state.entity_id)
-            return
+            return False
 
         if (old_state := event.data.get("old_state")) is not None and (
             old_friendly_name := old_state.attributes.get(ATTR_FRIENDLY_NAME)
@@ -193,6 +287,7 @@ class PrometheusMetrics:
             self._remove_labelsets(old_state.entity_id, old_friendly_name)
 
         self.handle_state(state)
+        return True
 
     def handle_state(self, state: State) -> None:
         """Add/update a state in Prometheus."""
@@ -229,10 +324,13 @@ class PrometheusMetrics:
 
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
-    ) -> None:
-        """Listen for deleted, disabled or renamed entities and remove them from the Prometheus Registry."""
+    ) -> bool:
+        """Listen for deleted, disabled or renamed entities and remove them from the Prometheus Registry.
+
+        Return if any metrics were removed.
+        """
         if event.data["action"] in (None, "create"):
-            return
+            return False
 
         entity_id = event.data.get("entity_id")
         _LOGGER.debug("Handling entity update for %s", entity_id)
@@ -249,13 +347,19 @@ class PrometheusMetrics:
             elif "disabled_by" in changes:
                 metrics_entity_id = entity_id
 
-        if metrics_entity_id:
-            self._remove_labelsets(metrics_entity_id)
+        if not metrics_entity_id:
+            return False
+        self._entity_labels.pop(metrics_entity_id, None)
+        return self._remove_labelsets(metrics_entity_id)
 
     def _remove_labelsets(
         self, entity_id: str, friendly_name: str | None = None
-    ) -> None:
-        """Remove labelsets matching the given entity id from all metrics."""
+    ) -> bool:
+        """Remove labelsets matching the given entity id from all metrics.
+
+        Return if any labelset was removed.
+        """
+        removed = False
         for metric in list(self._metrics.values()):
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
@@ -270,6 +374,8 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                        removed = True
+        return removed
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -306,7 +412,7 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=self._registry,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
@@ -337,13 +443,17 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state: State) -> dict[str, Any]:
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state: State) -> dict[str, Any]:
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        if (labels := self._entity_labels.get(state.entity_id)) is None or labels[
+            "friendly_name"
+        ] != friendly_name:
+            labels = self._entity_labels[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        return labels
 
     def _battery(self, state: State) -> None:
         if (battery_level := state.attributes.get(ATTR_BATTERY_LEVEL)) is not None:
@@ -721,15 +831,17 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        hass = request.app[KEY_HASS]
         return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
+            body=await hass.async_add_executor_job(self._metrics.generate_latest),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
@@ -59,6 +59,10 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# The maximum number of seconds a single purge task may run before
+# it yields to the other recorder tasks and reschedules itself
+DEFAULT_PURGE_TIME_BUDGET = 5
+
 STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
@@ -52,6 +52,7 @@ from homeassistant.util.event_type import EventType
 from . import migration, statistics
 from .const import (
     DB_WORKER_PREFIX,
+    DEFAULT_PURGE_TIME_BUDGET,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
     KEEPALIVE_TIME,
@@ -93,6 +94,7 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
@@ -156,6 +158,10 @@ ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
+# The maximum number of queued events that are processed as one block
+# when the recorder is behind
+MAX_EVENT_BLOCK_SIZE = 1000
+
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -255,6 +261,12 @@ class Recorder(threading.Thread):
         # and determine what is actually supported.
         self.max_bind_vars = SQLITE_MAX_BIND_VARS
 
+        # The number of seconds a purge task may run before it
+        # reschedules itself so other recorder tasks can run
+        self.purge_time_budget: float = DEFAULT_PURGE_TIME_BUDGET
+        # The progress of the current or last purge
+        self.purge_progress: PurgeProgress | None = None
+
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
@@ -874,7 +886,27 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            task_or_event = queue_.get()
+            if type(task_or_event) is not Event or queue_.empty():
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                continue
+            # The recorder is behind, drain the events that are already
+            # queued as a block so their ids can be resolved all at once.
+            # A task ends the block since it must run after the events
+            # queued before it.
+            events: list[Event[Any]] = [task_or_event]
+            next_task: RecorderTask | None = None
+            while len(events) < MAX_EVENT_BLOCK_SIZE and not queue_.empty():
+                if type(task_or_event := queue_.get_nowait()) is Event:
+                    events.append(task_or_event)
+                else:
+                    next_task = cast(RecorderTask, task_or_event)
+                    break
+            self._pre_process_event_block(events)
+            for event in events:
+                self._guarded_process_one_task_or_event_or_recover(event)
+            if next_task is not None:
+                self._guarded_process_one_task_or_event_or_recover(next_task)
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
@@ -902,6 +934,38 @@ class Recorder(threading.Thread):
         self.states_meta_manager.load(state_change_events, session)
         self.state_attributes_manager.load(state_change_events, session)
 
+    def _pre_process_event_block(self, events: list[Event[Any]]) -> None:
+        """Pre process a block of events.
+
+        Resolves the ids of the entity_ids, state attributes, event types
+        and event data of the block that are not cached yet with a few
+        bulk queries instead of one query for each event.
+        """
+        if not self.enabled or self.event_session is None:
+            return
+        state_change_events: list[Event[EventStateChangedData]] = []
+        non_state_change_events: list[Event] = []
+        for event_ in events:
+            if event_.event_type == EVENT_STATE_CHANGED:
+                state_change_events.append(event_)
+            else:
+                non_state_change_events.append(event_)
+
+        session = self.event_session
+        try:
+            if non_state_change_events:
+                self.event_data_manager.load(non_state_change_events, session)
+                if self.event_type_manager.active:
+                    self.event_type_manager.load(non_state_change_events, session)
+            if state_change_events:
+                if self.states_meta_manager.active:
+                    self.states_meta_manager.load(state_change_events, session)
+                self.state_attributes_manager.load(state_change_events, session)
+        except SQLAlchemyError:
+            # The events are still resolved one by one when they are
+            # processed, which will also handle the error if it persists
+            _LOGGER.debug("Error while pre processing a block of events", exc_info=True)
+
     def _guarded_process_one_task_or_event_or_recover(
         self, task: RecorderTask | Event
     ) -> None:
@@ -722,6 +722,38 @@ class StatisticsBase:
             sum=stats.get("sum"),
         )
 
+    @classmethod
+    def row_from_stats(cls, metadata_id: int, stats: StatisticData) -> dict[str, Any]:
+        """Create a row for a bulk insert from a statistics with datatime objects."""
+        return {
+            "metadata_id": metadata_id,
+            "created_ts": time.time(),
+            "start_ts": dt_util.utc_to_timestamp(stats["start"]),
+            "mean": stats.get("mean"),
+            "min": stats.get("min"),
+            "max": stats.get("max"),
+            "last_reset_ts": datetime_to_timestamp_or_none(stats.get("last_reset")),
+            "state": stats.get("state"),
+            "sum": stats.get("sum"),
+        }
+
+    @classmethod
+    def row_from_stats_ts(
+        cls, metadata_id: int, stats: StatisticDataTimestamp
+    ) -> dict[str, Any]:
+        """Create a row for a bulk insert from a statistics with timestamps."""
+        return {
+            "metadata_id": metadata_id,
+            "created_ts": time.time(),
+            "start_ts": stats["start_ts"],
+            "mean": stats.get("mean"),
+            "min": stats.get("min"),
+            "max": stats.get("max"),
+            "last_reset_ts": stats.get("last_reset_ts"),
+            "state": stats.get("state"),
+            "sum": stats.get("sum"),
+        }
+
 
 class Statistics(Base, StatisticsBase):
     """Long term statistics."""
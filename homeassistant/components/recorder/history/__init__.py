@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -13,9 +13,12 @@ from ... import recorder
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    HistoryChunkPosition,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_chunk_with_session as _modern_get_significant_states_chunk_with_session,
+    get_significant_states_columns_with_session as _modern_get_significant_states_columns_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +27,12 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "HistoryChunkPosition",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_chunk_with_session",
+    "get_significant_states_columns_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -152,6 +158,75 @@ def get_significant_states_with_session(
     )
 
 
+def get_significant_states_chunk_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    after: HistoryChunkPosition | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], HistoryChunkPosition | None]:
+    """Return a chunk of significant states during a time period in compressed format."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_chunk_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+            after,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    # The legacy schema does not support paging, the whole result
+    # is returned as a single chunk
+    states = _legacy_get_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    return cast(dict[str, list[dict[str, Any]]], states), None
+
+
+def get_significant_states_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+) -> dict[str, tuple[list[float], list[str | None], list[str | None]]] | None:
+    """Return significant states during a time period as columns.
+
+    Returns None if the database schema does not support it yet, in which
+    case get_full_significant_states_with_session should be used.
+    """
+    if not recorder.get_instance(hass).states_meta_manager.active:
+        return None
+    return _modern_get_significant_states_columns_with_session(
+        hass, session, start_time, end_time, entity_ids
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
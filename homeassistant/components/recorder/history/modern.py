@@ -6,7 +6,7 @@ from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from sqlalchemy import (
     CompoundSelect,
@@ -229,6 +229,53 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        executed := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = executed
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _execute_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    limit: int | None = None,
+    after: tuple[int, float] | None = None,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Execute the significant states query.
+
+    Returns the rows sorted by metadata_id and last_updated, the start time
+    timestamp to use for the start time states if they were included, and
+    the mapping of entity_id to metadata_id. Returns None if none of the
+    entities have been recorded.
+
+    If limit is set at most that many rows are fetched, starting after the
+    (metadata_id, last_updated_ts) position given by after.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,8 +284,13 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
+    if after:
+        # Entities before the position were already returned completely
+        metadata_ids = [
+            metadata_id for metadata_id in metadata_ids if metadata_id >= after[0]
+        ]
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
             metadata_id
@@ -254,6 +306,39 @@ def get_significant_states_with_session(
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    if limit:
+        subquery = _significant_states_stmt(
+            start_time_ts,
+            end_time_ts,
+            single_metadata_id,
+            metadata_ids,
+            metadata_ids_in_significant_domains,
+            significant_changes_only,
+            no_attributes,
+            include_start_time_state,
+            run_start_ts,
+        ).subquery()
+        page_stmt = _select_from_subquery(
+            subquery, no_attributes, not significant_changes_only, False
+        )
+        if after:
+            after_metadata_id, after_last_updated_ts = after
+            page_stmt = page_stmt.where(
+                (subquery.c.metadata_id > after_metadata_id)
+                | (
+                    (subquery.c.metadata_id == after_metadata_id)
+                    & (subquery.c.last_updated_ts > after_last_updated_ts)
+                )
+            )
+        return (
+            session.execute(
+                page_stmt.order_by(
+                    subquery.c.metadata_id, subquery.c.last_updated_ts
+                ).limit(limit)
+            ).all(),
+            start_time_ts if include_start_time_state else None,
+            entity_id_to_metadata_id,
+        )
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
@@ -275,14 +360,170 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+) -> dict[str, tuple[list[float], list[str | None], list[str | None]]]:
+    """Return significant state changes during UTC period as columns.
+
+    This is a variant of get_significant_states_with_session for callers which
+    process many rows and do not need State objects. For each entity it
+    returns the last_updated timestamps, the states and the raw (not decoded)
+    attributes, sorted by last_updated. The state at the start time is
+    included and reported at start_time. Like get_significant_states_with_session
+    every requested entity has columns, which are empty if the entity has no
+    states in the period, unless none of the entities have been recorded.
+    """
+    if not (
+        executed := _execute_significant_states_stmt(
+            hass, session, start_time, end_time, entity_ids, True, True, False
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = executed
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    # The columns selected when only significant changes with attributes
+    # are fetched, see _significant_states_stmt
+    field_map = {
+        name: idx
+        for idx, name in enumerate(
+            _stmt_and_join_attributes(False, False, False).selected_columns.keys()
+        )
+    }
+    metadata_id_idx = field_map["metadata_id"]
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    attributes_idx = field_map["attributes"]
+    result: dict[str, tuple[list[float], list[str | None], list[str | None]]] = {
+        entity_id: ([], [], []) for entity_id in entity_ids
+    }
+    for metadata_id, group in groupby(rows, itemgetter(metadata_id_idx)):
+        group_rows = list(group)
+        result[metadata_id_to_entity_id[metadata_id]] = (
+            [row[last_updated_ts_idx] or start_time_ts for row in group_rows],
+            [row[state_idx] for row in group_rows],
+            [row[attributes_idx] for row in group_rows],
+        )
+    return result
+
+
+class HistoryChunkPosition(NamedTuple):
+    """Position of the last row returned in a history chunk."""
+
+    metadata_id: int
+    last_updated_ts: float
+    state: str | None
+
+
+def get_significant_states_chunk_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+    after: HistoryChunkPosition | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], HistoryChunkPosition | None]:
+    """Return a chunk of significant state changes during UTC period.
+
+    This is a paged variant of get_significant_states_with_session which
+    always uses the compressed state format. Each call fetches at most
+    chunk_size rows following the position returned by the previous call,
+    so no cursor or transaction has to be kept open between chunks. The
+    returned position is None once all states were returned. The states of
+    an entity may be split over consecutive chunks and must be concatenated
+    by the consumer.
+    """
+    if not (
+        executed := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            chunk_size,
+            after[:2] if after else None,
+        )
+    ):
+        return {}, None
+    rows, start_time_ts, entity_id_to_metadata_id = executed
+    page = list(rows)
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    metadata_id_idx = _FIELD_MAP["metadata_id"]
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    chunk: dict[str, list[dict[str, Any]]] = {}
+    prev_state: str | None = None
+    for metadata_id, group in groupby(page, itemgetter(metadata_id_idx)):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        minimal = (
+            minimal_response
+            and split_entity_id(entity_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+        )
+        attr_cache: dict[str, dict[str, Any]] = {}
+        if after and metadata_id == after.metadata_id:
+            # The entity is continued from the previous chunk
+            # which already returned its first state
+            first_row = False
+            prev_state = after.state
+        else:
+            first_row = True
+            prev_state = None
+        ent_results: list[dict[str, Any]] = []
+        for row in group:
+            state = row[state_idx]
+            if first_row or not minimal:
+                # With minimal response only the first state is a full state,
+                # the following ones only provide the "state" and "last_updated"
+                # and duplicate states are filtered out
+                ent_results.append(
+                    row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        no_attributes and minimal,
+                    )
+                )
+                first_row = False
+            elif state != prev_state:
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                    }
+                )
+            prev_state = state
+        if ent_results:
+            chunk[entity_id] = ent_results
+    if len(page) < chunk_size:
+        return chunk, None
+    last_row = page[-1]
+    return chunk, HistoryChunkPosition(
+        last_row[metadata_id_idx], last_row[last_updated_ts_idx], prev_state
     )
 
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from itertools import zip_longest
 import logging
@@ -40,6 +41,8 @@ from .queries import (
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_attributes_ids_in_range,
+    find_unused_data_ids_in_range,
 )
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
@@ -52,6 +55,46 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Ranges holding fewer ids are checked with an IN list instead of a range
+MIN_IDS_PER_PURGE_RANGE = 100
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Track the progress of a purge which runs over multiple purge tasks."""
+
+    purge_before: datetime
+    started: float = field(default_factory=time.monotonic)
+    runs: int = 0
+    # Time spent purging, excluding the time waiting for other recorder tasks
+    elapsed: float = 0.0
+    states: int = 0
+    state_attributes: int = 0
+    events: int = 0
+    event_data: int = 0
+    # The keyset positions to continue walking the states and events from
+    states_start_ts: float = 0.0
+    events_start_ts: float = 0.0
+    finished: bool = False
+
+    def apply_committed(self, pending: PurgeProgress) -> None:
+        """Take the counters and keyset positions of a committed purge run."""
+        self.states = pending.states
+        self.state_attributes = pending.state_attributes
+        self.events = pending.events
+        self.event_data = pending.event_data
+        self.states_start_ts = pending.states_start_ts
+        self.events_start_ts = pending.events_start_ts
+
+    @property
+    def rows(self) -> int:
+        """Return the total number of rows purged."""
+        return self.states + self.state_attributes + self.events + self.event_data
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the purge throughput in rows per second of purge time."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
 
 
 @retryable_database_job("purge")
@@ -62,69 +105,145 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    The purge stops early and returns False once instance.purge_time_budget
+    is exceeded. Pass the same progress to the next call to continue where
+    the previous one stopped.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if progress is None:
+        progress = PurgeProgress(purge_before)
+    run_start = time.monotonic()
+    progress.runs += 1
+    try:
+        finished = _purge_old_data(
+            instance,
+            purge_before,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            progress,
+            run_start + instance.purge_time_budget,
+        )
+    finally:
+        progress.elapsed += time.monotonic() - run_start
+    if not finished:
+        return False
+    progress.finished = True
+    _LOGGER.debug(
+        "Purged %s states, %s state attributes, %s events and %s event data "
+        "in %s runs and %.2fs (%.1f rows/s)",
+        progress.states,
+        progress.state_attributes,
+        progress.events,
+        progress.event_data,
+        progress.runs,
+        progress.elapsed,
+        progress.rows_per_second,
+    )
+    if repack:
+        repack_database(instance)
+    return True
+
+
+def _purge_old_data(
+    instance: Recorder,
+    purge_before: datetime,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    progress: PurgeProgress,
+    deadline: float,
+) -> bool:
+    """Purge events and states older than purge_before, see purge_old_data."""
+    # The progress is only advanced once the session is committed, a purge
+    # which is rolled back and retried has to walk the same rows again
+    pending = replace(progress)
     with session_scope(session=instance.get_session()) as session:
-        # Purge a max of max_bind_vars, based on the oldest states or events record
-        has_more_to_purge = False
-        if instance.use_legacy_events_index and _purging_legacy_format(session):
-            _LOGGER.debug(
-                "Purge running in legacy format as there are states with event_id"
-                " remaining"
-            )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
-        else:
-            _LOGGER.debug(
-                "Purge running in new format as there are NO states with event_id"
-                " remaining"
-            )
-            # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
+        finished = _purge_old_data_with_session(
+            instance,
+            session,
+            purge_before,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            pending,
+            deadline,
+        )
+    progress.apply_committed(pending)
+    return finished
 
-        statistics_runs = _select_statistics_runs_to_purge(
-            session, purge_before, instance.max_bind_vars
+
+def _purge_old_data_with_session(
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    progress: PurgeProgress,
+    deadline: float,
+) -> bool:
+    """Purge events and states older than purge_before in a session."""
+    # Purge a max of max_bind_vars, based on the oldest states or events record
+    has_more_to_purge = False
+    if instance.use_legacy_events_index and _purging_legacy_format(session):
+        _LOGGER.debug(
+            "Purge running in legacy format as there are states with event_id"
+            " remaining"
+        )
+        has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+    else:
+        _LOGGER.debug(
+            "Purge running in new format as there are NO states with event_id"
+            " remaining"
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
+        # Once we are done purging legacy rows, we use the new method
+        has_more_to_purge |= _purge_states_and_attributes_ids(
+            instance, session, states_batch_size, purge_before, progress, deadline
         )
-        if statistics_runs:
-            _purge_statistics_runs(session, statistics_runs)
+        has_more_to_purge |= _purge_events_and_data_ids(
+            instance, session, events_batch_size, purge_before, progress, deadline
+        )
+
+    statistics_runs = _select_statistics_runs_to_purge(
+        session, purge_before, instance.max_bind_vars
+    )
+    short_term_statistics = _select_short_term_statistics_to_purge(
+        session, purge_before, instance.max_bind_vars
+    )
+    if statistics_runs:
+        _purge_statistics_runs(session, statistics_runs)
 
-        if short_term_statistics:
-            _purge_short_term_statistics(session, short_term_statistics)
+    if short_term_statistics:
+        _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
-            # Return false, as we might not be done yet.
-            _LOGGER.debug("Purging hasn't fully completed yet")
-            return False
+    if has_more_to_purge or statistics_runs or short_term_statistics:
+        # Return false, as we might not be done yet.
+        _LOGGER.debug("Purging hasn't fully completed yet")
+        return False
 
-        if apply_filter and _purge_filtered_data(instance, session) is False:
-            _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
-            return False
+    if apply_filter and _purge_filtered_data(instance, session) is False:
+        _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
+        return False
 
-        # This purge cycle is finished, clean up old event types and
-        # recorder runs
-        if instance.event_type_manager.active:
-            _purge_old_event_types(instance, session)
+    # This purge cycle is finished, clean up old event types and
+    # recorder runs
+    if instance.event_type_manager.active:
+        _purge_old_event_types(instance, session)
 
-        if instance.states_meta_manager.active:
-            _purge_old_entity_ids(instance, session)
+    if instance.states_meta_manager.active:
+        _purge_old_entity_ids(instance, session)
 
-        _purge_old_recorder_runs(instance, session, purge_before)
-    if repack:
-        repack_database(instance)
+    _purge_old_recorder_runs(instance, session, purge_before)
     return True
 
 
@@ -178,13 +297,13 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
     Returns true if there are more states to purge.
     """
-    database_engine = instance.database_engine
-    assert database_engine is not None
     has_remaining_state_ids_to_purge = True
     # There are more states relative to attributes_ids so
     # we purge enough state_ids to try to generate a full
@@ -193,16 +312,23 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+        state_ids, attributes_ids, progress.states_start_ts = (
+            _select_state_attributes_ids_to_purge(
+                session, purge_before, max_bind_vars, progress.states_start_ts
+            )
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.states += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > deadline:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.state_attributes += _purge_unused_attributes_ids_in_ranges(
+        instance, session, attributes_ids_batch
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -215,6 +341,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -228,16 +356,21 @@ def _purge_events_and_data_ids(
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+        event_ids, data_ids, progress.events_start_ts = _select_event_data_ids_to_purge(
+            session, purge_before, max_bind_vars, progress.events_start_ts
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.events += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > deadline:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.event_data += _purge_unused_data_ids_in_ranges(
+        instance, session, data_ids_batch
+    )
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -246,41 +379,138 @@ def _purge_events_and_data_ids(
 
 
 def _select_state_attributes_ids_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of state and attribute ids to purge."""
+    session: Session, purge_before: datetime, max_bind_vars: int, start_ts: float
+) -> tuple[set[int], set[int], float]:
+    """Return sets of state and attribute ids to purge.
+
+    Also returns the keyset position to select the next batch from.
+    """
     state_ids = set()
     attributes_ids = set()
-    for state_id, attributes_id in session.execute(
-        find_states_to_purge(purge_before.timestamp(), max_bind_vars)
+    for state_id, attributes_id, last_updated_ts in session.execute(
+        find_states_to_purge(purge_before.timestamp(), max_bind_vars, start_ts)
     ).all():
         state_ids.add(state_id)
         if attributes_id:
             attributes_ids.add(attributes_id)
+        start_ts = last_updated_ts
     _LOGGER.debug(
         "Selected %s state ids and %s attributes_ids to remove",
         len(state_ids),
         len(attributes_ids),
     )
-    return state_ids, attributes_ids
+    return state_ids, attributes_ids, start_ts
 
 
 def _select_event_data_ids_to_purge(
-    session: Session, purge_before: datetime, max_bind_vars: int
-) -> tuple[set[int], set[int]]:
-    """Return sets of event and data ids to purge."""
+    session: Session, purge_before: datetime, max_bind_vars: int, start_ts: float
+) -> tuple[set[int], set[int], float]:
+    """Return sets of event and data ids to purge.
+
+    Also returns the keyset position to select the next batch from.
+    """
     event_ids = set()
     data_ids = set()
-    for event_id, data_id in session.execute(
-        find_events_to_purge(purge_before.timestamp(), max_bind_vars)
+    for event_id, data_id, time_fired_ts in session.execute(
+        find_events_to_purge(purge_before.timestamp(), max_bind_vars, start_ts)
     ).all():
         event_ids.add(event_id)
         if data_id:
             data_ids.add(data_id)
+        start_ts = time_fired_ts
     _LOGGER.debug(
         "Selected %s event ids and %s data_ids to remove", len(event_ids), len(data_ids)
     )
-    return event_ids, data_ids
+    return event_ids, data_ids, start_ts
+
+
+def _id_ranges(
+    ids: set[int], max_range_size: int, min_ids_per_range: int
+) -> tuple[list[tuple[int, int]], set[int]]:
+    """Split ids into inclusive ranges spanning at most max_range_size ids.
+
+    Ranges holding fewer than min_ids_per_range ids are not worth a range
+    query, their ids are returned separately instead.
+    """
+    ranges: list[tuple[int, int]] = []
+    sparse_ids: set[int] = set()
+    range_ids: list[int] = []
+    for id_ in sorted(ids):
+        if range_ids and id_ - range_ids[0] >= max_range_size:
+            if len(range_ids) < min_ids_per_range:
+                sparse_ids.update(range_ids)
+            else:
+                ranges.append((range_ids[0], range_ids[-1]))
+            range_ids = []
+        range_ids.append(id_)
+    if len(range_ids) < min_ids_per_range:
+        sparse_ids.update(range_ids)
+    else:
+        ranges.append((range_ids[0], range_ids[-1]))
+    return ranges, sparse_ids
+
+
+def _purge_unused_attributes_ids_in_ranges(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> int:
+    """Purge the attributes ids no longer used by any states.
+
+    Instead of checking each id of the batch, the ranges spanned by the
+    batch are checked with an anti-join on the attributes_id index, which
+    also picks up any other orphaned rows in the ranges. Sparse ids which
+    would need a range query each are checked with an IN list.
+
+    Returns the number of purged attributes ids.
+    """
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    ranges, sparse_ids = _id_ranges(
+        attributes_ids, instance.max_bind_vars, MIN_IDS_PER_PURGE_RANGE
+    )
+    unused_attributes_ids = _select_unused_attributes_ids(
+        instance, session, sparse_ids, database_engine
+    )
+    for start_id, end_id in ranges:
+        unused_attributes_ids.update(
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_unused_attributes_ids_in_range(start_id, end_id)
+            )
+        )
+    _LOGGER.debug("Selected %s shared attributes to remove", len(unused_attributes_ids))
+    if unused_attributes_ids:
+        _purge_batch_attributes_ids(instance, session, unused_attributes_ids)
+    return len(unused_attributes_ids)
+
+
+def _purge_unused_data_ids_in_ranges(
+    instance: Recorder, session: Session, data_ids: set[int]
+) -> int:
+    """Purge the event data ids no longer used by any events.
+
+    See _purge_unused_attributes_ids_in_ranges.
+
+    Returns the number of purged data ids.
+    """
+    database_engine = instance.database_engine
+    assert database_engine is not None
+    ranges, sparse_ids = _id_ranges(
+        data_ids, instance.max_bind_vars, MIN_IDS_PER_PURGE_RANGE
+    )
+    unused_data_ids = _select_unused_event_data_ids(
+        instance, session, sparse_ids, database_engine
+    )
+    for start_id, end_id in ranges:
+        unused_data_ids.update(
+            data_id
+            for (data_id,) in session.execute(
+                find_unused_data_ids_in_range(start_id, end_id)
+            )
+        )
+    _LOGGER.debug("Selected %s shared event data to remove", len(unused_data_ids))
+    if unused_data_ids:
+        _purge_batch_data_ids(instance, session, unused_data_ids)
+    return len(unused_data_ids)
 
 
 def _select_unused_attributes_ids(
@@ -5,7 +5,16 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    delete,
+    distinct,
+    exists,
+    func,
+    lambda_stmt,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -615,27 +624,63 @@ def delete_recorder_runs_rows(
 
 
 def find_events_to_purge(
-    purge_before: float, max_bind_vars: int
+    purge_before: float, max_bind_vars: int, start_ts: float = 0
 ) -> StatementLambdaElement:
-    """Find events to purge."""
+    """Find events to purge.
+
+    The events are walked in time_fired_ts order starting at start_ts so
+    the index range scan does not have to skip over the rows deleted by
+    previous batches again.
+    """
     return lambda_stmt(
-        lambda: select(Events.event_id, Events.data_id)
+        lambda: select(Events.event_id, Events.data_id, Events.time_fired_ts)
+        .filter(Events.time_fired_ts >= start_ts)
         .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts)
         .limit(max_bind_vars)
     )
 
 
 def find_states_to_purge(
-    purge_before: float, max_bind_vars: int
+    purge_before: float, max_bind_vars: int, start_ts: float = 0
 ) -> StatementLambdaElement:
-    """Find states to purge."""
+    """Find states to purge.
+
+    The states are walked in last_updated_ts order starting at start_ts so
+    the index range scan does not have to skip over the rows deleted by
+    previous batches again.
+    """
     return lambda_stmt(
-        lambda: select(States.state_id, States.attributes_id)
+        lambda: select(States.state_id, States.attributes_id, States.last_updated_ts)
+        .filter(States.last_updated_ts >= start_ts)
         .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts)
         .limit(max_bind_vars)
     )
 
 
+def find_unused_attributes_ids_in_range(
+    start_id: int, end_id: int
+) -> StatementLambdaElement:
+    """Find attributes ids between start_id and end_id not used by any states."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.attributes_id >= start_id)
+        .filter(StateAttributes.attributes_id <= end_id)
+        .filter(~exists().where(States.attributes_id == StateAttributes.attributes_id))
+    )
+
+
+def find_unused_data_ids_in_range(start_id: int, end_id: int) -> StatementLambdaElement:
+    """Find event data ids between start_id and end_id not used by any events."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.data_id >= start_id)
+        .filter(EventData.data_id <= end_id)
+        .filter(~exists().where(Events.data_id == EventData.data_id))
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
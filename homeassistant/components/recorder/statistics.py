@@ -13,7 +13,21 @@ from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    case,
+    cast as sql_cast,
+    func,
+    insert,
+    lambda_stmt,
+    literal_column,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -149,6 +163,11 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
+
+# The maximum number of periods statistics are reduced to in the database,
+# longer ranges are reduced in Python
+MAX_DB_REDUCED_PERIODS = 100
 
 
 def mean(values: list[float]) -> float | None:
@@ -192,6 +211,118 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _HourlySummary:
+    """Running aggregate of the short term statistics of one metadata_id."""
+
+    mean_total: float = 0.0
+    mean_count: int = 0
+    min: float | None = None
+    max: float | None = None
+    last_start_ts: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Running aggregates of the short term statistics compiled this hour.
+
+    Each compiled 5-minute period is folded into the aggregates so the hourly
+    statistics can be written without reading back the short term statistics
+    of the hour. The aggregates are only trusted when every period of the hour
+    was seen exactly once and the number of rows matches the database.
+    """
+
+    hour_start_ts: float | None = None
+    periods: set[float] = dataclasses.field(default_factory=set)
+    row_count: int = 0
+    invalid: bool = True
+    summaries: dict[int, _HourlySummary] = dataclasses.field(default_factory=dict)
+
+    def reset(self) -> None:
+        """Forget the aggregates of the current hour."""
+        self.hour_start_ts = None
+        self.periods = set()
+        self.row_count = 0
+        self.invalid = True
+        self.summaries = {}
+
+    def add_period(
+        self, start_ts: float, stats: Iterable[tuple[int, StatisticData]]
+    ) -> None:
+        """Fold the short term statistics of a 5-minute period into the hour."""
+        hour_start_ts = start_ts - start_ts % 3600
+        if hour_start_ts != self.hour_start_ts:
+            self.reset()
+            self.hour_start_ts = hour_start_ts
+            # The aggregates can only be complete if we saw the start of the hour
+            self.invalid = start_ts != hour_start_ts
+        if start_ts in self.periods:
+            # The period was compiled again, likely after a failed commit
+            self.invalid = True
+        self.periods.add(start_ts)
+        if self.invalid:
+            return
+
+        summaries = self.summaries
+        for metadata_id, stat in stats:
+            self.row_count += 1
+            if (summary := summaries.get(metadata_id)) is None:
+                summary = summaries[metadata_id] = _HourlySummary()
+            if (_mean := stat.get("mean")) is not None:
+                summary.mean_total += _mean
+                summary.mean_count += 1
+            if (_min := stat.get("min")) is not None and (
+                summary.min is None or _min < summary.min
+            ):
+                summary.min = _min
+            if (_max := stat.get("max")) is not None and (
+                summary.max is None or _max > summary.max
+            ):
+                summary.max = _max
+            if summary.last_start_ts is None or start_ts > summary.last_start_ts:
+                summary.last_start_ts = start_ts
+                summary.last_reset_ts = datetime_to_timestamp_or_none(
+                    stat.get("last_reset")
+                )
+                summary.state = stat.get("state")
+                summary.sum = stat.get("sum")
+
+    def get_summary(
+        self, session: Session, start_time_ts: float
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly statistics or None if the aggregates are incomplete."""
+        if (
+            self.invalid
+            or self.hour_start_ts != start_time_ts
+            or len(self.periods) != Statistics.duration // StatisticsShortTerm.duration
+        ):
+            return None
+        end_time_ts = start_time_ts + Statistics.duration.total_seconds()
+        row_count = execute_stmt_lambda_element(
+            session,
+            _compile_hourly_statistics_row_count_stmt(start_time_ts, end_time_ts),
+        )[0][0]
+        if row_count != self.row_count:
+            return None
+        return {
+            metadata_id: {
+                "start_ts": start_time_ts,
+                "mean": summary.mean_total / summary.mean_count
+                if summary.mean_count
+                else None,
+                "min": summary.min,
+                "max": summary.max,
+                "last_reset_ts": summary.last_reset_ts,
+                "state": summary.state,
+                "sum": summary.sum,
+            }
+            for metadata_id, summary in self.summaries.items()
+        }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -388,18 +519,43 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics_row_count_stmt(
+    start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Generate the statement counting the short term statistics of an hour."""
+    return lambda_stmt(
+        lambda: select(func.count(StatisticsShortTerm.id))
+        .filter(StatisticsShortTerm.start_ts >= start_time_ts)
+        .filter(StatisticsShortTerm.start_ts < end_time_ts)
+    )
+
+
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    accumulator: HourlyStatisticsAccumulator | None = None,
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If the accumulator holds complete aggregates for the hour, they are used
+    instead of querying the 5-minute statistics.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
 
+    if (
+        accumulator is not None
+        and (accumulated := accumulator.get_summary(session, start_time_ts)) is not None
+    ):
+        _bulk_insert_statistics_ts(session, Statistics, accumulated)
+        return
+
     # Compute last hour's average, min, max
     summary: dict[int, StatisticDataTimestamp] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
@@ -439,10 +595,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                 }
 
     # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    _bulk_insert_statistics_ts(session, Statistics, summary)
 
 
 @retryable_database_job("compile missing statistics")
@@ -569,8 +722,7 @@ def _compile_statistics(
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
-    new_short_term_stats: list[StatisticsBase] = []
-    updated_metadata_ids: set[int] = set()
+    new_short_term_stats: list[tuple[int, StatisticData]] = []
     # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
@@ -578,18 +730,17 @@ def _compile_statistics(
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
-        updated_metadata_ids.add(metadata_id)
-        if new_stat := _insert_statistics(
-            session,
-            StatisticsShortTerm,
-            metadata_id,
-            stats["stat"],
-        ):
-            new_short_term_stats.append(new_stat)
+        new_short_term_stats.append((metadata_id, stats["stat"]))
+
+    inserted_short_term_stats = _bulk_insert_statistics(
+        session, StatisticsShortTerm, new_short_term_stats
+    )
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    accumulator.add_period(start.timestamp(), inserted_short_term_stats)
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -598,26 +749,35 @@ def _compile_statistics(
         if start.minute == 55:
             instance.hass.bus.fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
 
-    if updated_metadata_ids:
+    if inserted_short_term_stats:
         # These are always the newest statistics, so we can update
         # the run cache without having to check the start_ts.
-        session.flush()  # populate the ids of the new StatisticsShortTerm rows
         run_cache = get_short_term_statistics_run_cache(instance.hass)
         # metadata_id is typed to allow None, but we know it's not None here
         # so we can safely cast it to int.
         run_cache.set_latest_ids_for_metadata_ids(
             cast(
                 dict[int, int],
-                {
-                    new_stat.metadata_id: new_stat.id
-                    for new_stat in new_short_term_stats
-                },
+                dict(
+                    execute_stmt_lambda_element(
+                        session, _get_short_term_ids_at_start_stmt(start.timestamp())
+                    )
+                ),
             )
         )
 
     return modified_statistic_ids
 
 
+def _get_short_term_ids_at_start_stmt(start_ts: float) -> StatementLambdaElement:
+    """Return a statement that returns metadata_id, id of short term rows at start."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.metadata_id, StatisticsShortTerm.id).filter(
+            StatisticsShortTerm.start_ts == start_ts
+        )
+    )
+
+
 def _adjust_sum_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -663,6 +823,88 @@ def _insert_statistics(
     return stat
 
 
+def _bulk_insert_statistics(
+    session: Session,
+    table: type[StatisticsBase],
+    statistics: Iterable[tuple[int, StatisticData]],
+) -> list[tuple[int, StatisticData]]:
+    """Insert statistics in the database with a single executemany statement.
+
+    The rows are validated first so a single bad row does not fail the
+    statement: rows which cannot be built and rows which collide with the
+    batch or with rows already in the database are logged and skipped.
+    Returns the statistics which were inserted.
+    """
+    rows: list[dict[str, Any]] = []
+    inserted: list[tuple[int, StatisticData]] = []
+    keys: set[tuple[int, float]] = set()
+    for metadata_id, statistic in statistics:
+        try:
+            row = table.row_from_stats(metadata_id, statistic)
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.exception(
+                "Unexpected exception when inserting statistics %s:%s ",
+                metadata_id,
+                statistic,
+            )
+            continue
+        if (key := (metadata_id, row["start_ts"])) in keys:
+            _LOGGER.warning(
+                "Skipping duplicate statistics %s:%s", metadata_id, statistic
+            )
+            continue
+        keys.add(key)
+        rows.append(row)
+        inserted.append((metadata_id, statistic))
+    if not rows:
+        return inserted
+
+    existing = {
+        (row.metadata_id, row.start_ts)
+        for row in session.execute(
+            select(table.metadata_id, table.start_ts).where(
+                table.metadata_id.in_({metadata_id for metadata_id, _ in keys}),
+                table.start_ts.in_({start_ts for _, start_ts in keys}),
+            )
+        )
+    }
+    if existing:
+        new_rows: list[dict[str, Any]] = []
+        new_inserted: list[tuple[int, StatisticData]] = []
+        for row, (metadata_id, statistic) in zip(rows, inserted, strict=True):
+            if (metadata_id, row["start_ts"]) in existing:
+                _LOGGER.warning(
+                    "Skipping statistics which already exist %s:%s",
+                    metadata_id,
+                    statistic,
+                )
+                continue
+            new_rows.append(row)
+            new_inserted.append((metadata_id, statistic))
+        rows, inserted = new_rows, new_inserted
+        if not rows:
+            return inserted
+
+    session.execute(insert(table), rows)
+    return inserted
+
+
+def _bulk_insert_statistics_ts(
+    session: Session,
+    table: type[StatisticsBase],
+    statistics: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Insert statistics with timestamps with a single executemany statement."""
+    if statistics:
+        session.execute(
+            insert(table),
+            [
+                table.row_from_stats_ts(metadata_id, statistic)
+                for metadata_id, statistic in statistics.items()
+            ],
+        )
+
+
 def _update_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -734,6 +976,7 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    get_hourly_statistics_accumulator(instance.hass).reset()
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -1125,6 +1368,182 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _period_start_end_ts_factory(
+    period: Literal["day", "week", "month"],
+) -> Callable[[float], tuple[float, float]]:
+    """Return a function which returns the start and end of the period of a time."""
+    if period == "day":
+        return reduce_day_ts_factory()[1]
+    if period == "week":
+        return reduce_week_ts_factory()[1]
+    return reduce_month_ts_factory()[1]
+
+
+def _period_start_ts_expression(
+    start_ts: ColumnElement, periods: list[tuple[float, float]]
+) -> ColumnElement:
+    """Return an expression for the start of the period a start_ts falls in.
+
+    The period bounds are whole seconds generated by us, so they
+    can be inlined to avoid running out of bind variables.
+    """
+    origin = int(periods[0][0])
+    length = int(periods[0][1]) - origin
+    if all(int(end) - int(start) == length for start, end in periods):
+        # Days and weeks without DST transitions have a fixed length, the
+        # period is found with an integer division. start_ts is a whole
+        # number of seconds, so it can safely be cast to an integer.
+        origin_ts = literal_column(str(origin), BigInteger)
+        length_ts = literal_column(str(length), BigInteger)
+        return (
+            sql_cast(start_ts, BigInteger) - origin_ts
+        ) // length_ts * length_ts + origin_ts
+    # Otherwise the period is found with a binary search
+    # which takes log2(len(periods)) comparisons per row
+    return _period_start_ts_search(start_ts, periods)
+
+
+def _period_start_ts_search(
+    start_ts: ColumnElement, periods: list[tuple[float, float]]
+) -> ColumnElement:
+    """Return a nested CASE expression which bisects the periods."""
+    if len(periods) == 1:
+        return literal_column(str(int(periods[0][0])))
+    middle = len(periods) // 2
+    return case(
+        (
+            start_ts < literal_column(str(int(periods[middle][0]))),
+            _period_start_ts_search(start_ts, periods[:middle]),
+        ),
+        else_=_period_start_ts_search(start_ts, periods[middle:]),
+    )
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+    periods: list[tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query for statistics reduced to the given periods.
+
+    The periods are calculated in the configured time zone and passed to the
+    database as an expression which maps a start_ts to the start of its period,
+    which works the same for all dialects and unlike their date functions also
+    handles DST transitions. The max, mean and min are aggregated per period,
+    the last_reset, state and sum are taken from the last row in the period.
+
+    This is not a lambda_stmt since the structure of the period expression
+    depends on the periods.
+    """
+    table = Statistics
+    period_start_ts = _period_start_ts_expression(table.start_ts, periods)
+    reduced = select(
+        table.metadata_id.label("metadata_id"),
+        period_start_ts.label("period_start_ts"),
+        func.max(table.start_ts).label("last_start_ts"),
+    )
+    if "mean" in types:
+        reduced = reduced.add_columns(func.avg(table.mean).label("mean"))
+    if "min" in types:
+        reduced = reduced.add_columns(func.min(table.min).label("min"))
+    if "max" in types:
+        reduced = reduced.add_columns(func.max(table.max).label("max"))
+    reduced = reduced.filter(table.start_ts >= start_time_ts).filter(
+        table.start_ts < end_time_ts
+    )
+    if metadata_ids:
+        reduced = reduced.filter(table.metadata_id.in_(metadata_ids))
+    subquery = reduced.group_by(table.metadata_id, period_start_ts).subquery()
+
+    stmt = select(subquery.c.metadata_id, subquery.c.period_start_ts.label("start_ts"))
+    for key in ("mean", "min", "max"):
+        if key in types:
+            stmt = stmt.add_columns(subquery.c[key])
+    if last_row_columns := [
+        getattr(table, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]:
+        stmt = stmt.add_columns(*last_row_columns).join(
+            table,
+            and_(
+                table.metadata_id == subquery.c.metadata_id,
+                table.start_ts == subquery.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(subquery.c.metadata_id, subquery.c.period_start_ts)
+
+
+def _reduce_statistics_in_db(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["day", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return hourly statistics reduced to days, weeks or months by the database.
+
+    This avoids loading all hourly rows only to reduce them in Python.
+    start_time and end_time must be aligned with the period. Returns None
+    if the range spans too many periods, in which case the statistics
+    should be reduced in Python.
+    """
+    start_time_ts = start_time.timestamp()
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+    else:
+        # Find out how far the open ended range extends
+        last_start_stmt = select(func.max(Statistics.start_ts)).filter(
+            Statistics.start_ts >= start_time_ts
+        )
+        if metadata_ids:
+            last_start_stmt = last_start_stmt.filter(
+                Statistics.metadata_id.in_(metadata_ids)
+            )
+        if (last_start_ts := session.execute(last_start_stmt).scalar()) is None:
+            return {}
+        end_time_ts = last_start_ts + 1
+
+    period_start_end = _period_start_end_ts_factory(period)
+    periods: list[tuple[float, float]] = []
+    period_end_ts = start_time_ts
+    while period_end_ts < end_time_ts:
+        if len(periods) == MAX_DB_REDUCED_PERIODS:
+            return None
+        periods.append(period_start_end(period_end_ts))
+        period_end_ts = periods[-1][1]
+    if not periods:
+        return {}
+
+    stats = session.execute(
+        _generate_reduced_statistics_during_period_stmt(
+            start_time_ts, end_time_ts, metadata_ids, periods, types
+        )
+    ).all()
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass, stats, statistic_ids, metadata, True, Statistics, units, types
+    )
+    # The rows are built for hourly statistics, set the start
+    # and end of the periods
+    period_end_by_start = {int(start): end for start, end in periods}
+    for rows in result.values():
+        for row in rows:
+            start = row["start"]
+            row["start"] = float(start)
+            row["end"] = period_end_by_start[int(start)]
+    return result
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1757,35 +2176,55 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    reduced_result: dict[str, list[StatisticsRow]] | None = None
+    if period not in {"5minute", "hour"}:
+        reduced_result = _reduce_statistics_in_db(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            units,
+            types,
+        )
 
-    if not stats:
-        return {}
+    if reduced_result is not None:
+        if not reduced_result:
+            return {}
+        result = reduced_result
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        if not stats:
+            return {}
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
+
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2382,6 +2821,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the hourly statistics accumulator."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2475,6 +2922,8 @@ def adjust_statistics(
         ):
             sum_adjustment = convert(sum_adjustment)
 
+        get_hourly_statistics_accumulator(instance.hass).reset()
+
         _adjust_sum_statistics(
             session,
             StatisticsShortTerm,
@@ -2548,6 +2997,7 @@ def change_statistics_unit(
             )
             return
 
+        get_hourly_statistics_accumulator(instance.hass).reset()
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
@@ -33,9 +33,14 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        # The shared_datas of the events passed to load which
+        # were not processed yet, so they are only serialized once
+        self._serialized: dict[Event, bytes | None] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
+        if self._serialized and event in self._serialized:
+            return self._serialized.pop(event)
         try:
             return EventData.shared_data_bytes_from_event(
                 event, self.recorder.dialect_name
@@ -47,13 +52,26 @@ class EventDataManager(BaseLRUTableManager[EventData]):
     def load(self, events: list[Event], session: Session) -> None:
         """Load the shared_datas to data_ids mapping into memory from events.
 
+        The shared_datas which are already cached or pending are skipped.
+        The serialized shared_datas are kept until the events are processed.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        id_map = self._id_map
+        pending = self._pending
+        self._serialized = {}
+        # Events without data are not linked to the EventData table
+        serialized = {
+            event: self.serialize_from_event(event) for event in events if event.data
+        }
+        self._serialized = serialized
         if hashes := {
             EventData.hash_shared_data_bytes(shared_event_bytes)
-            for event in events
-            if (shared_event_bytes := self.serialize_from_event(event))
+            for shared_event_bytes in serialized.values()
+            if shared_event_bytes
+            and (shared_data := shared_event_bytes.decode("utf-8")) not in id_map
+            and shared_data not in pending
         }:
             self._load_from_hashes(hashes, session)
 
@@ -38,9 +38,14 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        # The shared_attrs of the events passed to load which
+        # were not processed yet, so they are only serialized once
+        self._serialized: dict[Event[EventStateChangedData], bytes | None] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        if self._serialized and event in self._serialized:
+            return self._serialized.pop(event)
         try:
             return StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
@@ -58,13 +63,23 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     ) -> None:
         """Load the shared_attrs to attributes_ids mapping into memory from events.
 
+        The shared_attrs which are already cached or pending are skipped.
+        The serialized shared_attrs are kept until the events are processed.
+
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        id_map = self._id_map
+        pending = self._pending
+        self._serialized = {}
+        serialized = {event: self.serialize_from_event(event) for event in events}
+        self._serialized = serialized
         if hashes := {
             StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
-            for event in events
-            if (shared_attrs_bytes := self.serialize_from_event(event))
+            for shared_attrs_bytes in serialized.values()
+            if shared_attrs_bytes
+            and (shared_attrs := shared_attrs_bytes.decode("utf-8")) not in id_map
+            and shared_attrs not in pending
         }:
             self._load_from_hashes(hashes, session)
 
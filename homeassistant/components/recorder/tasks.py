@@ -108,11 +108,18 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    progress: purge.PurgeProgress | None = None
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        progress = self.progress or purge.PurgeProgress(self.purge_before)
+        instance.purge_progress = progress
         if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            progress=progress,
         ):
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
@@ -123,7 +130,7 @@ class PurgeTask(RecorderTask):
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(self.purge_before, self.repack, self.apply_filter, progress)
         )
 
 
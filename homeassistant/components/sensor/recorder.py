@@ -8,6 +8,7 @@ import datetime
 import itertools
 import logging
 import math
+from operator import mul, sub
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -36,6 +37,7 @@ from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.json import json_loads_object
 
 from .const import (
     ATTR_LAST_RESET,
@@ -140,6 +142,64 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+def _time_weighted_average_of_columns(
+    timestamps: list[float], fstates: list[float], start_ts: float, end_ts: float
+) -> float:
+    """Calculate a time weighted average from timestamps and float states.
+
+    This is equivalent to _time_weighted_average, but operates on columns
+    so it does not need State objects.
+    """
+    start_times = [start_ts if ts < start_ts else ts for ts in timestamps]
+    period_seconds = end_ts - start_times[0]
+    if period_seconds == 0:
+        # See _time_weighted_average
+        return 0.0
+    start_times.append(end_ts)
+    durations = map(sub, itertools.islice(start_times, 1, None), start_times)
+    return sum(map(mul, fstates, durations)) / period_seconds
+
+
+def _measurement_columns_to_float(
+    columns: tuple[list[float], list[str | None], list[str | None]],
+) -> tuple[str | None, list[float], list[float]] | None:
+    """Return the unit, timestamps and float states from history columns.
+
+    Returns None if the unit is not the same for all valid states, in which
+    case the states must be normalized with _normalize_states.
+    """
+    timestamps, states, attributes = columns
+    valid_timestamps: list[float] = []
+    float_states: list[float] = []
+    valid_attributes: set[str | None] = set()
+    isfinite = math.isfinite
+    for timestamp, state, shared_attrs in zip(
+        timestamps, states, attributes, strict=True
+    ):
+        try:
+            float_state = float(state)  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            continue
+        if isfinite(float_state):
+            valid_timestamps.append(timestamp)
+            float_states.append(float_state)
+            valid_attributes.add(shared_attrs)
+    if not float_states:
+        return None, [], []
+    try:
+        units = {
+            json_loads_object(shared_attrs).get(ATTR_UNIT_OF_MEASUREMENT)
+            if shared_attrs
+            else None
+            for shared_attrs in valid_attributes
+        }
+    except ValueError:
+        return None
+    if len(units) != 1:
+        return None
+    return units.pop(), valid_timestamps, float_states  # type: ignore[return-value]
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -418,6 +478,31 @@ def compile_statistics(  # noqa: C901
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    # Entities which only need mean, min and max are first fetched as columns,
+    # only those with a changing unit or undecodable attributes fall back to
+    # State objects.
+    measurement_columns: dict[str, tuple[str | None, list[float], list[float]]] = {}
+    if (
+        entities_significant_history
+        and (
+            history_columns := history.get_significant_states_columns_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
+        )
+        is not None
+    ):
+        for entity_id, columns in history_columns.items():
+            if (float_columns := _measurement_columns_to_float(columns)) is not None:
+                measurement_columns[entity_id] = float_columns
+        entities_significant_history = [
+            entity_id
+            for entity_id in history_columns
+            if entity_id not in measurement_columns
+        ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
@@ -431,6 +516,8 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in measurement_columns:
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -444,12 +531,67 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids={
+            *entities_with_float_states,
+            *(
+                entity_id
+                for entity_id, (_, _, fstates) in measurement_columns.items()
+                if fstates
+            ),
+        },
     )
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
+    # Mean, min and max of entities computed from columns
+    measurement_stats: dict[str, tuple[float, float, float]] = {}
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    for entity_id, (unit, timestamps, fstates) in measurement_columns.items():
+        if not fstates:
+            continue
+        if (old_metadata := old_metadatas.get(entity_id)) and old_metadata[1][
+            "unit_of_measurement"
+        ] != unit:
+            # The unit needs to be converted, let _normalize_states handle it
+            entities_significant_history.append(entity_id)
+            continue
+        measurement_stats[entity_id] = (
+            _time_weighted_average_of_columns(timestamps, fstates, start_ts, end_ts),
+            min(fstates),
+            max(fstates),
+        )
+    if entities_with_converted_unit := [
+        entity_id
+        for entity_id in entities_significant_history
+        if entity_id in measurement_columns
+    ]:
+        entities_with_float_states.update(
+            (entity_id, float_states)
+            for entity_id, entity_history in (
+                history.get_full_significant_states_with_session(
+                    hass,
+                    session,
+                    start - datetime.timedelta.resolution,
+                    end,
+                    entity_ids=entities_with_converted_unit,
+                ).items()
+            )
+            if (float_states := _entity_history_to_float_and_state(entity_history))
+        )
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if entity_id in measurement_stats:
+            to_process.append(
+                (
+                    entity_id,
+                    measurement_columns[entity_id][0],
+                    _state.attributes[ATTR_STATE_CLASS],
+                    [],
+                )
+            )
+            continue
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
         statistics_unit, valid_float_states = _normalize_states(
@@ -511,6 +653,11 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if (measurement := measurement_stats.get(entity_id)) is not None:
+            stat["mean"], stat["min"], stat["max"] = measurement
+            result.append({"meta": meta, "stat": stat})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(
                 *itertools.islice(zip(*valid_float_states, strict=False), 1)
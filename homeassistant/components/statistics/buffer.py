@@ -0,0 +1,236 @@
+"""Sample buffer with incrementally maintained aggregates for statistics."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+# Evicting a sample whose squared deviation from the mean is this many times
+# the remaining sum of squared deviations cancels too many digits of the
+# running aggregates, so they are recomputed from the buffer instead
+RECOMPUTE_DEVIATION_RATIO = 1e6
+
+
+class SampleBuffer:
+    """Bounded buffer of samples with running aggregates.
+
+    Every aggregate is updated when a sample is added or evicted so that the
+    characteristics of the statistics sensor can be read in constant (or
+    logarithmic) time instead of iterating the whole buffer on each update.
+
+    Subtracting an evicted sample from the running sums loses precision, so
+    the floating point aggregates are recomputed from the buffer once per
+    buffer length of evictions and whenever an evicted sample dominates them.
+    """
+
+    def __init__(self, maxlen: int | None, keep_sorted: bool = False) -> None:
+        """Initialize the buffer."""
+        self.maxlen = maxlen
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._keep_sorted = keep_sorted
+        self._sorted: list[float] = []
+        # Sequence number of the next sample, used by the min/max queues
+        self._seq = 0
+        # Monotonic queues of (sequence, value, age) for sliding min/max
+        self._max_queue: deque[tuple[int, float, datetime]] = deque()
+        self._min_queue: deque[tuple[int, float, datetime]] = deque()
+        self._evictions = 0
+        self._reset_aggregates()
+
+    def _reset_aggregates(self) -> None:
+        """Reset all running aggregates."""
+        self.sum: float = 0.0
+        self.count_true: int = 0
+        self.sin_sum: float = 0.0
+        self.cos_sum: float = 0.0
+        self.area_linear: float = 0.0
+        self.area_step: float = 0.0
+        self.sum_differences: float = 0.0
+        self.sum_differences_nonnegative: float = 0.0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
+    def _recompute_aggregates(self) -> None:
+        """Recompute the running aggregates from the samples in the buffer."""
+        self._reset_aggregates()
+        self._evictions = 0
+        states = self.states
+        ages = self.ages
+        count = len(states)
+        self.sum = math.fsum(states)
+        self.count_true = sum(value is True for value in states)
+        self.sin_sum = math.fsum(math.sin(math.radians(value)) for value in states)
+        self.cos_sum = math.fsum(math.cos(math.radians(value)) for value in states)
+        self._mean = self.sum / count
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in states)
+        area_linear: list[float] = []
+        area_step: list[float] = []
+        differences: list[float] = []
+        differences_nonnegative: list[float] = []
+        for idx in range(1, count):
+            prev_value = states[idx - 1]
+            value = states[idx]
+            seconds = (ages[idx] - ages[idx - 1]).total_seconds()
+            area_linear.append(0.5 * (value + prev_value) * seconds)
+            area_step.append(prev_value * seconds)
+            differences.append(abs(value - prev_value))
+            differences_nonnegative.append(
+                value - prev_value if value >= prev_value else value
+            )
+        self.area_linear = math.fsum(area_linear)
+        self.area_step = math.fsum(area_step)
+        self.sum_differences = math.fsum(differences)
+        self.sum_differences_nonnegative = math.fsum(differences_nonnegative)
+
+    def __len__(self) -> int:
+        """Return the number of samples in the buffer."""
+        return len(self.states)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, evicting the oldest one if the buffer is full.
+
+        Raises ValueError for NaN and infinite values, which would poison the
+        running sums and cannot be located in the sorted samples.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Sample is not a finite number: {value}")
+        if self.maxlen is not None and len(self.states) >= self.maxlen:
+            self.popleft()
+
+        if self.states:
+            prev_value = self.states[-1]
+            prev_age = self.ages[-1]
+            seconds = (age - prev_age).total_seconds()
+            self.area_linear += 0.5 * (value + prev_value) * seconds
+            self.area_step += prev_value * seconds
+            self.sum_differences += abs(value - prev_value)
+            self.sum_differences_nonnegative += (
+                value - prev_value if value >= prev_value else value
+            )
+
+        self.states.append(value)
+        self.ages.append(age)
+        self.sum += value
+        self.count_true += value is True
+        radians = math.radians(value)
+        self.sin_sum += math.sin(radians)
+        self.cos_sum += math.cos(radians)
+
+        # Welford's online algorithm
+        delta = value - self._mean
+        self._mean += delta / len(self.states)
+        self._m2 += delta * (value - self._mean)
+
+        seq = self._seq
+        self._seq += 1
+        max_queue = self._max_queue
+        while max_queue and max_queue[-1][1] < value:
+            max_queue.pop()
+        max_queue.append((seq, value, age))
+        min_queue = self._min_queue
+        while min_queue and min_queue[-1][1] > value:
+            min_queue.pop()
+        min_queue.append((seq, value, age))
+
+        if self._keep_sorted:
+            insort(self._sorted, value)
+
+    def popleft(self) -> None:
+        """Evict the oldest sample."""
+        oldest_seq = self._seq - len(self.states)
+        value = self.states.popleft()
+        age = self.ages.popleft()
+
+        if self._max_queue[0][0] == oldest_seq:
+            self._max_queue.popleft()
+        if self._min_queue[0][0] == oldest_seq:
+            self._min_queue.popleft()
+        if self._keep_sorted:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+        if not self.states:
+            # Start over from exact zeros to avoid carrying rounding errors
+            self._reset_aggregates()
+            return
+
+        next_value = self.states[0]
+        seconds = (self.ages[0] - age).total_seconds()
+        self.area_linear -= 0.5 * (next_value + value) * seconds
+        self.area_step -= value * seconds
+        self.sum_differences -= abs(next_value - value)
+        self.sum_differences_nonnegative -= (
+            next_value - value if next_value >= value else next_value
+        )
+
+        self.sum -= value
+        self.count_true -= value is True
+        radians = math.radians(value)
+        self.sin_sum -= math.sin(radians)
+        self.cos_sum -= math.cos(radians)
+
+        # Reverse step of Welford's online algorithm
+        count = len(self.states)
+        mean = self._mean
+        self._mean = mean - (value - mean) / count
+        deviation = (value - self._mean) * (value - mean)
+        self._m2 -= deviation
+        if count == 1:
+            self._m2 = 0.0
+
+        self._evictions += 1
+        if self._evictions >= count or deviation > RECOMPUTE_DEVIATION_RATIO * self._m2:
+            self._recompute_aggregates()
+
+    @property
+    def age_range_seconds(self) -> float:
+        """Return the seconds between the oldest and the newest sample."""
+        return (self.ages[-1] - self.ages[0]).total_seconds()
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    @property
+    def value_max(self) -> float:
+        """Return the maximum value, requires at least one sample."""
+        return self._max_queue[0][1]
+
+    @property
+    def value_min(self) -> float:
+        """Return the minimum value, requires at least one sample."""
+        return self._min_queue[0][1]
+
+    @property
+    def datetime_value_max(self) -> datetime:
+        """Return the age of the oldest sample holding the maximum value."""
+        return self._max_queue[0][2]
+
+    @property
+    def datetime_value_min(self) -> datetime:
+        """Return the age of the oldest sample holding the minimum value."""
+        return self._min_queue[0][2]
+
+    def median(self) -> float:
+        """Return the median, requires a sorted buffer with at least one sample."""
+        data = self._sorted
+        size = len(data)
+        middle = size // 2
+        if size % 2 == 1:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile, requires a sorted buffer with at least two samples.
+
+        Matches statistics.quantiles(data, n=100, method="exclusive").
+        """
+        data = self._sorted
+        size = len(data)
+        scaled = percentile * (size + 1)
+        index = min(max(scaled // 100, 1), size - 1)
+        delta = scaled - index * 100
+        return (data[index - 1] * (100 - delta) + data[index] * delta) / 100
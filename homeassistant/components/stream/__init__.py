@@ -39,6 +39,7 @@ from homeassistant.setup import SetupPhases, async_pause_setup
 from homeassistant.util.async_ import create_eager_task
 
 from .const import (
+    ATTR_DECODE_POOL,
     ATTR_ENDPOINTS,
     ATTR_SETTINGS,
     ATTR_STREAMS,
@@ -51,6 +52,7 @@ from .const import (
     DOMAIN,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
+    MAX_DECODE_WORKERS,
     MAX_SEGMENTS,
     OUTPUT_FORMATS,
     OUTPUT_IDLE_TIMEOUT,
@@ -66,6 +68,7 @@ from .core import (
     STREAM_SETTINGS_NON_LL_HLS,
     IdleTimer,
     KeyFrameConverter,
+    KeyFrameDecodePool,
     Orientation,
     StreamOutput,
     StreamSettings,
@@ -232,6 +235,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
+    hass.data[DOMAIN][ATTR_DECODE_POOL] = decode_pool = KeyFrameDecodePool(
+        MAX_DECODE_WORKERS
+    )
     conf = DOMAIN_SCHEMA(config.get(DOMAIN, {}))
     if conf[CONF_LL_HLS]:
         assert isinstance(conf[CONF_SEGMENT_DURATION], float)
@@ -264,6 +270,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ]:
             await asyncio.wait(awaitables)
         _LOGGER.debug("Stopped stream workers")
+        decode_pool.shutdown()
         cancel_logging_listener()
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, shutdown)
@@ -296,8 +303,12 @@ class Stream:
         self._thread_quit = threading.Event()
         self._outputs: dict[str, StreamOutput] = {}
         self._fast_restart_once = False
+        self._diagnostics = Diagnostics()
         self._keyframe_converter = KeyFrameConverter(
-            hass, stream_settings, dynamic_stream_settings
+            hass,
+            stream_settings,
+            dynamic_stream_settings,
+            self._diagnostics.metrics,
         )
         self._available: bool = True
         self._update_callback: Callable[[], None] | None = None
@@ -306,7 +317,6 @@ class Stream:
             if stream_label
             else _LOGGER
         )
-        self._diagnostics = Diagnostics()
 
     def endpoint_url(self, fmt: str) -> str:
         """Start the stream and returns a url for the output format."""
@@ -572,6 +582,16 @@ class Stream:
         """Return diagnostics information for the stream."""
         return self._diagnostics.as_dict()
 
+    def get_metrics(self) -> dict[str, Any]:
+        """Return performance metrics of the stream and the shared decode pool.
+
+        The packet rate is measured over the last keyframes of the stream.
+        """
+        return {
+            **self._diagnostics.metrics.as_dict(),
+            "decode_pool": self.hass.data[DOMAIN][ATTR_DECODE_POOL].as_dict(),
+        }
+
 
 def _should_retry() -> bool:
     """Return true if worker failures should be retried, for disabling during tests."""
@@ -2,6 +2,7 @@
 
 DOMAIN = "stream"
 
+ATTR_DECODE_POOL = "decode_pool"
 ATTR_ENDPOINTS = "endpoints"
 ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
@@ -37,6 +38,13 @@ MAX_TIMESTAMP_GAP = 30  # seconds - anything from 10 to 50000 is probably reason
 MAX_MISSING_DTS = 6  # Number of packets missing DTS to allow
 SOURCE_TIMEOUT = 30  # Timeout for reading stream source
 
+# Threads shared by all streams to decode keyframes into images, each decode
+# blocks a thread for the duration of one frame so a few are enough for many
+# cameras and bursts of requests are queued instead of spread over the executor
+MAX_DECODE_WORKERS = 2
+
+PACKET_RATE_SAMPLES = 10  # Number of keyframes the packet rate is measured over
+
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
 
@@ -5,10 +5,12 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 import datetime
 from enum import IntEnum
 import logging
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
@@ -17,14 +19,17 @@ import numpy as np
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.decorator import Registry
 
 from .const import (
+    ATTR_DECODE_POOL,
     ATTR_STREAMS,
     DOMAIN,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
+from .diagnostics import StreamMetrics
 
 if TYPE_CHECKING:
     from av import CodecContext, Packet
@@ -77,8 +82,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view into the segment data once it is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +107,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # Data of all parts, stored once the segment is complete
+    _data: bytes | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -135,11 +142,33 @@ class Segment:
         """
         self.parts.append(part)
         self.duration = duration
+        if self.complete:
+            self.async_join_parts()
         for output in self._stream_outputs:
             output.part_put()
 
+    @callback
+    def async_join_parts(self) -> None:
+        """Store the data of all parts in a single buffer.
+
+        The data of each part is replaced with a view into the buffer, so
+        the data is only held once and every viewer of the segment or one
+        of its parts is served from the same buffer without a copy.
+        """
+        if self._data is not None:
+            return
+        data = self._data = b"".join([part.data for part in self.parts])
+        view = memoryview(data)
+        offset = 0
+        for part in self.parts:
+            size = len(part.data)
+            part.data = view[offset : offset + size]
+            offset += size
+
     def get_data(self) -> bytes:
         """Return reconstructed data for all parts as bytes, without init."""
+        if self._data is not None:
+            return self._data
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
@@ -416,6 +445,45 @@ TRANSFORM_IMAGE_FUNCTION = (
 )
 
 
+class KeyFrameDecodePool:
+    """A bounded pool of threads that decode keyframes for all streams."""
+
+    def __init__(self, max_workers: int) -> None:
+        """Initialize the pool."""
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="StreamDecode"
+        )
+        # Number of decode jobs submitted and not finished yet
+        self._pending = 0
+
+    async def async_run(
+        self, hass: HomeAssistant, target: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a decode job in the pool."""
+        self._pending += 1
+        try:
+            return await hass.loop.run_in_executor(self._executor, target, *args)
+        finally:
+            self._pending -= 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the saturation of the pool.
+
+        A saturation above 1 means decode jobs are queued.
+        """
+        return {
+            "max_workers": self.max_workers,
+            "active": min(self._pending, self.max_workers),
+            "queued": max(self._pending - self.max_workers, 0),
+            "saturation": round(self._pending / self.max_workers, 2),
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the pool without waiting for running jobs."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class KeyFrameConverter:
     """Enables generating and getting an image from the last keyframe seen in the stream.
 
@@ -427,6 +495,9 @@ class KeyFrameConverter:
         _generate_image will clear the packet, so there will only be one attempt per packet
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The images are generated in the decode pool shared by all streams and
+    concurrent requests for an image of the same size share one decode.
     """
 
     def __init__(
@@ -434,6 +505,7 @@ class KeyFrameConverter:
         hass: HomeAssistant,
         stream_settings: StreamSettings,
         dynamic_stream_settings: DynamicStreamSettings,
+        metrics: StreamMetrics | None = None,
     ) -> None:
         """Initialize."""
 
@@ -451,6 +523,8 @@ class KeyFrameConverter:
         self._codec_context: CodecContext | None = None
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
+        self._metrics = metrics or StreamMetrics()
+        self._image_tasks: dict[tuple[int | None, int | None], asyncio.Task] = {}
 
     def stash_keyframe_packet(self, packet: Packet) -> None:
         """Store the keyframe and set the asyncio.Event from the event loop.
@@ -496,6 +570,22 @@ class KeyFrameConverter:
             return
         packet = self._packet
         self._packet = None
+        start = perf_counter()
+        try:
+            self._decode_packet(packet, width, height)
+        finally:
+            elapsed = perf_counter() - start
+            metrics = self._metrics
+            metrics.decodes += 1
+            metrics.decode_time += elapsed
+            metrics.max_decode_time = max(metrics.max_decode_time, elapsed)
+
+    def _decode_packet(
+        self, packet: Packet, width: int | None, height: int | None
+    ) -> None:
+        """Decode the packet and encode it as the keyframe image."""
+        if TYPE_CHECKING:
+            assert self._codec_context
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
@@ -533,10 +623,27 @@ class KeyFrameConverter:
     ) -> bytes | None:
         """Fetch an image from the Stream and return it as a jpeg in bytes."""
 
-        # Use a lock to ensure only one thread is working on the keyframe at a time
         if wait_for_next_keyframe:
             self._event.clear()
             await self._event.wait()
+            return await self._async_generate_image(width, height)
+        # Requests that arrive while an image of the same size is generated,
+        # e.g. when several dashboards open at once, share its result
+        key = (width, height)
+        if (task := self._image_tasks.get(key)) is None:
+            task = create_eager_task(self._async_generate_image(width, height))
+            if not task.done():
+                self._image_tasks[key] = task
+                task.add_done_callback(lambda _: self._image_tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_generate_image(
+        self, width: int | None, height: int | None
+    ) -> bytes | None:
+        """Generate an image in the decode pool and return the latest image."""
+        # Use a lock to ensure only one thread is working on the keyframe at a time
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            await self._hass.data[DOMAIN][ATTR_DECODE_POOL].async_run(
+                self._hass, self._generate_image, width, height
+            )
         return self._image
@@ -6,9 +6,58 @@ information is managed by dependent components (e.g. camera)
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import partial
+import time
 from typing import Any
 
+from .const import PACKET_RATE_SAMPLES
+
+
+@dataclass(slots=True)
+class StreamMetrics:
+    """Performance counters of a stream.
+
+    The counters are updated from the worker and decode threads without
+    locking and read from the event loop. The packet count is sampled on
+    each keyframe and the packet rate is measured since the oldest sample.
+    """
+
+    packets: int = 0
+    decodes: int = 0
+    decode_time: float = 0.0
+    max_decode_time: float = 0.0
+    _packet_samples: deque[tuple[float, int]] = field(
+        default_factory=partial(deque, maxlen=PACKET_RATE_SAMPLES),
+        init=False,
+        repr=False,
+    )
+
+    def sample_packets(self) -> None:
+        """Store the time and the packet count to measure the packet rate."""
+        self._packet_samples.append((time.monotonic(), self.packets))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics."""
+        packets = self.packets
+        packet_rate = 0.0
+        if self._packet_samples:
+            sample_time, sample_packets = self._packet_samples[0]
+            if elapsed := time.monotonic() - sample_time:
+                packet_rate = (packets - sample_packets) / elapsed
+        return {
+            "packets": packets,
+            "packet_rate": round(packet_rate, 1),
+            "decodes": self.decodes,
+            "decode_time_avg": (
+                round(self.decode_time / self.decodes * 1000, 3)
+                if self.decodes
+                else 0.0
+            ),
+            "decode_time_max": round(self.max_decode_time * 1000, 3),
+        }
+
 
 class Diagnostics:
     """Holds diagnostics counters and key/values."""
@@ -17,6 +66,7 @@ class Diagnostics:
         """Initialize Diagnostics."""
         self._counter: Counter = Counter()
         self._values: dict[str, Any] = {}
+        self.metrics = StreamMetrics()
 
     def increment(self, key: str) -> None:
         """Increment a counter for the specified key/event."""
@@ -64,6 +64,9 @@ class HlsStreamOutput(StreamOutput):
             deque_maxlen=MAX_SEGMENTS,
         )
         self._target_duration = stream_settings.min_segment_duration
+        # The playlist only changes when a part or segment is added, so it
+        # is rendered once and shared by all viewers until then
+        self.rendered_playlist: bytes | None = None
 
     @property
     def name(self) -> str:
@@ -74,6 +77,12 @@ class HlsStreamOutput(StreamOutput):
         """Handle cleanup."""
         super().cleanup()
         self._segments.clear()
+        self.rendered_playlist = None
+
+    def part_put(self) -> None:
+        """Invalidate the rendered playlist and signal the latest part."""
+        self.rendered_playlist = None
+        super().part_put()
 
     @property
     def target_duration(self) -> float:
@@ -93,9 +102,14 @@ class HlsStreamOutput(StreamOutput):
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
         )
+        self.rendered_playlist = None
 
     def discontinuity(self) -> None:
-        """Fix incomplete segment at end of deque."""
+        """Fix incomplete segment at end of deque.
+
+        Called from the stream worker thread. Like put, the segment and the
+        rendered playlist are only changed in the event loop.
+        """
         self._hass.loop.call_soon_threadsafe(self._async_discontinuity)
 
     @callback
@@ -107,8 +121,10 @@ class HlsStreamOutput(StreamOutput):
                 last_segment.duration = sum(
                     part.duration for part in last_segment.parts
                 )
+                last_segment.async_join_parts()
             else:
                 self._segments.pop()
+            self.rendered_playlist = None
 
 
 class HlsMasterPlaylistView(StreamView):
@@ -324,8 +340,10 @@ class HlsPlaylistView(StreamView):
             ):
                 return self.not_found(blocking_request, track.target_duration)
 
+        if (playlist := track.rendered_playlist) is None:
+            playlist = track.rendered_playlist = self.render(track).encode("utf-8")
         response = web.Response(
-            body=self.render(track).encode("utf-8"),
+            body=playlist,
             headers={
                 "Content-Type": FORMAT_CONTENT_TYPE[HLS_PROVIDER],
             },
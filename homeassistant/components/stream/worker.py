@@ -608,6 +608,7 @@ def stream_worker(
 
     # Mux the first keyframe, then proceed through the rest of the packets
     muxer.mux_packet(first_keyframe)
+    metrics = stream_state.diagnostics.metrics
 
     with contextlib.closing(container), contextlib.closing(muxer):
         while not quit_event.is_set():
@@ -621,6 +622,8 @@ def stream_worker(
                 raise StreamWorkerError(f"Error demuxing stream: {ex!s}") from ex
 
             muxer.mux_packet(packet)
+            metrics.packets += 1
 
             if packet.is_keyframe and is_video(packet):
                 keyframe_converter.stash_keyframe_packet(packet)
+                metrics.sample_packets()
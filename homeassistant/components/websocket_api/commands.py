@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from functools import lru_cache, partial
 import json
 import logging
@@ -56,6 +56,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -63,6 +64,9 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+COMPRESSED_STATES_SNAPSHOT: HassKey[CompressedStatesSnapshot] = HassKey(
+    "websocket_api_compressed_states_snapshot"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,6 +78,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
@@ -365,7 +370,7 @@ def _send_handle_get_states_response(
 
 @callback
 def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    send_state_diff_message: Callable[[bytes, Event[EventStateChangedData]], None],
     entity_ids: set[str],
     user: User,
     message_id_as_bytes: bytes,
@@ -384,7 +389,87 @@ def _forward_entity_changes(
         and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    send_state_diff_message(message_id_as_bytes, event)
+
+
+class CompressedStatesSnapshot:
+    """Shared snapshot of the compressed states of all entities.
+
+    The compressed state of every entity is serialized once and patched
+    on state_changed, so connections subscribing to entities at the same
+    time share the same payload instead of each serializing the whole
+    state machine.
+    """
+
+    __slots__ = ("_hass", "_fragments", "_dirty", "_payload")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._fragments: dict[str, bytes] = {}
+        # None means the snapshot has never been built
+        self._dirty: set[str] | None = None
+        self._payload: bytes | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Start tracking state changes."""
+        self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark an entity as changed."""
+        self._payload = None
+        if self._dirty is not None:
+            self._dirty.add(event.data["entity_id"])
+
+    @callback
+    def async_get_fragments(self) -> dict[str, bytes]:
+        """Return the compressed state JSON of each entity."""
+        if self._dirty is None:
+            entity_ids: Iterable[str] = self._hass.states.async_entity_ids()
+        elif self._dirty:
+            entity_ids = self._dirty
+        else:
+            return self._fragments
+        fragments = self._fragments
+        get_state = self._hass.states.get
+        for entity_id in entity_ids:
+            if (state := get_state(entity_id)) is None:
+                fragments.pop(entity_id, None)
+                continue
+            try:
+                fragments[entity_id] = state.as_compressed_state_json
+            except (ValueError, TypeError):
+                fragments.pop(entity_id, None)
+                _LOGGER.error(
+                    "Unable to serialize to JSON. Bad data found at %s",
+                    format_unserializable_data(
+                        find_paths_unserializable_data(state, dump=JSON_DUMP)
+                    ),
+                )
+        self._dirty = set()
+        return fragments
+
+    @callback
+    def async_get_payload(self) -> bytes:
+        """Return the joined compressed states of all entities."""
+        if self._payload is None:
+            self._payload = b",".join(self.async_get_fragments().values())
+        return self._payload
+
+
+@callback
+def _async_get_compressed_states_snapshot(
+    hass: HomeAssistant,
+) -> CompressedStatesSnapshot:
+    """Return the shared compressed states snapshot."""
+    if (snapshot := hass.data.get(COMPRESSED_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[COMPRESSED_STATES_SNAPSHOT] = CompressedStatesSnapshot(
+            hass
+        )
+        snapshot.async_setup()
+    return snapshot
 
 
 @callback
@@ -399,55 +484,49 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    user = connection.user
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    snapshot = _async_get_compressed_states_snapshot(hass)
+    access_all_entities = user.is_admin or user.permissions.access_all_entities(
+        POLICY_READ
+    )
+    if not entity_ids and access_all_entities:
+        serialized_states = snapshot.async_get_payload()
+    else:
+        fragments = snapshot.async_get_fragments()
+        if entity_ids:
+            fragments = {
+                entity_id: fragments[entity_id]
+                for entity_id in entity_ids
+                if entity_id in fragments
+            }
+        if not access_all_entities:
+            entity_perm = user.permissions.check_entity
+            fragments = {
+                entity_id: fragment
+                for entity_id, fragment in fragments.items()
+                if entity_perm(entity_id, POLICY_READ)
+            }
+        serialized_states = b",".join(fragments.values())
     message_id_as_bytes = str(msg["id"]).encode()
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
-            connection.send_message,
+            connection.send_state_diff_message,
             entity_ids,
-            connection.user,
+            user,
             message_id_as_bytes,
         ),
     )
     connection.send_result(msg["id"])
-
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    try:
-        serialized_states = [
-            state.as_compressed_state_json
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        ]
-    except (ValueError, TypeError):
-        pass
-    else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
-        return
-
-    serialized_states = []
-    for state in states:
-        try:
-            serialized_states.append(state.as_compressed_state_json)
-        except (ValueError, TypeError):
-            connection.logger.error(
-                "Unable to serialize to JSON. Bad data found at %s",
-                format_unserializable_data(
-                    find_paths_unserializable_data(state, dump=JSON_DUMP)
-                ),
-            )
-
     _send_handle_entities_init_response(connection, msg["id"], serialized_states)
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+    connection: ActiveConnection, msg_id: int, serialized_states: bytes
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -456,7 +535,7 @@ def _send_handle_entities_init_response(
                 b'{"id":',
                 str(msg_id).encode(),
                 b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
+                serialized_states,
                 b"}}}",
             )
         )
@@ -547,6 +626,15 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection/stats"})
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle the outgoing message stats of the connection command."""
+    connection.send_result(msg["id"], connection.stats.as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
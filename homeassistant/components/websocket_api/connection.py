@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -10,7 +10,13 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.auth.models import RefreshToken, User
-from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.core import (
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers.http import current_request
 from homeassistant.util.json import JsonValueType
@@ -30,6 +36,26 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+class ConnectionStats:
+    """Counters of the outgoing messages of a connection."""
+
+    __slots__ = ("messages_coalesced", "messages_dropped", "peak_pending")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.messages_coalesced = 0
+        self.messages_dropped = 0
+        self.peak_pending = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dict."""
+        return {
+            "messages_coalesced": self.messages_coalesced,
+            "messages_dropped": self.messages_dropped,
+            "peak_pending": self.peak_pending,
+        }
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -37,12 +63,16 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_state_diff_message",
+        "wait_for_drain",
         "user",
         "refresh_token_id",
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "backpressure_policy",
         "supported_features",
+        "stats",
         "handlers",
         "binary_handlers",
     )
@@ -59,12 +89,20 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Replaced by the websocket handler so it can merge pending diffs
+        self.send_state_diff_message: Callable[
+            [bytes, Event[EventStateChangedData]], None
+        ] = self._send_state_diff_message
+        # Replaced by the websocket handler to wait for its queue to drain
+        self.wait_for_drain: Callable[[], Awaitable[None]] = self._wait_for_drain
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.backpressure_policy = const.BackpressurePolicy.COALESCE
         self.supported_features: dict[str, float] = {}
+        self.stats = ConnectionStats()
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
@@ -79,6 +117,28 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        if const.FEATURE_BACKPRESSURE_POLICY in features:
+            try:
+                self.backpressure_policy = const.BackpressurePolicy(
+                    int(features[const.FEATURE_BACKPRESSURE_POLICY])
+                )
+            except ValueError:
+                self.logger.warning(
+                    "Unsupported backpressure policy %s",
+                    features[const.FEATURE_BACKPRESSURE_POLICY],
+                )
+
+    async def _wait_for_drain(self) -> None:
+        """Wait until the queued messages were written, nothing is queued here."""
+
+    @callback
+    def _send_state_diff_message(
+        self, message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    ) -> None:
+        """Send a state diff message."""
+        self.send_message(
+            messages.cached_state_diff_message(message_id_as_bytes, event)
+        )
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+from enum import IntEnum
 from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.core import HomeAssistant
@@ -34,6 +35,10 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages at or below which the queue is considered
+# drained for callers waiting to send more.
+PENDING_MSG_DRAINED: Final = 64
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +63,22 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_BACKPRESSURE_POLICY = "backpressure_policy"
+
+
+class BackpressurePolicy(IntEnum):
+    """What to do when a client is not keeping up with pending messages.
+
+    The policy is selected by the client with the backpressure_policy
+    supported feature.
+    """
+
+    # Disconnect the client when it falls behind
+    DISCONNECT = 0
+    # Merge pending state diffs of the same entity once the queue is above
+    # PENDING_MSG_PEAK, disconnect the client if it still falls behind
+    COALESCE = 1
+    # Merge pending state diffs like COALESCE, when the queue is full drop
+    # the oldest pending state diff instead of disconnecting the client and
+    # send the current state of its entity once the queue is drained
+    DROP_OLDEST = 2
@@ -14,7 +14,7 @@ from aiohttp import WSMsgType, web
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
@@ -24,19 +24,28 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_DRAINED,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
+    BackpressurePolicy,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import (
+    ENTITY_EVENT_ADD,
+    ENTITY_EVENT_REMOVE,
+    cached_state_diff_message,
+    cached_state_replace_message,
+    event_message,
+    message_to_json_bytes,
+)
 from .util import describe_request
 
 if TYPE_CHECKING:
-    from .connection import ActiveConnection
+    from .connection import ActiveConnection, ConnectionStats
 
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
@@ -63,6 +72,24 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class _PendingStateDiff:
+    """A state diff waiting in the queue that later diffs can be merged into.
+
+    The message is None once the state diff was dropped.
+    """
+
+    __slots__ = ("key", "message")
+
+    def __init__(self, key: tuple[bytes, str], message: bytes) -> None:
+        """Initialize the pending state diff."""
+        self.key = key
+        self.message: bytes | None = message
+
+    def __repr__(self) -> str:
+        """Return the representation of the pending message."""
+        return repr(self.message)
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -79,8 +106,13 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_pending_state_diffs",
+        "_dropped_state_diffs",
+        "_stale_state_diffs",
+        "_stats",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drain_waiters",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -101,9 +133,20 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | _PendingStateDiff] = deque()
+        # State diffs that are still in the queue, keyed by subscription
+        # and entity, only tracked while the queue is above PENDING_MSG_PEAK
+        self._pending_state_diffs: dict[tuple[bytes, str], _PendingStateDiff] = {}
+        # Number of dropped state diffs still in the queue, they are skipped
+        # by the writer instead of being removed from the middle of the queue
+        self._dropped_state_diffs = 0
+        # Entities of each subscription whose pending state diff was dropped,
+        # their current state is sent again once the queue is drained
+        self._stale_state_diffs: dict[bytes, set[str]] = {}
+        self._stats: ConnectionStats | None = None
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._drain_waiters: list[asyncio.Future[None]] = []
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -139,6 +182,10 @@ class WebSocketHandler:
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
+                if self._drain_waiters and len(message_queue) <= PENDING_MSG_DRAINED:
+                    self._release_drain_waiters()
+                if not message_queue and self._stale_state_diffs:
+                    self._queue_stale_state_diffs()
                 if not message_queue:
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
@@ -152,12 +199,38 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if type(message) is not bytes:  # noqa: E721
+                        state_diff = self._pop_pending_state_diff(message)
+                        if state_diff is None:
+                            # The state diff was dropped
+                            continue
+                        message = state_diff
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if self._pending_state_diffs or self._dropped_state_diffs:
+                    self._pending_state_diffs.clear()
+                    self._dropped_state_diffs = 0
+                    messages = [
+                        message
+                        for queued in message_queue
+                        if (
+                            message := queued
+                            if type(queued) is bytes  # noqa: E721
+                            else queued.message
+                        )
+                    ]
+                    message_queue.clear()
+                    if not messages:
+                        # Only dropped state diffs were left
+                        continue
+                    coalesced_messages = b"".join((b"[", b",".join(messages), b"]"))
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")  # type: ignore[arg-type]
+                    )
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
@@ -172,6 +245,22 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _async_wait_for_drain(self) -> None:
+        """Wait until the queue is back to PENDING_MSG_DRAINED messages or less."""
+        if self._closing or len(self._message_queue) <= PENDING_MSG_DRAINED:
+            return
+        future: asyncio.Future[None] = self._loop.create_future()
+        self._drain_waiters.append(future)
+        await future
+
+    @callback
+    def _release_drain_waiters(self) -> None:
+        """Wake up everyone waiting for the queue to drain."""
+        for future in self._drain_waiters:
+            if not future.done():
+                future.set_result(None)
+        self._drain_waiters.clear()
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -179,6 +268,118 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    def _pop_pending_state_diff(self, pending: _PendingStateDiff) -> bytes | None:
+        """Stop tracking a state diff that is leaving the queue.
+
+        Returns None if the state diff was dropped.
+        """
+        if (message := pending.message) is None:
+            self._dropped_state_diffs -= 1
+        else:
+            del self._pending_state_diffs[pending.key]
+        return message
+
+    @callback
+    def _drop_oldest_state_diff(self) -> None:
+        """Drop the oldest pending state diff and resync its entity later."""
+        key, pending = next(iter(self._pending_state_diffs.items()))
+        del self._pending_state_diffs[key]
+        # The state diff is left in the queue and skipped by the writer
+        pending.message = None
+        self._dropped_state_diffs += 1
+        if self._dropped_state_diffs >= MAX_PENDING_MSG:
+            # Remove the dropped state diffs once in a while so
+            # the queue does not grow while the client is stuck
+            self._compact_message_queue()
+        message_id_as_bytes, entity_id = key
+        self._stale_state_diffs.setdefault(message_id_as_bytes, set()).add(entity_id)
+        if self._stats is not None:
+            self._stats.messages_dropped += 1
+
+    @callback
+    def _compact_message_queue(self) -> None:
+        """Remove the dropped state diffs from the queue."""
+        message_queue = self._message_queue
+        messages = [
+            message
+            for message in message_queue
+            if type(message) is bytes or message.message is not None  # noqa: E721
+        ]
+        message_queue.clear()
+        message_queue.extend(messages)
+        self._dropped_state_diffs = 0
+
+    @callback
+    def _queue_stale_state_diffs(self) -> None:
+        """Send the current state of the entities whose state diff was dropped."""
+        stale_state_diffs = self._stale_state_diffs
+        self._stale_state_diffs = {}
+        if (connection := self._connection) is None:
+            return
+        get_state = self._hass.states.get
+        for message_id_as_bytes, entity_ids in stale_state_diffs.items():
+            msg_id = int(message_id_as_bytes)
+            if msg_id not in connection.subscriptions:
+                continue
+            added: dict[str, Any] = {}
+            removed: list[str] = []
+            for entity_id in entity_ids:
+                if (state := get_state(entity_id)) is None:
+                    removed.append(entity_id)
+                else:
+                    added[entity_id] = state.as_compressed_state
+            event: dict[str, Any] = {}
+            if added:
+                event[ENTITY_EVENT_ADD] = added
+            if removed:
+                event[ENTITY_EVENT_REMOVE] = removed
+            self._queue_message(message_to_json_bytes(event_message(msg_id, event)))
+
+    @callback
+    def _send_state_diff_message(
+        self, message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    ) -> None:
+        """Queue sending a state diff to the client.
+
+        Once the client falls behind, successive diffs of the same entity
+        are merged into a single message replacing the state of the entity.
+        With the drop oldest policy, the oldest pending diff is dropped when
+        the queue is full and the current state of its entity is sent once
+        the queue is drained.
+        """
+        if self._closing:
+            return
+
+        entity_id = event.data["entity_id"]
+        if (
+            stale_entity_ids := self._stale_state_diffs.get(message_id_as_bytes)
+        ) and entity_id in stale_entity_ids:
+            # The current state of the entity is sent once the queue is drained
+            if self._stats is not None:
+                self._stats.messages_coalesced += 1
+            return
+
+        if (
+            len(self._message_queue) < PENDING_MSG_PEAK
+            or self._connection is None
+            or self._connection.backpressure_policy is BackpressurePolicy.DISCONNECT
+        ):
+            self._queue_message(cached_state_diff_message(message_id_as_bytes, event))
+            return
+
+        key = (message_id_as_bytes, entity_id)
+        if (pending := self._pending_state_diffs.get(key)) is not None:
+            pending.message = cached_state_replace_message(message_id_as_bytes, event)
+            if self._stats is not None:
+                self._stats.messages_coalesced += 1
+            return
+
+        pending = _PendingStateDiff(
+            key, cached_state_diff_message(message_id_as_bytes, event)
+        )
+        self._pending_state_diffs[key] = pending
+        self._queue_message(pending)
+
     @callback
     def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Queue sending a message to the client.
@@ -198,9 +399,33 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        self._queue_message(message)
+
+    @callback
+    def _queue_message(self, message: bytes | _PendingStateDiff) -> None:
+        """Add a message to the queue and apply the backpressure policy."""
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        queue_size_after_add = len(message_queue) - self._dropped_state_diffs
+        if (stats := self._stats) is not None and (
+            queue_size_after_add > stats.peak_pending
+        ):
+            stats.peak_pending = queue_size_after_add
+
+        drop_oldest = (
+            self._connection is not None
+            and self._connection.backpressure_policy is BackpressurePolicy.DROP_OLDEST
+        )
+        if (
+            queue_size_after_add >= MAX_PENDING_MSG
+            and drop_oldest
+            and self._pending_state_diffs
+        ):
+            # Only state diffs can be dropped, other messages are part of
+            # the protocol the client relies on
+            self._drop_oldest_state_diff()
+            queue_size_after_add -= 1
+        elif queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -221,7 +446,7 @@ class WebSocketHandler:
 
         peak_checker_active = self._peak_checker_unsub is not None
 
-        if queue_size_after_add <= PENDING_MSG_PEAK:
+        if queue_size_after_add <= PENDING_MSG_PEAK or drop_oldest:
             if peak_checker_active:
                 self._cancel_peak_checker()
             return
@@ -360,6 +585,9 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
+            self._stats = connection.stats
+            connection.send_state_diff_message = self._send_state_diff_message
+            connection.wait_for_drain = self._async_wait_for_drain
             self._writer_task = create_eager_task(self._writer(send_bytes_text))
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -462,6 +690,7 @@ class WebSocketHandler:
                 connection.async_handle_close()
 
             self._closing = True
+            self._release_drain_waiters()
             if self._ready_future and not self._ready_future.done():
                 self._ready_future.set_result(len(self._message_queue))
 
@@ -495,6 +724,8 @@ class WebSocketHandler:
                     self._hass = None  # type: ignore[assignment]
                     self._logger = None  # type: ignore[assignment]
                     self._message_queue = None  # type: ignore[assignment]
+                    self._pending_state_diffs = None  # type: ignore[assignment]
+                    self._stale_state_diffs = None  # type: ignore[assignment]
                     self._handle_task = None
                     self._writer_task = None
                     self._ready_future = None
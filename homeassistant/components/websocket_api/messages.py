@@ -177,6 +177,45 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_replace_message(
+    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+) -> bytes:
+    """Return an event message replacing the whole state of the entity.
+
+    Used instead of a state diff when earlier diffs of the same entity
+    were merged while waiting to be sent to the client.
+    """
+    return b"".join(
+        (
+            _partial_cached_state_replace_message(event)[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_replace_message(
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Cache and serialize the event to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_replace_message
+    """
+    if (new_state := event.data["new_state"]) is None:
+        state_event: dict[str, Any] = {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    else:
+        state_event = {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}
+        }
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": state_event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
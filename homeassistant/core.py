@@ -37,6 +37,7 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -1987,6 +1988,17 @@ class State:
         )
 
 
+class StateUpdate(NamedTuple):
+    """A state to set with StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
@@ -2326,6 +2338,124 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_many(
+        self, updates: Iterable[StateUpdate], timestamp: float | None = None
+    ) -> None:
+        """Set the states of many entities at once.
+
+        This behaves like calling async_set for each update, except that
+        all new states are created before any of them is stored and all
+        of them are stored before any event is fired. If a state is not
+        valid, nothing is changed and listeners will never see only part
+        of the batch.
+
+        All updates share the timestamp, and each update without a context
+        gets a new context.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        states_data = self._states_data
+        # New states by entity_id so an entity can be updated more than
+        # once in the same batch
+        pending: dict[str, State] = {}
+        # A new state of None means the old state is only reported
+        writes: list[tuple[str, State | None, State | None, Context | None]] = []
+
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+        ) in updates:
+            new_state = str(new_state)
+            attributes = attributes or {}
+            old_state = pending.get(entity_id) or states_data.get(entity_id)
+            if old_state is None:
+                entity_id = entity_id.lower()
+                old_state = pending.get(entity_id) or states_data.get(entity_id)
+
+            if old_state is None:
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                same_attr = old_state.attributes == attributes
+                last_changed = old_state.last_changed if same_state else None
+
+            if same_state and same_attr:
+                writes.append((entity_id, old_state, None, context))
+                continue
+
+            if context is None:
+                context = Context(id=ulid_at_time(timestamp))
+
+            if same_attr:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                attributes = old_state.attributes
+
+            # This is intentionally called with positional only arguments for
+            # performance reasons
+            state = pending[entity_id] = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                now,
+                context,
+                old_state is None,
+                state_info,
+                timestamp,
+            )
+            writes.append((entity_id, old_state, state, context))
+
+        events: list[tuple[EventType[Any], dict[str, Any], Context | None]] = []
+        for entity_id, old_state, state, context in writes:
+            if state is None:
+                if TYPE_CHECKING:
+                    assert old_state is not None
+                old_last_reported = old_state.last_reported
+                old_state.last_reported = now
+                old_state.last_reported_timestamp = timestamp
+                events.append(
+                    (
+                        EVENT_STATE_REPORTED,
+                        {
+                            "entity_id": entity_id,
+                            "old_last_reported": old_last_reported,
+                            "new_state": old_state,
+                        },
+                        context,
+                    )
+                )
+                continue
+            if old_state is not None:
+                old_state.expire()
+            self._states[entity_id] = state
+            events.append(
+                (
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": state,
+                    },
+                    context,
+                )
+            )
+
+        fire_internal = self._bus.async_fire_internal
+        for event_type, event_data, context in events:
+            fire_internal(event_type, event_data, context=context, time_fired=timestamp)
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
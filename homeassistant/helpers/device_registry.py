@@ -437,7 +437,7 @@ def format_mac(mac: str) -> str:
     return mac
 
 
-class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
+class DeviceRegistryStore(storage.JournalStore[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
     async def _async_migrate_func(
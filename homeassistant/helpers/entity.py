@@ -6,6 +6,7 @@ from abc import ABCMeta
 import asyncio
 from collections import deque
 from collections.abc import Callable, Coroutine, Iterable, Mapping
+import contextlib
 import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
@@ -19,6 +20,7 @@ import time
 from types import FunctionType
 from typing import TYPE_CHECKING, Any, Final, Literal, NotRequired, TypedDict, final
 
+from typing_extensions import Generator
 import voluptuous as vol
 
 from homeassistant.config import DATA_CUSTOMIZE
@@ -45,6 +47,7 @@ from homeassistant.core import (
     HassJobType,
     HomeAssistant,
     ReleaseChannel,
+    StateUpdate,
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
@@ -199,6 +202,74 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
+class _StateWriteBatch:
+    """State writes of entities collected by async_batch_state_writes."""
+
+    __slots__ = ("hass", "writes")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batch."""
+        self.hass = hass
+        self.writes: list[tuple[Entity, StateUpdate]] = []
+
+
+# The open batch, only set while async_batch_state_writes is running
+_state_write_batch: _StateWriteBatch | None = None
+
+
+@contextlib.contextmanager
+def async_batch_state_writes(hass: HomeAssistant) -> Generator[None]:
+    """Collect the state writes of entities and set them at once on exit.
+
+    Entities that write their state inside the block will not see it in the
+    state machine until the block exits, and no state_changed event is fired
+    before then. The states of entities removed inside the block are not
+    set. Nested blocks are merged into the outer one.
+
+    This must be run in the event loop around code that does not await.
+    """
+    global _state_write_batch  # noqa: PLW0603
+    if _state_write_batch is not None:
+        yield
+        return
+    batch = _state_write_batch = _StateWriteBatch(hass)
+    try:
+        yield
+    finally:
+        _state_write_batch = None
+        if updates := [
+            update
+            for ent, update in batch.writes
+            if ent._platform_state is not EntityPlatformState.REMOVED  # noqa: SLF001
+        ]:
+            _async_set_state_batch(hass, updates)
+
+
+@callback
+def _async_set_state_batch(hass: HomeAssistant, updates: list[StateUpdate]) -> None:
+    """Set a batch of states, falling back to one by one if one is invalid."""
+    try:
+        hass.states.async_set_many(updates)
+    except InvalidStateError:
+        # Nothing has been set, so only the invalid states fall back to unknown
+        for update in updates:
+            try:
+                hass.states.async_set(*update)
+            except InvalidStateError:
+                _LOGGER.exception(
+                    "Failed to set state for %s, fall back to %s",
+                    update.entity_id,
+                    STATE_UNKNOWN,
+                )
+                hass.states.async_set(
+                    update.entity_id,
+                    STATE_UNKNOWN,
+                    {},
+                    update.force_update,
+                    update.context,
+                )
+
+
 class EntityInfo(TypedDict):
     """Entity info."""
 
@@ -1201,6 +1272,22 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if (batch := _state_write_batch) is not None and batch.hass is hass:
+            batch.writes.append(
+                (
+                    self,
+                    StateUpdate(
+                        entity_id,
+                        state,
+                        attr,
+                        self.force_update,
+                        self._context,
+                        self._state_info,
+                    ),
+                )
+            )
+            return
+
         try:
             hass.states.async_set(
                 entity_id,
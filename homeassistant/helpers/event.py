@@ -8,11 +8,13 @@ from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import partial, wraps
+import fnmatch
+from functools import lru_cache, partial, wraps
 import logging
 from random import randint
+import re
 import time
-from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar, cast
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
@@ -60,6 +62,9 @@ from .typing import TemplateVarsType
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
     "track_state_change_data"
 )
+_TRACK_STATE_CHANGE_PATTERN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
+    HassKey("track_state_change_pattern_data")
+)
 _TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
     "track_state_report_data"
 )
@@ -82,6 +87,9 @@ _ENTITIES_LISTENER = "entities"
 
 _LOGGER = logging.getLogger(__name__)
 
+_PATTERN_WILDCARD = re.compile(r"[*?[]")
+_MISSING = object()
+
 # Used to spread async_track_utc_time_change listeners and DataUpdateCoordinator
 # refresh cycles between RANDOM_MICROSECOND_MIN..RANDOM_MICROSECOND_MAX.
 # The values have been determined experimentally in production testing, background
@@ -115,6 +123,9 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         bool,
     ]
+    callbacks_factory: Callable[
+        [], defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    ] = partial(defaultdict, list)
 
 
 @dataclass(slots=True, frozen=True)
@@ -444,7 +455,7 @@ def _async_track_event(
         event_data = hass_data[tracker_key]
         callbacks = event_data.callbacks
     else:
-        callbacks = defaultdict(list)
+        callbacks = tracker.callbacks_factory()
         listener = hass.bus.async_listen(
             tracker.event_type,
             partial(tracker.dispatcher_callable, hass, callbacks),
@@ -689,6 +700,184 @@ def async_track_state_removed_domain(
     )
 
 
+class _PatternTrieNode:
+    """Node of the trie of entity id pattern prefixes."""
+
+    __slots__ = ("children", "patterns")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _PatternTrieNode] = {}
+        # Patterns whose literal prefix ends at this node mapped to a matcher
+        # for the rest of the entity id, None when any rest matches
+        self.patterns: dict[str, Callable[[str, int], Any] | None] = {}
+
+
+class _EntityIdPatternCallbacks(
+    defaultdict[str, list[HassJob[[Event[EventStateChangedData]], Any]]]
+):
+    """Callbacks keyed by entity id or glob pattern.
+
+    Patterns are indexed by their literal prefix, the part before the first
+    wildcard, in a trie. Matching an entity id walks the trie once along the
+    entity id and only tests the patterns found on that path. The jobs found
+    by the event filter are kept for the dispatcher of the same event so the
+    trie is only walked once per state change.
+    """
+
+    __slots__ = ("_matched_data", "_matched_jobs", "_root")
+
+    def __init__(self) -> None:
+        """Initialize the callbacks."""
+        super().__init__(list)
+        self._root = _PatternTrieNode()
+        self._matched_data: EventStateChangedData | None = None
+        self._matched_jobs: list[HassJob[[Event[EventStateChangedData]], Any]] = []
+
+    def __missing__(
+        self, key: str
+    ) -> list[HassJob[[Event[EventStateChangedData]], Any]]:
+        """Add a new pattern."""
+        self[key] = jobs = []
+        if (wildcard := _PATTERN_WILDCARD.search(key)) is None:
+            # Entity ids are matched with a dict lookup
+            return jobs
+        node = self._root
+        for char in key[: wildcard.start()]:
+            if (child := node.children.get(char)) is None:
+                child = node.children[char] = _PatternTrieNode()
+            node = child
+        rest = key[wildcard.start() :]
+        node.patterns[key] = (
+            None if rest == "*" else re.compile(fnmatch.translate(rest)).match
+        )
+        return jobs
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a pattern."""
+        super().__delitem__(key)
+        if (wildcard := _PATTERN_WILDCARD.search(key)) is None:
+            return
+        prefix = key[: wildcard.start()]
+        path = [self._root]
+        for char in prefix:
+            path.append(path[-1].children[char])
+        del path[-1].patterns[key]
+        # Prune the nodes that no longer lead to a pattern
+        for depth in range(len(prefix), 0, -1):
+            node = path[depth]
+            if node.patterns or node.children:
+                break
+            del path[depth - 1].children[prefix[depth - 1]]
+
+    def _async_iter_matches(
+        self, entity_id: str
+    ) -> Iterable[list[HassJob[[Event[EventStateChangedData]], Any]]]:
+        """Yield the jobs of each pattern matching an entity id."""
+        if (jobs := self.get(entity_id)) is not None:
+            yield jobs
+        node: _PatternTrieNode | None = self._root
+        depth = 0
+        length = len(entity_id)
+        while node is not None:
+            for pattern, matcher in node.patterns.items():
+                if matcher is None or matcher(entity_id, depth):
+                    yield self[pattern]
+            if depth == length:
+                return
+            node = node.children.get(entity_id[depth])
+            depth += 1
+
+    @callback
+    def async_match(self, event_data: EventStateChangedData) -> bool:
+        """Match the entity id of an event and keep the jobs for the dispatcher."""
+        self._matched_jobs = jobs = self.async_get_jobs(event_data["entity_id"])
+        self._matched_data = event_data if jobs else None
+        return bool(jobs)
+
+    @callback
+    def async_pop_matched_jobs(
+        self, event_data: EventStateChangedData
+    ) -> list[HassJob[[Event[EventStateChangedData]], Any]]:
+        """Return the jobs matched by the event filter for the event data."""
+        if self._matched_data is not event_data:
+            return self.async_get_jobs(event_data["entity_id"])
+        jobs = self._matched_jobs
+        self._matched_data = None
+        self._matched_jobs = []
+        return jobs
+
+    @callback
+    def async_get_jobs(
+        self, entity_id: str
+    ) -> list[HassJob[[Event[EventStateChangedData]], Any]]:
+        """Return the jobs of the patterns matching an entity id."""
+        matches = list(self._async_iter_matches(entity_id))
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return matches[0].copy()
+        # A listener may have several patterns matching the same entity id
+        return list(dict.fromkeys(job for jobs in matches for job in jobs))
+
+
+@callback
+def _async_dispatch_entity_id_pattern_event(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event: Event[EventStateChangedData],
+) -> None:
+    """Dispatch to listeners with a matching pattern."""
+    entity_id = event.data["entity_id"]
+    pattern_callbacks = cast(_EntityIdPatternCallbacks, callbacks)
+    for job in pattern_callbacks.async_pop_matched_jobs(event.data):
+        try:
+            hass.async_run_hass_job(job, event)
+        except Exception:
+            _LOGGER.exception(
+                "Error while dispatching event for %s to %s", entity_id, job
+            )
+
+
+@callback
+def _async_state_pattern_filter(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event_data: EventStateChangedData,
+) -> bool:
+    """Filter state changes by entity id pattern."""
+    return cast(_EntityIdPatternCallbacks, callbacks).async_match(event_data)
+
+
+_KEYED_TRACK_STATE_CHANGE_PATTERN = _KeyedEventTracker(
+    key=_TRACK_STATE_CHANGE_PATTERN_DATA,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_entity_id_pattern_event,
+    filter_callable=_async_state_pattern_filter,
+    callbacks_factory=_EntityIdPatternCallbacks,
+)
+
+
+@bind_hass
+def async_track_state_change_pattern_event(
+    hass: HomeAssistant,
+    patterns: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None = None,
+) -> CALLBACK_TYPE:
+    """Track state change events of entity ids matching patterns.
+
+    Patterns are entity ids or globs like sensor.* or sensor.power_*.
+    Unlike listening to all state changed events, the listener is only
+    called for the entity ids matching its patterns.
+    """
+    if not (patterns := _async_string_to_lower_list(patterns)):
+        return _remove_empty_listener
+    return _async_track_event(
+        _KEYED_TRACK_STATE_CHANGE_PATTERN, hass, patterns, action, job_type
+    )
+
+
 @callback
 def _async_string_to_lower_list(instr: str | Iterable[str]) -> list[str]:
     if isinstance(instr, str):
@@ -796,8 +985,12 @@ class _TrackStateChangeFiltered:
     @callback
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
         if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            # Entities of the tracked domains are dispatched by the domains listener
+            entities = {
+                entity_id
+                for entity_id in entities
+                if entity_id.partition(".")[0] not in domains
+            }
 
         # Entities has changed to none
         if not entities:
@@ -807,21 +1000,17 @@ class _TrackStateChangeFiltered:
             self.hass, entities, self._action, self._action_as_hassjob.job_type
         )
 
-    @callback
-    def _state_added(self, event: Event[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
-
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added, HassJobType.Callback
+        self._listeners[_DOMAINS_LISTENER] = _async_track_event(
+            _KEYED_TRACK_STATE_CHANGE_PATTERN,
+            self.hass,
+            [f"{domain}.*" for domain in domains],
+            self._action,
+            self._action_as_hassjob.job_type,
         )
 
     @callback
@@ -1941,15 +2130,52 @@ def _event_triggers_rerender(
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
 
+    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+        return bool(info.filter(entity_id)) and info.fields_trigger_rerender(
+            entity_id, _changed_state_fields(event)
+        )
+
     if info.filter(entity_id):
         return True
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
-        return False
-
     return bool(info.filter_lifecycle(entity_id))
 
 
+@lru_cache(maxsize=128)
+def _changed_state_fields(event: Event[EventStateChangedData]) -> frozenset[str]:
+    """Return the fields of the state changed by an event.
+
+    Changed attributes are included both as attributes and
+    attributes.<name> to match the fields collected by templates.
+    """
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
+    if TYPE_CHECKING:
+        assert old_state is not None
+        assert new_state is not None
+    changed: set[str] = set()
+    if old_state.state != new_state.state:
+        changed.add("state")
+    if old_state.last_changed != new_state.last_changed:
+        changed.add("last_changed")
+    if old_state.last_updated != new_state.last_updated:
+        changed.add("last_updated")
+    if old_state.last_reported != new_state.last_reported:
+        changed.add("last_reported")
+    if old_state.context != new_state.context:
+        changed.add("context")
+    if (old_attributes := old_state.attributes) != (
+        new_attributes := new_state.attributes
+    ):
+        changed.add("attributes")
+        changed.update(
+            f"attributes.{name}"
+            for name in old_attributes.keys() | new_attributes.keys()
+            if old_attributes.get(name, _MISSING) != new_attributes.get(name, _MISSING)
+        )
+    return frozenset(changed)
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
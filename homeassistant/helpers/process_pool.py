@@ -0,0 +1,215 @@
+"""Run CPU bound functions in worker processes against a snapshot of states.
+
+Functions run by async_add_process_job receive a read only mapping of
+entity_id to State as their first argument. The states are serialized
+into a shared memory block which is reused by later jobs until it is
+older than SNAPSHOT_MAX_AGE and a state has changed since, so the states
+a job sees can be up to SNAPSHOT_MAX_AGE seconds old. Each worker process
+only loads the block when it has not seen it before, so the state machine
+is not pickled for every call.
+
+The function and its arguments are sent to the worker with pickle, so
+the function must be importable at module level and must not depend on
+anything in the main process other than the states it is passed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+import logging
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import os
+from typing import Any, cast
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import json_loads
+from homeassistant.util.read_only_dict import ReadOnlyDict
+
+from .json import json_bytes
+from .singleton import singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROCESS_POOL: HassKey[StateProcessPool] = HassKey("process_pool")
+
+# Leave a core for the event loop
+MAX_PROCESS_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+# Seconds a snapshot is reused for after the states changed
+SNAPSHOT_MAX_AGE = 5
+
+# Snapshot of the worker process, only set in workers
+_worker_snapshot_name: str | None = None
+_worker_states: ReadOnlyDict[str, State] = ReadOnlyDict()
+
+
+class _StateSnapshot:
+    """A serialized snapshot of all states in shared memory."""
+
+    __slots__ = ("shared_memory", "size", "users", "current", "created")
+
+    def __init__(self, data: bytes, created: float) -> None:
+        """Copy the data into a new shared memory block."""
+        self.size = len(data)
+        self.shared_memory = SharedMemory(create=True, size=self.size)
+        self.shared_memory.buf[: self.size] = data
+        self.users = 0
+        self.current = True
+        self.created = created
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared memory block."""
+        return self.shared_memory.name
+
+    def release(self) -> None:
+        """Free the shared memory block."""
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+
+
+def _worker_load_states(name: str, size: int) -> ReadOnlyDict[str, State]:
+    """Return the states of a snapshot, loading it if it is new."""
+    global _worker_snapshot_name, _worker_states  # noqa: PLW0603
+    if name != _worker_snapshot_name:
+        shared_memory = SharedMemory(name=name)
+        try:
+            with shared_memory.buf[:size] as data:
+                states_dicts = cast(dict[str, dict[str, Any]], json_loads(data))
+        finally:
+            shared_memory.close()
+        _worker_states = ReadOnlyDict(
+            {
+                entity_id: state
+                for entity_id, state_dict in states_dicts.items()
+                if (state := State.from_dict(state_dict)) is not None
+            }
+        )
+        _worker_snapshot_name = name
+    return _worker_states
+
+
+def _worker_run_with_states[_R](
+    name: str, size: int, target: Callable[..., _R], args: tuple[Any, ...]
+) -> _R:
+    """Run the target in a worker process with the states of a snapshot."""
+    return target(_worker_load_states(name, size), *args)
+
+
+class StateProcessPool:
+    """Pool of worker processes that share a snapshot of the states."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self._executor: ProcessPoolExecutor | None = None
+        self._snapshot: _StateSnapshot | None = None
+        self._states_changed = False
+        self._shutdown = False
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_shutdown)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Mark the snapshot outdated when a state changes."""
+        self._states_changed = True
+
+    @callback
+    def _async_retire_snapshot(self) -> None:
+        """Free the snapshot once no job uses it anymore."""
+        if (snapshot := self._snapshot) is not None:
+            self._snapshot = None
+            snapshot.current = False
+            if not snapshot.users:
+                snapshot.release()
+
+    @callback
+    def _async_get_snapshot(self) -> _StateSnapshot:
+        """Return the snapshot of the states."""
+        now = self.hass.loop.time()
+        if (snapshot := self._snapshot) is not None and (
+            not self._states_changed or now - snapshot.created < SNAPSHOT_MAX_AGE
+        ):
+            return snapshot
+        self._async_retire_snapshot()
+        self._states_changed = False
+        self._snapshot = _StateSnapshot(
+            json_bytes(
+                {
+                    state.entity_id: state.json_fragment
+                    for state in self.hass.states.async_all()
+                }
+            ),
+            now,
+        )
+        return self._snapshot
+
+    @callback
+    def _async_get_executor(self) -> ProcessPoolExecutor:
+        """Return the executor, creating it on first use."""
+        if self._executor is None:
+            # Forking a process that runs threads is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=MAX_PROCESS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def async_run[_R](self, target: Callable[..., _R], *args: Any) -> _R:
+        """Run the target in a worker process with the current states."""
+        if self._shutdown:
+            raise RuntimeError("Process pool is shut down")
+        snapshot = self._async_get_snapshot()
+        future = self._async_get_executor().submit(
+            _worker_run_with_states, snapshot.name, snapshot.size, target, args
+        )
+        snapshot.users += 1
+        # The worker may still use the snapshot after the caller is cancelled
+        future.add_done_callback(partial(self._job_done, snapshot))
+        return await asyncio.wrap_future(future)
+
+    def _job_done(self, snapshot: _StateSnapshot, future: Future[Any]) -> None:
+        """Release the snapshot once the worker is done with it."""
+        self.hass.loop.call_soon_threadsafe(self._async_release_snapshot, snapshot)
+
+    @callback
+    def _async_release_snapshot(self, snapshot: _StateSnapshot) -> None:
+        """Free the snapshot if it is outdated and no job uses it anymore."""
+        snapshot.users -= 1
+        if not snapshot.current and not snapshot.users:
+            snapshot.release()
+
+    async def _async_shutdown(self, event: Event) -> None:
+        """Shut down the worker processes and free the snapshot."""
+        self._shutdown = True
+        if self._executor is not None:
+            _LOGGER.debug("Shutting down process pool")
+            await self.hass.async_add_executor_job(
+                partial(self._executor.shutdown, wait=True, cancel_futures=True)
+            )
+            self._executor = None
+        self._async_retire_snapshot()
+
+
+@callback
+@singleton(DATA_PROCESS_POOL)
+def _async_get_process_pool(hass: HomeAssistant) -> StateProcessPool:
+    """Return the process pool."""
+    return StateProcessPool(hass)
+
+
+async def async_add_process_job[_R](
+    hass: HomeAssistant, target: Callable[..., _R], *args: Any
+) -> _R:
+    """Run a CPU bound function in a worker process.
+
+    The target is called with a read only mapping of entity_id to State
+    followed by args.
+    """
+    return await _async_get_process_pool(hass).async_run(target, *args)
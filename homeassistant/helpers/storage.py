@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 from functools import cached_property
+import hashlib
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import mmap
 import os
 from pathlib import Path
+import struct
 from typing import Any
 
 from homeassistant.const import (
@@ -31,7 +34,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -48,6 +51,14 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal when it is this many times larger than the live records
+JOURNAL_COMPACT_RATIO = 2
+
+_JOURNAL_FRAME = struct.Struct(">I")
+
+type _JournalKey = tuple[str | None, str | None]
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -321,71 +332,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
-        elif cache := self._manager.async_fetch(self.key):
-            exists, data = cache
-            if not exists:
-                return None
-        else:
-            try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
-            except HomeAssistantError as err:
-                if isinstance(err.__cause__, JSONDecodeError):
-                    # If we have a JSONDecodeError, it means the file is corrupt.
-                    # We can't recover from this, so we'll log an error, rename the file and
-                    # return None so that we can start with a clean slate which will
-                    # allow startup to continue so they can restore from a backup.
-                    isotime = dt_util.utcnow().isoformat()
-                    corrupt_postfix = f".corrupt.{isotime}"
-                    corrupt_path = f"{self.path}{corrupt_postfix}"
-                    await self.hass.async_add_executor_job(
-                        os.rename, self.path, corrupt_path
-                    )
-                    storage_key = self.key
-                    _LOGGER.error(
-                        "Unrecoverable error decoding storage %s at %s; "
-                        "This may indicate an unclean shutdown, invalid syntax "
-                        "from manual edits, or disk corruption; "
-                        "The corrupt file has been saved as %s; "
-                        "It is recommended to restore from backup: %s",
-                        storage_key,
-                        self.path,
-                        corrupt_path,
-                        err,
-                    )
-                    from .issue_registry import (  # pylint: disable=import-outside-toplevel
-                        IssueSeverity,
-                        async_create_issue,
-                    )
-
-                    issue_domain = HOMEASSISTANT_DOMAIN
-                    if (
-                        domain := (storage_key.partition(".")[0])
-                    ) and domain in self.hass.config.components:
-                        issue_domain = domain
-
-                    async_create_issue(
-                        self.hass,
-                        HOMEASSISTANT_DOMAIN,
-                        f"storage_corruption_{storage_key}_{isotime}",
-                        is_fixable=True,
-                        issue_domain=issue_domain,
-                        translation_key="storage_corruption",
-                        is_persistent=True,
-                        severity=IssueSeverity.CRITICAL,
-                        translation_placeholders={
-                            "storage_key": storage_key,
-                            "original_path": self.path,
-                            "corrupt_path": corrupt_path,
-                            "error": str(err),
-                        },
-                    )
-                    return None
-                raise
-
-            if data == {}:
-                return None
+        elif (data := await self._async_read_data()) is None:
+            return None
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -420,6 +368,74 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    async def _async_read_data(self) -> dict[str, Any] | None:
+        """Read the data from disk."""
+        if cache := self._manager.async_fetch(self.key):
+            exists, data = cache
+            return data if exists else None
+
+        try:
+            data = await self.hass.async_add_executor_job(
+                json_util.load_json, self.path
+            )
+        except HomeAssistantError as err:
+            if isinstance(err.__cause__, JSONDecodeError):
+                # If we have a JSONDecodeError, it means the file is corrupt.
+                # We can't recover from this, so we'll log an error, rename the file and
+                # return None so that we can start with a clean slate which will
+                # allow startup to continue so they can restore from a backup.
+                isotime = dt_util.utcnow().isoformat()
+                corrupt_postfix = f".corrupt.{isotime}"
+                corrupt_path = f"{self.path}{corrupt_postfix}"
+                await self.hass.async_add_executor_job(
+                    os.rename, self.path, corrupt_path
+                )
+                storage_key = self.key
+                _LOGGER.error(
+                    "Unrecoverable error decoding storage %s at %s; "
+                    "This may indicate an unclean shutdown, invalid syntax "
+                    "from manual edits, or disk corruption; "
+                    "The corrupt file has been saved as %s; "
+                    "It is recommended to restore from backup: %s",
+                    storage_key,
+                    self.path,
+                    corrupt_path,
+                    err,
+                )
+                from .issue_registry import (  # pylint: disable=import-outside-toplevel
+                    IssueSeverity,
+                    async_create_issue,
+                )
+
+                issue_domain = HOMEASSISTANT_DOMAIN
+                if (
+                    domain := (storage_key.partition(".")[0])
+                ) and domain in self.hass.config.components:
+                    issue_domain = domain
+
+                async_create_issue(
+                    self.hass,
+                    HOMEASSISTANT_DOMAIN,
+                    f"storage_corruption_{storage_key}_{isotime}",
+                    is_fixable=True,
+                    issue_domain=issue_domain,
+                    translation_key="storage_corruption",
+                    is_persistent=True,
+                    severity=IssueSeverity.CRITICAL,
+                    translation_placeholders={
+                        "storage_key": storage_key,
+                        "original_path": self.path,
+                        "corrupt_path": corrupt_path,
+                        "error": str(err),
+                    },
+                )
+                return None
+            raise
+
+        if data == {}:
+            return None
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -572,3 +588,333 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+class JournalStore[_T: Mapping[str, Any] | Sequence[Any]](Store[_T]):
+    """Store that only writes the records which changed.
+
+    The items of list data, or of the lists in mapping data, are stored as
+    length prefixed JSON records in an append only journal next to the
+    regular storage file. Each write appends the records which changed
+    since the previous write, and the journal is rewritten once it grows
+    too large. The journal is read with mmap.
+
+    Items are identified by _journal_record_id which must be unique within
+    a list. Data saved as plain JSON by a Store is loaded and written to the
+    journal on the next write. The JSON file is kept as a snapshot for older
+    versions and is rewritten from the journal on the final write. The
+    journal records the digest of the snapshot it knows about, so a JSON
+    file with any other content, for example written by an older version
+    after a downgrade, takes precedence over the journal. Custom encoders
+    are not supported.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize journal storage class."""
+        super().__init__(*args, **kwargs)
+        if self._encoder is not None:
+            raise ValueError("Custom encoders are not supported by JournalStore")
+        self._journal_header: bytes | None = None
+        # Digest of each record in the journal to its key
+        self._journal_digests: dict[bytes, _JournalKey] = {}
+        self._journal_size = 0
+        # If the JSON file holds the same data as the journal
+        self._snapshot_current = True
+
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
+    def _journal_record_id(self, payload: bytes) -> str:
+        """Return the id of a list item from its JSON payload."""
+        return str(json_util.json_loads_object(payload)["id"])
+
+    async def _async_read_data(self) -> dict[str, Any] | None:
+        """Read the journal, falling back to the JSON file."""
+        if (data := await self.hass.async_add_executor_job(self._read_journal)) is None:
+            self._snapshot_current = True
+            return await super()._async_read_data()
+        if not self._snapshot_current:
+            self._async_ensure_final_write_listener()
+        return data
+
+    async def _async_handle_write_data(self, *_args):
+        """Handle writing the config."""
+        await super()._async_handle_write_data(*_args)
+        if not self._snapshot_current:
+            self._async_ensure_final_write_listener()
+
+    async def _async_callback_final_write(self, _event: Event) -> None:
+        """Write the pending data and the JSON snapshot."""
+        await super()._async_callback_final_write(_event)
+        self._async_cleanup_final_write_listener()
+        async with self._write_lock:
+            if self._snapshot_current or self._read_only:
+                return
+            self._manager.async_invalidate(self.key)
+            try:
+                await self.hass.async_add_executor_job(self._write_snapshot)
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error writing snapshot for %s: %s", self.key, err)
+
+    def _read_journal(self) -> dict[str, Any] | None:
+        """Read and replay the journal."""
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                if not (size := os.fstat(fdesc.fileno()).st_size):
+                    return None
+                with mmap.mmap(fdesc.fileno(), 0, access=mmap.ACCESS_READ) as journal:
+                    entries = self._read_journal_entries(journal, size)
+        except FileNotFoundError:
+            return None
+
+        if not entries:
+            return None
+        header = entries[0]
+        records: dict[_JournalKey, Any] = {}
+        snapshot: str | None = None
+        snapshot_current = False
+        for entry in entries[1:]:
+            if isinstance(entry, dict):
+                snapshot = entry["snapshot"]
+                snapshot_current = entry["current"]
+                continue
+            snapshot_current = False
+            if len(entry) == 2:
+                records.pop((entry[0], entry[1]), None)
+            else:
+                records[(entry[0], entry[1])] = entry[2]
+
+        if (digest := self._snapshot_digest()) is not None and digest != snapshot:
+            _LOGGER.info(
+                "Loading %s from %s which was written by another version",
+                self.key,
+                self.path,
+            )
+            self._journal_header = None
+            return None
+        self._snapshot_current = snapshot_current
+
+        digests = self._journal_digests = {}
+        for key, value in records.items():
+            digests[_journal_digest(key[0], json_helper.json_bytes(value))] = key
+
+        data: Any
+        if (sections := header["sections"]) is None:
+            data = list(records.values())
+        else:
+            data = {section: [] for section in sections}
+            for (section, record_id), value in records.items():
+                if record_id is None:
+                    data[section] = value
+                else:
+                    data[section].append(value)
+        return {
+            "version": header["version"],
+            "minor_version": header["minor_version"],
+            "key": header["key"],
+            "data": data,
+        }
+
+    def _snapshot_digest(self) -> str | None:
+        """Return the digest of the JSON file."""
+        try:
+            with open(self.path, "rb") as fdesc:
+                return hashlib.file_digest(fdesc, _snapshot_hash).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def _write_snapshot(self) -> None:
+        """Write the data in the journal to the JSON file."""
+        if (data := self._read_journal()) is None:
+            return
+        _LOGGER.debug("Writing snapshot of %s to %s", self.key, self.path)
+        json_helper.save_json(
+            self.path, data, self._private, atomic_writes=self._atomic_writes
+        )
+        if self._journal_header is None:
+            # The journal is rewritten on the next save
+            return
+        self._append_journal(
+            [
+                _journal_frame(
+                    json_helper.json_bytes(
+                        {"snapshot": self._snapshot_digest(), "current": True}
+                    )
+                )
+            ]
+        )
+        self._snapshot_current = True
+
+    def _read_journal_entries(self, journal: mmap.mmap, size: int) -> list[Any]:
+        """Decode the entries of the journal."""
+        entries: list[Any] = []
+        offset = 0
+        while offset + _JOURNAL_FRAME.size <= size:
+            (length,) = _JOURNAL_FRAME.unpack_from(journal, offset)
+            start = offset + _JOURNAL_FRAME.size
+            if start + length > size:
+                break
+            try:
+                entries.append(json_util.json_loads(journal[start : start + length]))
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                break
+            offset = start + length
+
+        if offset != size:
+            _LOGGER.warning(
+                "Ignoring the last %s bytes of %s which were not completely written",
+                size - offset,
+                self.journal_path,
+            )
+        # A journal which was not completely written is rewritten on next save
+        self._journal_size = offset
+        if entries and offset == size:
+            self._journal_header = json_helper.json_bytes(entries[0])
+        return entries
+
+    def _iter_journal_payloads(
+        self, data: Mapping[str, Any] | Sequence[Any]
+    ) -> Iterator[tuple[str | None, bool, bytes]]:
+        """Yield the section, whether it is a list item, and the JSON of records."""
+        json_bytes = json_helper.json_bytes
+        if not isinstance(data, Mapping):
+            for item in data:
+                yield None, True, json_bytes(item)
+            return
+        for section, value in data.items():
+            if isinstance(value, list):
+                for item in value:
+                    yield section, True, json_bytes(item)
+            else:
+                yield section, False, json_bytes(value)
+
+    def _write_data(self, path: str, data: dict) -> None:
+        """Append the changed records to the journal."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        if "data_func" in data:
+            data["data"] = data.pop("data_func")()
+
+        stored = data["data"]
+        header = json_helper.json_bytes(
+            {
+                "version": data["version"],
+                "minor_version": data["minor_version"],
+                "key": data["key"],
+                "sections": [
+                    section
+                    for section, value in stored.items()
+                    if isinstance(value, list)
+                ]
+                if isinstance(stored, Mapping)
+                else None,
+            }
+        )
+        previous = self._journal_digests if header == self._journal_header else {}
+        digests: dict[bytes, _JournalKey] = {}
+        records: list[bytes] = [_journal_frame(header)]
+        appended: list[bytes] = []
+        try:
+            for section, is_item, payload in self._iter_journal_payloads(stored):
+                digest = _journal_digest(section, payload)
+                if (key := previous.get(digest)) is None:
+                    record_id = self._journal_record_id(payload) if is_item else None
+                    key = (section, record_id)
+                frame = _journal_frame(_journal_entry(key, payload))
+                if digest not in previous:
+                    appended.append(frame)
+                digests[digest] = key
+                records.append(frame)
+        except TypeError as err:
+            msg = f"Failed to serialize to JSON: {self.journal_path}: {err}"
+            _LOGGER.error(msg)
+            raise json_util.SerializationError(msg) from err
+
+        live_keys = set(digests.values())
+        appended.extend(
+            _journal_frame(json_helper.json_bytes(key))
+            for key in set(previous.values()).difference(live_keys)
+        )
+        live_size = sum(len(frame) for frame in records)
+        journal_size = self._journal_size + sum(len(frame) for frame in appended)
+        compact = (
+            header != self._journal_header
+            or journal_size > JOURNAL_COMPACT_RATIO * live_size
+        )
+
+        _LOGGER.debug(
+            "Writing %s of %s records for %s to %s",
+            len(records) - 1 if compact else len(appended),
+            len(records) - 1,
+            self.key,
+            self.journal_path,
+        )
+        # Forget the journal state until it is written so a failed
+        # write is followed by a complete rewrite
+        self._journal_header = None
+        if compact:
+            # The JSON file is older than the records from here on
+            records.insert(
+                1,
+                _journal_frame(
+                    json_helper.json_bytes(
+                        {"snapshot": self._snapshot_digest(), "current": False}
+                    )
+                ),
+            )
+            method = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+            method(self.journal_path, b"".join(records), self._private, mode="wb")
+            self._snapshot_current = False
+            self._journal_size = sum(len(frame) for frame in records)
+        elif appended:
+            self._append_journal(appended)
+            self._snapshot_current = False
+        self._journal_header = header
+        self._journal_digests = digests
+
+    def _append_journal(self, frames: list[bytes]) -> None:
+        """Append entries to the journal."""
+        try:
+            with open(self.journal_path, "ab") as fdesc:
+                fdesc.write(b"".join(frames))
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        self._journal_size += sum(len(frame) for frame in frames)
+
+    async def async_remove(self) -> None:
+        """Remove all data."""
+        await super().async_remove()
+        self._journal_header = None
+        self._journal_digests = {}
+        self._snapshot_current = True
+        with suppress(FileNotFoundError):
+            await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _journal_digest(section: str | None, payload: bytes) -> bytes:
+    """Return the digest of a journal record."""
+    digest = hashlib.blake2b(payload, digest_size=16)
+    if section is not None:
+        digest.update(section.encode())
+    return digest.digest()
+
+
+def _snapshot_hash() -> hashlib.blake2b:
+    """Return the hash used for the digest of the JSON file."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _journal_entry(key: _JournalKey, payload: bytes) -> bytes:
+    """Return a journal entry adding or replacing a record."""
+    return b"".join((json_helper.json_bytes(key)[:-1], b",", payload, b"]"))
+
+
+def _journal_frame(entry: bytes) -> bytes:
+    """Return a length prefixed journal entry."""
+    return _JOURNAL_FRAME.pack(len(entry)) + entry
@@ -11,8 +11,11 @@ from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -39,6 +42,7 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
@@ -48,6 +52,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -82,6 +87,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .start import async_at_started
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -99,6 +105,14 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILED_CODE_CACHE: HassKey[_CompiledCodeCache] = HassKey(
+    "template.compiled_code_cache"
+)
+
+COMPILED_CODE_STORAGE_KEY = "core.template_compiled_code"
+COMPILED_CODE_STORAGE_VERSION = 1
+COMPILED_CODE_SAVE_DELAY = 60
+MAX_PERSISTED_COMPILED_CODE = 1024
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -110,15 +124,18 @@ _RESERVED_NAMES = {
     "jinja_pass_arg",
 }
 
-_COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+# State attributes collected when accessed from a template, mapped to
+# the field of the state they depend on, None if they only depend on
+# the entity existing.
+_COLLECTABLE_STATE_ATTRIBUTES: dict[str, str | None] = {
+    "state": "state",
+    "attributes": "attributes",
+    "last_changed": "last_changed",
+    "last_updated": "last_updated",
+    "context": "context",
+    "domain": None,
+    "object_id": None,
+    "name": f"attributes.{ATTR_FRIENDLY_NAME}",
 }
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
@@ -178,8 +195,111 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+class _CompiledCodeCache:
+    """Compiled code of the templates used while Home Assistant starts.
+
+    Entries are keyed by the flavour of the environment and a hash of the
+    template source. Only the code used until Home Assistant has started is
+    persisted, once, to speed up the next start. The persisted code is
+    discarded when Home Assistant, Python or Jinja is upgraded since the
+    code depends on all of them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .storage import Store
+
+        self._store = Store[dict[str, Any]](
+            hass,
+            COMPILED_CODE_STORAGE_VERSION,
+            COMPILED_CODE_STORAGE_KEY,
+            private=True,
+        )
+        self._runtime = (
+            f"{HA_VERSION}-{sys.version}-{MAGIC_NUMBER.hex()}-{jinja2.__version__}"
+        )
+        # Base64 encoded marshalled code loaded from the store
+        self._persisted: dict[str, str] = {}
+        # Base64 encoded marshalled code used while starting
+        self._startup: dict[str, str] = {}
+        self._started = False
+
+    async def async_load(self) -> None:
+        """Load the persisted code."""
+        if (data := await self._store.async_load()) is None:
+            return
+        if data.get("runtime") != self._runtime:
+            _LOGGER.debug(
+                "Discarding template code compiled by %s", data.get("runtime")
+            )
+            await self._store.async_remove()
+            return
+        self._persisted = data["code"]
+
+    def get(self, flavour: str, source: str) -> CodeType | None:
+        """Return the persisted code of a template."""
+        if self._started:
+            return None
+        key = _compiled_code_key(flavour, source)
+        if (code := self._persisted.get(key)) is None:
+            return None
+        try:
+            compiled = marshal.loads(base64.b64decode(code))
+        except (EOFError, TypeError, ValueError):
+            compiled = None
+        if type(compiled) is not CodeType:
+            self._persisted.pop(key, None)
+            return None
+        self._add_startup_code(key, code)
+        return compiled
+
+    def add(self, flavour: str, source: str, compiled: CodeType) -> None:
+        """Persist the code of a template compiled while starting."""
+        if self._started:
+            return
+        self._add_startup_code(
+            _compiled_code_key(flavour, source),
+            base64.b64encode(marshal.dumps(compiled)).decode(),
+        )
+
+    def _add_startup_code(self, key: str, code: str) -> None:
+        """Add code used while starting."""
+        if len(self._startup) < MAX_PERSISTED_COMPILED_CODE:
+            self._startup[key] = code
+
+    @callback
+    def async_started(self) -> None:
+        """Stop collecting code and save the code used while starting."""
+        self._started = True
+        if self._startup.keys() != self._persisted.keys():
+            self._store.async_delay_save(self._data_to_save, COMPILED_CODE_SAVE_DELAY)
+        self._persisted = {}
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"runtime": self._runtime, "code": self._startup}
+
+
+def _compiled_code_key(flavour: str, source: str) -> str:
+    """Return the key of the compiled code of a template."""
+    return f"{flavour}-{hashlib.sha256(source.encode()).hexdigest()}"
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
+    compiled_code_cache = hass.data[_COMPILED_CODE_CACHE] = _CompiledCodeCache(hass)
+    hass.async_create_task(
+        compiled_code_cache.async_load(), "load template compiled code"
+    )
+
+    @callback
+    def _async_compiled_code_started(_: HomeAssistant) -> None:
+        """Save the compiled code of the templates used while starting."""
+        compiled_code_cache.async_started()
+
+    async_at_started(hass, _async_compiled_code_started)
 
     @callback
     def _async_adjust_lru_sizes(_: Any) -> None:
@@ -372,6 +492,8 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_fields",
+        "state_fields",
         "rate_limit",
         "has_time",
     )
@@ -390,6 +512,12 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Fields of the states of entities the render depends on, None
+        # if it may depend on any field
+        self.entity_fields: dict[str, set[str] | None] = {}
+        # Fields the render depends on for states of the tracked domains
+        # or all states, None if it may depend on any field
+        self.state_fields: set[str] | None = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -432,6 +560,27 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def fields_trigger_rerender(
+        self, entity_id: str, changed_fields: collections.abc.Set[str]
+    ) -> bool:
+        """Template should re-render if the changed fields of a state are used.
+
+        Only for state changes of entities accepted by the filter
+        that are not added or removed.
+        """
+        if self.exception is not None:
+            return True
+        if entity_id in self.entities and (
+            (fields := self.entity_fields.get(entity_id)) is None
+            or not fields.isdisjoint(changed_fields)
+        ):
+            return True
+        if self.all_states or split_entity_id(entity_id)[0] in self.domains:
+            return (
+                state_fields := self.state_fields
+            ) is None or not state_fields.isdisjoint(changed_fields)
+        return False
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -531,6 +680,8 @@ class Template:
             ret = self.hass.data[wanted_env] = TemplateEnvironment(
                 self.hass, self._limited, self._strict, self._log_fn
             )
+            # Only the shared environments persist their compiled code
+            ret.compiled_code_cache = self.hass.data.get(_COMPILED_CODE_CACHE)
         return ret
 
     def ensure_valid(self) -> None:
@@ -1005,17 +1156,43 @@ class TemplateStateBase(State):
         self._entity_id = entity_id
 
     def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                render_info.entity_fields[self._entity_id] = None
+            else:
+                render_info.state_fields = None
+
+    def _collect_field(self, field: str | None) -> None:
+        """Collect the state depending only on one field or its existence."""
+        if not (render_info := _render_info.get()):
+            return
+        if not self._collect:
+            if (
+                field is not None
+                and (state_fields := render_info.state_fields) is not None
+            ):
+                state_fields.add(field)
+            return
+        entity_id = self._entity_id
+        render_info.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_fields = render_info.entity_fields
+        if entity_id not in entity_fields:
+            entity_fields[entity_id] = set() if field is None else {field}
+        elif field is not None and (fields := entity_fields[entity_id]) is not None:
+            fields.add(field)
+
+    def _get_attribute(self, name: str) -> Any:
+        """Return a single attribute."""
+        self._collect_field(f"attributes.{name}")
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            self._collect_field(_COLLECTABLE_STATE_ATTRIBUTES[item])
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1034,55 +1211,55 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_field("state")
         return self._state.state
 
     @property
     def attributes(self) -> ReadOnlyDict[str, Any]:  # type: ignore[override]
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_field("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_field("last_changed")
         return self._state.last_changed
 
     @property
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
-        self._collect_state()
+        self._collect_field("last_reported")
         return self._state.last_reported
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_field("last_updated")
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_field("context")
         return self._state.context
 
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_field(None)
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_field(None)
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_field(f"attributes.{ATTR_FRIENDLY_NAME}")
         return self._state.name
 
     @property
@@ -1127,6 +1304,12 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        if render_info := _render_info.get():
+            # The representation includes every field of the state
+            if self._collect:
+                render_info.entity_fields[self._entity_id] = None
+            else:
+                render_info.state_fields = None
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -1157,6 +1340,7 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
         entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect.entity_fields[entity_id] = None
 
 
 def _state_generator(
@@ -1837,7 +2021,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -2761,6 +2945,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.compiled_code_cache: _CompiledCodeCache | None = None
+        self.flavour = "limited" if limited else "strict" if strict else "default"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3111,7 +3297,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (cache := self.compiled_code_cache) is None or not isinstance(source, str):
+            compiled = super().compile(source)
+        elif (compiled := cache.get(self.flavour, source)) is None:
+            compiled = super().compile(source)
+            cache.add(self.flavour, source, compiled)
         self.template_cache[source] = compiled
         return compiled
 
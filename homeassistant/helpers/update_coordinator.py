@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from contextlib import nullcontext
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from random import randint
@@ -44,6 +46,25 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class DataUpdateCoordinatorMetrics:
+    """Metrics of a DataUpdateCoordinator."""
+
+    refreshes: int = 0
+    last_refresh_duration: float | None = None
+    total_refresh_duration: float = 0.0
+    # Listeners at the last update and how many of them were called
+    listeners: int = 0
+    listeners_updated: int = 0
+
+    @property
+    def listeners_updated_ratio(self) -> float | None:
+        """Return the share of listeners called at the last update."""
+        if not self.listeners:
+            return None
+        return self.listeners_updated / self.listeners
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -60,6 +81,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`skip_unchanged_contexts` to ``True`` will cause coordinator
+    to skip listeners whose context is a key of the data when the value for
+    that key has not changed. This requires that the data is a mapping.
+
+    Setting :attr:`batch_state_writes` to ``True`` will cause state writes of
+    entities made while listeners are called to be set in the state machine
+    at once after all listeners have been called.
     """
 
     def __init__(
@@ -72,6 +101,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        skip_unchanged_contexts: bool = False,
+        batch_state_writes: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -83,6 +114,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.skip_unchanged_contexts = skip_unchanged_contexts
+        self.batch_state_writes = batch_state_writes
+        self.metrics = DataUpdateCoordinatorMetrics()
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -161,8 +195,37 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        self._async_update_listeners(None)
+
+    @callback
+    def _async_update_listeners(self, previous_data: Any) -> None:
+        """Update registered listeners.
+
+        If previous_data is a mapping, listeners whose context is a key
+        with the same value in previous_data and data are skipped.
+        """
+        data = self.data
+        compare = isinstance(previous_data, Mapping) and isinstance(data, Mapping)
+        listeners = list(self._listeners.values())
+        listeners_updated = 0
+        with (
+            entity.async_batch_state_writes(self.hass)
+            if self.batch_state_writes
+            else nullcontext()
+        ):
+            for update_callback, context in listeners:
+                if (
+                    compare
+                    and context is not None
+                    and context in data
+                    and context in previous_data
+                    and data[context] == previous_data[context]
+                ):
+                    continue
+                listeners_updated += 1
+                update_callback()
+        self.metrics.listeners = len(listeners)
+        self.metrics.listeners_updated = listeners_updated
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -301,8 +364,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
+        log_timing = self.logger.isEnabledFor(logging.DEBUG)
+        start = monotonic()
 
         auth_failed = False
         previous_update_success = self.last_update_success
@@ -388,11 +451,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            duration = monotonic() - start
+            metrics = self.metrics
+            metrics.refreshes += 1
+            metrics.last_refresh_duration = duration
+            metrics.total_refresh_duration += duration
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,
+                    duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -408,7 +476,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             or self.last_update_success != previous_update_success
             or previous_data != self.data
         ):
-            self.async_update_listeners()
+            self._async_update_listeners(
+                previous_data
+                if self.skip_unchanged_contexts
+                and self.last_update_success == previous_update_success
+                else None
+            )
 
     @callback
     def _async_refresh_finished(self) -> None:
@@ -434,6 +507,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
+        previous_data = self.data
+        previous_update_success = self.last_update_success
         self.data = data
         self.last_update_success = True
         self.logger.debug(
@@ -444,7 +519,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._listeners:
             self._schedule_refresh()
 
-        self.async_update_listeners()
+        self._async_update_listeners(
+            previous_data
+            if self.skip_unchanged_contexts and previous_update_success
+            else None
+        )
 
 
 class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
@@ -17,9 +17,10 @@ import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Protocol, TypedDict, cast
 
 from awesomeversion import (
     AwesomeVersion,
@@ -80,6 +81,23 @@ BASE_PRELOAD_PLATFORMS = [
     "trigger",
 ]
 
+#
+# The integrations processing the base preload platforms. These platforms
+# are only preloaded when the integration processing them is going to be
+# set up, otherwise they are imported when they are first needed.
+#
+BASE_PRELOAD_PLATFORM_CONSUMERS = {
+    **{
+        platform: platform
+        for platform in BASE_PRELOAD_PLATFORMS
+        if platform != "config_flow"
+    },
+    "trigger": "automation",
+}
+
+# Log imports which block the event loop for longer than this many seconds
+SLOW_LOOP_IMPORT_THRESHOLD = 0.5
+
 
 @dataclass
 class BlockedIntegration:
@@ -115,6 +133,7 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, ImportTiming]] = HassKey("import_timings")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -252,6 +271,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -626,6 +646,23 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
     return mqtt
 
 
+class ImportTiming(NamedTuple):
+    """How long importing a module of an integration took.
+
+    The time includes importing the modules it imports which were not
+    imported yet.
+    """
+
+    seconds: float
+    in_event_loop: bool
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, ImportTiming]:
+    """Return how long importing each module of the integrations took."""
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
 @callback
 def async_register_preload_platform(hass: HomeAssistant, platform_name: str) -> None:
     """Register a platform to be preloaded."""
@@ -758,6 +795,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1046,9 +1084,7 @@ class Integration:
         cache = self._cache
         domain = self.domain
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[domain] = cast(ComponentProtocol, self._import(self.pkg_path))
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1061,12 +1097,59 @@ class Integration:
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
         if preload_platforms:
-            for platform_name in self.platforms_exists(self._platforms_to_preload):
+            for platform_name in self.platforms_exists(
+                self._needed_platforms_to_preload()
+            ):
                 with suppress(ImportError):
                     self.get_platform(platform_name)
 
         return cache[domain]
 
+    def _needed_platforms_to_preload(self) -> list[str]:
+        """Return the platforms to preload which are going to be processed.
+
+        A platform is processed when the integration consuming it is set up,
+        being set up or going to be set up from the configuration.
+
+        This method is thread-safe as it only does membership checks.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .setup import DATA_SETUP, DATA_SETUP_DONE
+
+        hass = self.hass
+        components = hass.config.components
+        setup_tasks = hass.data.get(DATA_SETUP, {})
+        to_be_loaded = hass.data.get(DATA_SETUP_DONE, {})
+        return [
+            platform_name
+            for platform_name in self._platforms_to_preload
+            if (consumer := BASE_PRELOAD_PLATFORM_CONSUMERS.get(platform_name)) is None
+            or consumer in components
+            or consumer in setup_tasks
+            or consumer in to_be_loaded
+        ]
+
+    def _import(self, name: str) -> ModuleType:
+        """Import a module of the integration and record how long it took.
+
+        This method must be thread-safe as it's called from the executor
+        and the event loop.
+        """
+        if name in sys.modules:
+            return importlib.import_module(name)
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        elapsed = time.perf_counter() - start
+        in_event_loop = threading.get_ident() == self.hass.loop_thread_id
+        self._import_timings[name] = ImportTiming(elapsed, in_event_loop)
+        if in_event_loop and elapsed > SLOW_LOOP_IMPORT_THRESHOLD:
+            _LOGGER.warning(
+                "Importing %s blocked the event loop for %.2f seconds",
+                name,
+                elapsed,
+            )
+        return module
+
     def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
         """Load platforms for an integration."""
         return {
@@ -1276,7 +1359,7 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import(f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
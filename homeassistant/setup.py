@@ -12,7 +12,7 @@ from functools import partial
 import logging.handlers
 import time
 from types import ModuleType
-from typing import Any, Final, TypedDict
+from typing import Any, Final, NamedTuple, TypedDict
 
 from typing_extensions import Generator
 
@@ -74,6 +74,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_SPANS is a list, indicating when each phase of setting
+# up a component started and finished.
+DATA_SETUP_SPANS: HassKey[list[SetupSpan]] = HassKey("setup_spans")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -667,6 +671,16 @@ class SetupPhases(StrEnum):
     """Wait time for the packages to import."""
 
 
+class SetupSpan(NamedTuple):
+    """When a phase of setting up a component started and finished."""
+
+    integration: str
+    group: str | None
+    phase: SetupPhases
+    started: float
+    finished: float
+
+
 @singleton.singleton(DATA_SETUP_STARTED)
 def _setup_started(
     hass: core.HomeAssistant,
@@ -718,6 +732,12 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_SPANS)
+def _setup_spans(hass: core.HomeAssistant) -> list[SetupSpan]:
+    """Return the setup spans list."""
+    return []
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -764,6 +784,9 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        _setup_spans(hass).append(
+            SetupSpan(integration, group, phase, started, started + time_taken)
+        )
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -804,6 +827,12 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_setup_spans(hass: core.HomeAssistant) -> list[SetupSpan]:
+    """Return when each setup phase started and finished."""
+    return _setup_spans(hass)
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
@@ -186,6 +186,31 @@ async def test_dhcp_match_hostname_and_macaddress(hass: HomeAssistant) -> None:
     )
 
 
+async def test_dhcp_match_hostname_in_shared_bucket(hass: HomeAssistant) -> None:
+    """Test matching a hostname glob that shares a bucket with other globs."""
+    integration_matchers = dhcp.async_index_integration_matchers(
+        [
+            {"domain": "not-matching", "hostname": "cam*"},
+            {"domain": "mock-domain", "hostname": "conn*"},
+            {"domain": "not-matching", "hostname": "c?nnected"},
+        ]
+    )
+    hostname_pattern = integration_matchers.no_oui_hostname_patterns["c"]
+    assert hostname_pattern.match("connect")
+    assert hostname_pattern.match("cinnected")
+    assert not hostname_pattern.match("chromecast")
+    packet = Ether(RAW_DHCP_REQUEST)
+
+    async_handle_dhcp_packet = await _async_get_handle_dhcp_packet(
+        hass, integration_matchers
+    )
+    with patch.object(hass.config_entries.flow, "async_init") as mock_init:
+        await async_handle_dhcp_packet(packet)
+
+    assert len(mock_init.mock_calls) == 1
+    assert mock_init.mock_calls[0][1][0] == "mock-domain"
+
+
 async def test_dhcp_renewal_match_hostname_and_macaddress(hass: HomeAssistant) -> None:
     """Test renewal matching based on hostname and macaddress."""
     integration_matchers = dhcp.async_index_integration_matchers(
@@ -172,6 +172,129 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    minimal_response: bool,
+    chunk_size: int,
+) -> None:
+    """Test history_during_period sends the same states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state, attr in (
+        ("on", "attr"),
+        ("off", "attr"),
+        ("off", "changed"),
+        ("on", "attr"),
+    ):
+        hass.states.async_set("sensor.test", state, attributes={"any": attr})
+        hass.states.async_set("sensor.other", state, attributes={"any": attr})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.test", "sensor.other"],
+        "significant_changes_only": False,
+        "minimal_response": minimal_response,
+    }
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.test"]) == len(expected["sensor.other"]) >= 3
+
+    states: dict[str, list] = {}
+    chunks = 0
+    # Each chunk is written before the next one is fetched,
+    # so the client is not disconnected for falling behind
+    with (
+        patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 3),
+        patch("homeassistant.components.websocket_api.http.PENDING_MSG_DRAINED", 0),
+    ):
+        await client.send_json({"id": 2, "chunk_size": chunk_size, **request})
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        assert response["result"] == {}
+
+        while (response := await client.receive_json())["event"].get("partial"):
+            assert response["id"] == 2
+            assert response["type"] == "event"
+            chunk = response["event"]["states"]
+            assert (
+                sum(len(chunk_states) for chunk_states in chunk.values()) <= chunk_size
+            )
+            for entity_id, chunk_states in chunk.items():
+                states.setdefault(entity_id, []).extend(chunk_states)
+            chunks += 1
+    assert response["id"] == 2
+    assert response["event"] == {"states": {}}
+    assert states == expected
+    total = sum(len(entity_states) for entity_states in expected.values())
+    # Duplicate states filtered out by minimal_response still count
+    # towards the rows fetched for a chunk
+    assert chunks >= -(-total // chunk_size)
+
+
+async def test_history_during_period_chunked_drain_timeout(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test history_during_period stops sending chunks to a client which falls behind."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "on"):
+        hass.states.async_set("sensor.test", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    async def _never_drained() -> None:
+        await asyncio.Event().wait()
+
+    with (
+        patch(
+            "homeassistant.components.websocket_api.http.WebSocketHandler._async_wait_for_drain",
+            side_effect=_never_drained,
+        ),
+        patch(
+            "homeassistant.components.history.websocket_api.HISTORY_CHUNK_DRAIN_TIMEOUT",
+            0,
+        ),
+    ):
+        client = await hass_ws_client()
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "chunk_size": 1,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["partial"]
+        assert len(response["event"]["states"]["sensor.test"]) == 1
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"]["code"] == "timeout"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -571,6 +571,79 @@ async def test_non_duplicate_discovery(
     assert "Component has already been discovered: binary_sensor bla" in caplog.text
 
 
+async def test_unchanged_discovery_payload_skipped(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a replayed discovery payload is not processed again."""
+    await mqtt_mock_entry()
+    config = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(
+        hass, "homeassistant/binary_sensor/bla/config", config, retain=True
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object"
+    ) as mock_json_loads:
+        async_fire_mqtt_message(
+            hass, "homeassistant/binary_sensor/bla/config", config, retain=True
+        )
+        await hass.async_block_till_done()
+    assert not mock_json_loads.called
+    assert (
+        "Component has already been discovered: binary_sensor bla, payload unchanged"
+        in caplog.text
+    )
+
+    # A changed payload is still applied
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/binary_sensor/bla/config",
+        '{ "name": "Milk", "state_topic": "test-topic" }',
+        retain=True,
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("binary_sensor.beer")
+    assert state is not None
+    assert state.name == "Milk"
+
+    # The same payload is processed again after the component was removed
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is None
+    async_fire_mqtt_message(
+        hass, "homeassistant/binary_sensor/bla/config", config, retain=True
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+
+async def test_discovery_burst_sets_up_platform_once(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test components discovered while their platform is set up are all added."""
+    await mqtt_mock_entry()
+    with patch(
+        "homeassistant.components.mqtt.discovery.async_forward_entry_setup_and_setup_discovery",
+        wraps=mqtt.discovery.async_forward_entry_setup_and_setup_discovery,
+    ) as mock_setup:
+        for name in ("beer", "milk", "wine"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/{name}/config",
+                json.dumps({"name": name.title(), "state_topic": "test-topic"}),
+                retain=True,
+            )
+        await hass.async_block_till_done()
+
+    assert len(mock_setup.mock_calls) == 1
+    for name in ("beer", "milk", "wine"):
+        assert hass.states.get(f"binary_sensor.{name}") is not None
+
+
 async def test_removal(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
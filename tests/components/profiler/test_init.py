@@ -27,16 +27,23 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOOP_LATENCY,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOOP_LATENCY,
 )
-from homeassistant.components.profiler.const import DOMAIN
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.components.profiler.const import (
+    DOMAIN,
+    LOOP_LATENCY,
+    LOOP_LATENCY_TOP_OFFENDERS,
+)
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +453,88 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_loop_latency(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test sampling the latency of jobs run in the event loop."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    sensor_entity_id = "sensor.profiler_loop_latency_offender_1"
+    assert hass.states.get(sensor_entity_id).state == STATE_UNAVAILABLE
+
+    events: list[Event] = []
+
+    @callback
+    def _listener(event: Event) -> None:
+        events.append(event)
+
+    hass.bus.async_listen("test_loop_latency", _listener)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_LOOP_LATENCY, {CONF_SCAN_INTERVAL: 10}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="sampling already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_LOOP_LATENCY, {}, blocking=True
+        )
+
+    for _ in range(3):
+        hass.bus.async_fire("test_loop_latency")
+    await hass.async_block_till_done()
+    assert len(events) == 3
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_latency", "limit": 100})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["running"] is True
+    offenders = {
+        offender["target"]: offender for offender in response["result"]["top_offenders"]
+    }
+    listener_offender = offenders[f"{__name__}.{_listener.__qualname__}"]
+    assert listener_offender["count"] == 3
+    assert listener_offender["p50"] <= listener_offender["p99"]
+    assert listener_offender["p99"] <= listener_offender["max"]
+
+    # The offenders are ranked once for all the sensors
+    loop_latency = hass.data[DOMAIN][LOOP_LATENCY]
+    with patch.object(
+        loop_latency,
+        "async_top_offenders",
+        wraps=loop_latency.async_top_offenders,
+    ) as mock_top_offenders:
+        freezer.tick(timedelta(seconds=11))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    mock_top_offenders.assert_called_once_with(LOOP_LATENCY_TOP_OFFENDERS)
+
+    state = hass.states.get(sensor_entity_id)
+    assert float(state.state) >= 0
+    assert state.attributes["count"] >= 1
+    assert "state_class" not in state.attributes
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LOOP_LATENCY, {}, blocking=True)
+    assert "async_run_hass_job" not in vars(hass)
+    assert hass.states.get(sensor_entity_id).state == STATE_UNAVAILABLE
+
+    with pytest.raises(HomeAssistantError, match="sampling not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_LOOP_LATENCY, {}, blocking=True
+        )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/loop_latency"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
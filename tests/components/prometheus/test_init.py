@@ -196,6 +196,50 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_caches_entity_metrics(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test the entity metrics are only rendered again after a change."""
+    with mock.patch.object(
+        prometheus.prometheus_client,
+        "generate_latest",
+        wraps=prometheus_client.generate_latest,
+    ) as generate_latest:
+        body = await generate_latest_metrics(client)
+        assert generate_latest.call_count == 2
+
+        assert await generate_latest_metrics(client) == body
+        assert generate_latest.call_count == 3
+
+        set_state_with_entry(hass, sensor_entities["sensor_1"], 17.2)
+        set_state_with_entry(hass, sensor_entities["sensor_2"], 60)
+        await hass.async_block_till_done()
+
+        body = await generate_latest_metrics(client)
+        assert generate_latest.call_count == 5
+
+        # Removing a state does not change the entity metrics
+        hass.states.async_remove(sensor_entities["sensor_1"].entity_id)
+        await hass.async_block_till_done()
+        await generate_latest_metrics(client)
+        assert generate_latest.call_count == 6
+
+    assert "# HELP python_info Python platform information" in body
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 17.2' in body
+    )
+    assert (
+        'sensor_humidity_percent{domain="sensor",'
+        'entity="sensor.outside_humidity",'
+        'friendly_name="Outside Humidity"} 60.0' in body
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
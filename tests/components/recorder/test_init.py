@@ -292,6 +292,64 @@ async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+async def test_saving_state_burst(hass: HomeAssistant, setup_recorder: None) -> None:
+    """Test saving a burst of states queued while the recorder is busy."""
+    instance = recorder.get_instance(hass)
+    await async_block_recorder(hass, 0.5)
+
+    with (
+        patch.object(
+            instance,
+            "_pre_process_event_block",
+            wraps=instance._pre_process_event_block,
+        ) as pre_process_event_block_mock,
+        patch.object(
+            StateAttributes,
+            "shared_attrs_bytes_from_event",
+            wraps=StateAttributes.shared_attrs_bytes_from_event,
+        ) as shared_attrs_bytes_from_event_mock,
+    ):
+        for change in range(3):
+            for idx in range(10):
+                hass.states.async_set(
+                    f"test.recorder_{idx}", str(change), {"change": change, "idx": idx}
+                )
+            hass.bus.async_fire("test_event", {"change": change})
+        await async_wait_recording_done(hass)
+
+    assert pre_process_event_block_mock.call_count >= 1
+    assert len(pre_process_event_block_mock.call_args_list[0][0][0]) > 1
+    # The attributes serialized for the block are reused when processing
+    assert shared_attrs_bytes_from_event_mock.call_count == 30
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = []
+        for db_state, db_state_attributes, states_meta in (
+            session.query(States, StateAttributes, StatesMeta)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        ):
+            db_state.entity_id = states_meta.entity_id
+            state = db_state.to_native()
+            state.attributes = db_state_attributes.to_native()
+            db_states.append(state)
+        assert len(db_states) == 30
+        for state in db_states:
+            assert state.attributes == {
+                "change": int(state.state),
+                "idx": int(state.entity_id.rsplit("_", 1)[1]),
+            }
+        assert session.query(StateAttributes).count() == 30
+        assert (
+            session.query(Events)
+            .filter(Events.event_type_id.in_(select_event_type_ids(("test_event",))))
+            .count()
+            == 3
+        )
+
+
 @pytest.mark.parametrize(
     ("db_engine", "expected_attributes"),
     [
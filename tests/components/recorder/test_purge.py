@@ -25,7 +25,11 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    PurgeProgress,
+    _id_ranges,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -105,6 +109,93 @@ async def test_purge_big_database(
         assert state_attributes.count() == 1
 
 
+async def test_purge_time_budget(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the purge yields after one batch when the time budget is exceeded."""
+
+    instance = await async_setup_recorder_instance(hass)
+
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before)
+    with (
+        patch.object(instance, "max_bind_vars", 8),
+        patch.object(instance.database_engine, "max_bind_vars", 8),
+        patch.object(instance, "purge_time_budget", 0),
+        session_scope(hass=hass) as session,
+    ):
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        assert states.count() == 72
+        assert state_attributes.count() == 3
+
+        for run in range(1, 7):
+            assert not purge_old_data(
+                instance, purge_before, repack=False, progress=progress
+            )
+            assert progress.runs == run
+            assert progress.states == run * 8
+            assert states.count() == 72 - run * 8
+
+        assert purge_old_data(instance, purge_before, repack=False, progress=progress)
+        assert progress.finished
+        assert progress.runs == 7
+        assert progress.states == 48
+        assert progress.state_attributes == 2
+        assert progress.rows == 50
+        assert progress.rows_per_second > 0
+        assert states.count() == 24
+        assert state_attributes.count() == 1
+
+
+async def test_purge_rolled_back_keeps_progress(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge which is rolled back does not advance the progress."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+    await async_wait_recording_done(hass)
+
+    mysql_exception = OperationalError("statement", {}, [])
+    mysql_exception.orig = Exception(1205, "retryable")
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before)
+    with (
+        patch("homeassistant.components.recorder.util.time.sleep"),
+        patch(
+            "homeassistant.components.recorder.purge._purge_old_recorder_runs",
+            side_effect=mysql_exception,
+        ),
+        patch.object(instance.engine.dialect, "name", "mysql"),
+    ):
+        assert not purge_old_data(
+            instance, purge_before, repack=False, progress=progress
+        )
+
+    assert progress.states == 0
+    assert progress.states_start_ts == 0.0
+
+    assert purge_old_data(instance, purge_before, repack=False, progress=progress)
+    assert progress.states == 4
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
+def test_id_ranges_sparse_ids() -> None:
+    """Test sparse ids are not split into a range each."""
+    dense = set(range(1000, 1450))
+    sparse = {1, 5000, 9000, 20000}
+    ranges, sparse_ids = _id_ranges(dense | sparse, 400, 100)
+    assert ranges == [(1000, 1399)]
+    assert sparse_ids == sparse | set(range(1400, 1450))
+    assert _id_ranges(set(), 400, 100) == ([], set())
+
+
 async def test_purge_old_states(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
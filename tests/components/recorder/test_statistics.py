@@ -313,20 +313,20 @@ def mock_sensor_statistics():
 
 @pytest.fixture
 def mock_from_stats():
-    """Mock out Statistics.from_stats."""
+    """Mock out Statistics.row_from_stats."""
     counter = 0
-    real_from_stats = StatisticsShortTerm.from_stats
+    real_row_from_stats = StatisticsShortTerm.row_from_stats
 
-    def from_stats(metadata_id, stats):
+    def row_from_stats(metadata_id, stats):
         nonlocal counter
         if counter == 0 and metadata_id == 2:
             counter += 1
-            return None
-        return real_from_stats(metadata_id, stats)
+            raise ValueError
+        return real_row_from_stats(metadata_id, stats)
 
     with patch(
-        "homeassistant.components.recorder.statistics.StatisticsShortTerm.from_stats",
-        side_effect=from_stats,
+        "homeassistant.components.recorder.statistics.StatisticsShortTerm.row_from_stats",
+        side_effect=row_from_stats,
         autospec=True,
     ):
         yield
@@ -374,6 +374,122 @@ async def test_compile_periodic_statistics_exception(
     }
 
 
+async def test_compile_hourly_statistics_from_accumulator(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test hourly statistics are compiled from the in-memory accumulator."""
+    await async_setup_component(hass, "sensor", {})
+    hour_start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    hour_start -= timedelta(hours=1)
+
+    def get_fake_stats(_hass, session, start, _end):
+        index = int((start - hour_start).total_seconds() // 300)
+        return statistics.PlatformCompiledStatistics(
+            [
+                {
+                    "meta": {
+                        "has_mean": True,
+                        "has_sum": True,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.test1",
+                        "unit_of_measurement": "dogs",
+                    },
+                    "stat": {
+                        "start": start,
+                        "mean": float(index),
+                        "min": float(index - 1),
+                        "max": float(index + 1),
+                        "last_reset": None,
+                        "state": float(index),
+                        "sum": float(index * 2),
+                    },
+                }
+            ],
+            get_metadata(_hass, statistic_ids={"sensor.test1"}),
+        )
+
+    with (
+        patch(
+            "homeassistant.components.sensor.recorder.compile_statistics",
+            side_effect=get_fake_stats,
+        ),
+        patch.object(
+            statistics,
+            "_compile_hourly_statistics_summary_mean_stmt",
+            wraps=statistics._compile_hourly_statistics_summary_mean_stmt,
+        ) as summary_mean_stmt_mock,
+    ):
+        for index in range(12):
+            do_adhoc_statistics(hass, start=hour_start + timedelta(minutes=5 * index))
+        await async_wait_recording_done(hass)
+
+    assert summary_mean_stmt_mock.call_count == 0
+    stats = statistics_during_period(hass, hour_start, period="hour")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": hour_start.timestamp(),
+                "end": (hour_start + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(5.5),
+                "min": pytest.approx(-1.0),
+                "max": pytest.approx(12.0),
+                "last_reset": None,
+                "state": pytest.approx(11.0),
+                "sum": pytest.approx(22.0),
+            }
+        ]
+    }
+
+
+async def test_bulk_insert_statistics_skips_bad_rows(
+    hass: HomeAssistant, setup_recorder: None, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test rows which can not be inserted do not fail the rest of the batch."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    stat = {
+        "start": start,
+        "mean": 1.0,
+        "min": 0.0,
+        "max": 2.0,
+        "last_reset": None,
+        "state": None,
+        "sum": None,
+    }
+    with session_scope(hass=hass) as session:
+        session.add_all(
+            recorder.db_schema.StatisticsMeta.from_meta(
+                {
+                    "has_mean": True,
+                    "has_sum": False,
+                    "name": None,
+                    "source": "recorder",
+                    "statistic_id": f"sensor.test{idx}",
+                    "unit_of_measurement": "dogs",
+                }
+            )
+            for idx in (1, 2, 3)
+        )
+    with session_scope(hass=hass) as session:
+        statistics._bulk_insert_statistics(session, StatisticsShortTerm, [(1, stat)])
+
+    # The row of metadata_id 1 collides with the one inserted above, the
+    # second row of metadata_id 2 with the first and the last has no start
+    with session_scope(hass=hass) as session:
+        inserted = statistics._bulk_insert_statistics(
+            session,
+            StatisticsShortTerm,
+            [(1, stat), (2, stat), (2, stat), (3, {"mean": 1.0})],
+        )
+
+    assert inserted == [(2, stat)]
+    assert "Skipping statistics which already exist 1:" in caplog.text
+    assert "Skipping duplicate statistics 2:" in caplog.text
+    assert "Unexpected exception when inserting statistics 3:" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsShortTerm).count() == 2
+
+
 async def test_rename_entity(
     hass: HomeAssistant, entity_registry: er.EntityRegistry, setup_recorder: None
 ) -> None:
@@ -1824,6 +1940,88 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_reduce_statistics_in_db(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+    period: str,
+) -> None:
+    """Test statistics reduced by the database match the ones reduced in Python."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    # Cover the DST transition at the end of October
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-20 00:00:00"))
+    hours = 24 * 60
+    mean_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    sum_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        mean_metadata,
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "mean": hour % 17,
+                "min": hour % 13,
+                "max": hour % 19 + 10,
+            }
+            for hour in range(hours)
+        ],
+    )
+    async_add_external_statistics(
+        hass,
+        sum_metadata,
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "last_reset": None,
+                "state": hour % 7,
+                "sum": hour,
+            }
+            for hour in range(hours)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    for start_time, end_time, statistic_ids in (
+        (start, None, None),
+        (start + timedelta(days=3), start + timedelta(days=40), None),
+        (start, None, {"test:total_energy_import"}),
+    ):
+        with patch.object(
+            statistics,
+            "_generate_reduced_statistics_during_period_stmt",
+            wraps=statistics._generate_reduced_statistics_during_period_stmt,
+        ) as reduced_stmt_mock:
+            stats = statistics_during_period(
+                hass, start_time, end_time, statistic_ids, period=period
+            )
+        assert reduced_stmt_mock.called
+        with patch.object(statistics, "MAX_DB_REDUCED_PERIODS", 0):
+            expected_stats = statistics_during_period(
+                hass, start_time, end_time, statistic_ids, period=period
+            )
+        assert stats
+        assert stats == expected_stats
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -35,6 +35,10 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import (
+    _time_weighted_average,
+    _time_weighted_average_of_columns,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -215,6 +219,65 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_no_states_in_period(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test no statistics are compiled for an entity without states in the period."""
+    zero = dt_util.utcnow()
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+    # The first state of sensor.test2 is recorded after the period
+    with freeze_time(zero + timedelta(minutes=10)):
+        hass.states.async_set("sensor.test2", "20", attributes)
+    await async_wait_recording_done(hass)
+
+    do_adhoc_statistics(hass, start=zero)
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert list(stats) == ["sensor.test1"]
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+@pytest.mark.parametrize(
+    "offsets",
+    [
+        [-30, 5, 55, 255],
+        [5, 55, 255],
+        [0, 300],
+        [300],
+    ],
+)
+def test_time_weighted_average_of_columns(offsets: list[int]) -> None:
+    """Test the columnar time weighted average matches the State based one."""
+    start = dt_util.utcnow().replace(microsecond=0)
+    end = start + timedelta(minutes=5)
+    fstates = [float(10 * idx - 5) for idx in range(len(offsets))]
+    states = [
+        (
+            fstate,
+            State(
+                "sensor.test1",
+                str(fstate),
+                last_updated=start + timedelta(seconds=offset),
+            ),
+        )
+        for fstate, offset in zip(fstates, offsets, strict=True)
+    ]
+    timestamps = [(start + timedelta(seconds=offset)).timestamp() for offset in offsets]
+
+    assert _time_weighted_average_of_columns(
+        timestamps, fstates, start.timestamp(), end.timestamp()
+    ) == pytest.approx(_time_weighted_average(states, start, end))
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
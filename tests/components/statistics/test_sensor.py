@@ -449,6 +449,141 @@ async def test_sampling_size_reduced(hass: HomeAssistant) -> None:
     assert state.attributes.get("buffer_usage_ratio") == round(5 / 5, 2)
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "expected"),
+    [
+        ("median", statistics.median(VALUES_NUMERIC[-3:])),
+        ("percentile", statistics.quantiles(VALUES_NUMERIC[-3:], n=100)[49]),
+        ("standard_deviation", statistics.stdev(VALUES_NUMERIC[-3:])),
+        ("sum_differences", abs(14 - 6.7) + abs(6 - 14)),
+        ("value_max", max(VALUES_NUMERIC[-3:])),
+        ("value_min", min(VALUES_NUMERIC[-3:])),
+        ("variance", statistics.variance(VALUES_NUMERIC[-3:])),
+    ],
+)
+async def test_sampling_size_reduced_characteristics(
+    hass: HomeAssistant, characteristic: str, expected: float
+) -> None:
+    """Test characteristics stay correct when samples are evicted from the buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 3,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in VALUES_NUMERIC:
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert state is not None
+    assert state.state == str(float(round(expected, 2)))
+
+
+@pytest.mark.parametrize(
+    ("characteristic", "expected"),
+    [
+        ("mean", 20.0),
+        ("standard_deviation", 0.1),
+        ("variance", 0.01),
+    ],
+)
+async def test_sampling_size_evicted_outlier(
+    hass: HomeAssistant, characteristic: str, expected: float
+) -> None:
+    """Test characteristics recover once an outlier is evicted from the buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": characteristic,
+                    "sampling_size": 3,
+                    "precision": 4,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in (20.1, 1e9, 19.9, 20.0, 20.1, 19.9):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            str(value),
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert state is not None
+    assert state.state == str(expected)
+
+
+async def test_non_finite_values_ignored(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test NaN and infinite source values are not added to the buffer."""
+    assert await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": [
+                {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "state_characteristic": "median",
+                    "sampling_size": 3,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    for value in ("10", "nan", "20", "inf", "30", "-inf", "40", "50"):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            value,
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.test")
+    assert state is not None
+    assert state.state == "40.0"
+    assert state.attributes["source_value_valid"] is True
+    assert "received 'nan'" in caplog.text
+
+    hass.states.async_set(
+        "sensor.test_monitored",
+        "nan",
+        {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.test")
+    assert state.state == "40.0"
+    assert state.attributes["source_value_valid"] is False
+
+
 async def test_sampling_size_1(hass: HomeAssistant) -> None:
     """Test validity of stats requiring only one sample."""
     assert await async_setup_component(
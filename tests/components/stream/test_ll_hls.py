@@ -6,6 +6,8 @@ from http import HTTPStatus
 import itertools
 import math
 import re
+import threading
+from unittest.mock import patch
 from urllib.parse import urlparse
 
 from aiohttp import web
@@ -327,6 +329,97 @@ async def test_ll_hls_playlist_view(
     await stream.stop()
 
 
+async def test_ll_hls_shared_segment_data(
+    hass: HomeAssistant, hls_stream, stream_worker_sync
+) -> None:
+    """Test a complete segment is served from one buffer and the playlist is cached."""
+    await async_setup_component(
+        hass,
+        "stream",
+        {
+            "stream": {
+                CONF_LL_HLS: True,
+                CONF_SEGMENT_DURATION: SEGMENT_DURATION,
+                CONF_PART_DURATION: TEST_PART_DURATION,
+            }
+        },
+    )
+
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    segment = create_segment(sequence=0)
+    hls.put(segment)
+    parts = create_parts(SEQUENCE_BYTES)
+    for part in parts[:-1]:
+        segment.async_add_part(part, 0)
+        hls.part_put()
+    assert segment.get_data() is not segment.get_data()
+    segment.async_add_part(parts[-1], SEGMENT_DURATION)
+    hls.part_put()
+    await hass.async_block_till_done()
+
+    data = segment.get_data()
+    assert data == SEQUENCE_BYTES
+    assert segment.get_data() is data
+    assert all(part.data.obj is data for part in segment.parts)
+
+    segment = create_segment(sequence=1)
+    hls.put(segment)
+    parts = create_parts(ALT_SEQUENCE_BYTES)
+    segment.async_add_part(parts[0], 0)
+    hls.part_put()
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    resp = await hls_client.get("/segment/0.m4s")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == SEQUENCE_BYTES
+    resp = await hls_client.get("/segment/0.1.m4s")
+    assert resp.status == HTTPStatus.OK
+    assert await resp.read() == hls.get_segment(0).parts[1].data
+
+    resp = await hls_client.get("/playlist.m3u8")
+    assert resp.status == HTTPStatus.OK
+    playlist = hls.rendered_playlist
+    assert playlist is not None
+    assert make_hint(1, 1) in await resp.text()
+    resp = await hls_client.get("/playlist.m3u8")
+    assert resp.status == HTTPStatus.OK
+    assert hls.rendered_playlist is playlist
+
+    # A new part invalidates the rendered playlist
+    segment.async_add_part(parts[1], 0)
+    hls.part_put()
+    assert hls.rendered_playlist is None
+    resp = await hls_client.get("/playlist.m3u8")
+    assert resp.status == HTTPStatus.OK
+    assert make_hint(1, 2) in await resp.text()
+    assert hls.rendered_playlist is not None
+
+    # A discontinuity signalled by the worker thread completes the last
+    # segment in the event loop
+    join_threads = []
+    join_parts = type(segment).async_join_parts
+
+    def _join_parts(self) -> None:
+        join_threads.append(threading.get_ident())
+        join_parts(self)
+
+    with patch.object(type(segment), "async_join_parts", _join_parts):
+        await hass.async_add_executor_job(hls.discontinuity)
+        await hass.async_block_till_done()
+    assert join_threads == [hass.loop_thread_id]
+    assert hls.rendered_playlist is None
+    assert segment.complete
+    assert all(part.data.obj is segment.get_data() for part in segment.parts)
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_ll_hls_msn(
     hass: HomeAssistant, hls_stream, stream_worker_sync, hls_sync
 ) -> None:
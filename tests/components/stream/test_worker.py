@@ -35,12 +35,14 @@ from homeassistant.components.stream.const import (
     DOMAIN,
     HLS_PROVIDER,
     MAX_MISSING_DTS,
+    PACKET_RATE_SAMPLES,
     PACKETS_TO_WAIT_FOR_AUDIO,
     RECORDER_PROVIDER,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 from homeassistant.components.stream.core import Orientation, StreamSettings
+from homeassistant.components.stream.diagnostics import StreamMetrics
 from homeassistant.components.stream.worker import (
     StreamEndedError,
     StreamState,
@@ -971,6 +973,36 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
         "video_codec": "hevc",
         "worker_error": 1,
     }
+    metrics = stream.get_metrics()
+    assert metrics["packets"] > 0
+    assert metrics["decode_pool"]["active"] == 0
+
+
+def test_stream_metrics_packet_rate() -> None:
+    """Test the packet rate is measured since the oldest keyframe sample."""
+    with patch(
+        "homeassistant.components.stream.diagnostics.time.monotonic"
+    ) as mock_monotonic:
+        metrics = StreamMetrics()
+        assert metrics.as_dict()["packet_rate"] == 0.0
+
+        mock_monotonic.return_value = 100.0
+        metrics.sample_packets()
+        metrics.packets = 50
+        mock_monotonic.return_value = 102.0
+        metrics.sample_packets()
+        metrics.packets = 80
+        mock_monotonic.return_value = 104.0
+
+        # Reading the metrics does not restart the measurement
+        assert metrics.as_dict()["packet_rate"] == 20.0
+        assert metrics.as_dict()["packet_rate"] == 20.0
+
+        for _ in range(PACKET_RATE_SAMPLES):
+            metrics.sample_packets()
+        metrics.packets = 100
+        mock_monotonic.return_value = 105.0
+        assert metrics.as_dict()["packet_rate"] == 20.0
 
 
 async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
@@ -1015,6 +1047,47 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_shares_decode(hass: HomeAssistant) -> None:
+    """Test concurrent image requests share one decode in the decode pool."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    keyframe_converter = stream._keyframe_converter
+
+    decode_started = threading.Event()
+    decode_finish = threading.Event()
+    decodes = 0
+
+    def generate_image(width, height):
+        nonlocal decodes
+        decodes += 1
+        decode_started.set()
+        decode_finish.wait()
+        keyframe_converter._image = EMPTY_8_6_JPEG
+
+    with patch.object(keyframe_converter, "_generate_image", generate_image):
+        requests = [
+            hass.async_create_task(keyframe_converter.async_get_image())
+            for _ in range(3)
+        ]
+        await hass.async_add_executor_job(decode_started.wait)
+        assert stream.get_metrics()["decode_pool"] == {
+            "max_workers": 2,
+            "active": 1,
+            "queued": 0,
+            "saturation": 0.5,
+        }
+        decode_finish.set()
+        assert await asyncio.gather(*requests) == [EMPTY_8_6_JPEG] * 3
+
+    assert decodes == 1
+    assert stream.get_metrics()["decode_pool"]["active"] == 0
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
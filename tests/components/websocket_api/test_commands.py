@@ -17,6 +17,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import COMPRESSED_STATES_SNAPSHOT
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -1261,6 +1262,56 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_snapshot(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities shares and patches the compressed states snapshot."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+    hass.states.async_set("light.living_room", "on")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.living_room"}
+
+    snapshot = hass.data[COMPRESSED_STATES_SNAPSHOT]
+    payload = snapshot.async_get_payload()
+    assert snapshot.async_get_payload() is payload
+
+    hass.states.async_set("light.kitchen", "on", {"color": "blue"})
+    hass.states.async_remove("light.living_room")
+    hass.states.async_set("light.hallway", "off")
+
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    while msg["id"] != 8:
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"] == {
+        "a": {
+            "light.kitchen": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "on"},
+            "light.hallway": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+        }
+    }
+    assert snapshot.async_get_payload() is not payload
+
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.hallway": True}}})
+    await websocket_client.send_json({"id": 9, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.hallway": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}}
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -3,7 +3,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -15,7 +15,8 @@ from homeassistant.components.websocket_api import (
     websocket_command,
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -345,6 +346,219 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_pending_state_diffs_coalesce(
+    hass: HomeAssistant,
+    mock_low_peak,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test pending state diffs of an entity are merged above the peak."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = instance._connection
+    assert connection is not None
+
+    states = [State("light.kitchen", str(idx)) for idx in range(4)]
+    # Fill the queue up to the peak without giving the writer a chance to run
+    for _ in range(5):
+        instance._send_message({})
+    for old_state, new_state in zip(states, states[1:], strict=False):
+        connection.send_state_diff_message(
+            b"7",
+            Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": "light.kitchen",
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            ),
+        )
+    assert len(instance._message_queue) == 6
+    assert connection.stats.messages_coalesced == 2
+
+    for _ in range(5):
+        assert await websocket_client.receive_json() == {}
+    msg = await websocket_client.receive_json()
+    assert msg == {
+        "id": 7,
+        "type": "event",
+        "event": {"a": {"light.kitchen": {"s": "3", "a": {}, "c": ANY, "lc": ANY}}},
+    }
+    assert not instance._pending_state_diffs
+
+
+async def test_backpressure_drop_oldest(
+    hass: HomeAssistant,
+    mock_low_peak,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the drop oldest policy drops state diffs and resyncs their entities."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_BACKPRESSURE_POLICY: const.BackpressurePolicy.DROP_OLDEST
+            },
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = instance._connection
+    assert connection is not None
+    assert connection.backpressure_policy is const.BackpressurePolicy.DROP_OLDEST
+    connection.subscriptions[7] = lambda: None
+
+    for idx in range(4):
+        hass.states.async_set(f"light.kitchen_{idx}", "on")
+
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 8):
+        # Fill the queue up to the peak without giving the writer a chance to run
+        for idx in range(5):
+            instance._send_message({"idx": idx})
+        for idx in range(4):
+            entity_id = f"light.kitchen_{idx}"
+            connection.send_state_diff_message(
+                b"7",
+                Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": State(entity_id, "off"),
+                        "new_state": hass.states.get(entity_id),
+                    },
+                ),
+            )
+        # Diffs of entities waiting for a resync are not queued
+        connection.send_state_diff_message(
+            b"7",
+            Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": "light.kitchen_0",
+                    "old_state": State("light.kitchen_0", "off"),
+                    "new_state": hass.states.get("light.kitchen_0"),
+                },
+            ),
+        )
+
+    assert connection.stats.as_dict() == {
+        "messages_coalesced": 1,
+        "messages_dropped": 2,
+        "peak_pending": 8,
+    }
+    # Dropped state diffs are skipped by the writer instead of being removed
+    assert len(instance._message_queue) == 9
+    assert instance._dropped_state_diffs == 2
+    # Messages which are not state diffs are never dropped
+    for idx in range(5):
+        assert await websocket_client.receive_json() == {"idx": idx}
+    for idx in (2, 3):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["event"]["c"].keys() == {f"light.kitchen_{idx}"}
+    msg = await websocket_client.receive_json()
+    assert msg == {
+        "id": 7,
+        "type": "event",
+        "event": {
+            "a": {
+                "light.kitchen_0": {"s": "on", "a": {}, "c": ANY, "lc": ANY},
+                "light.kitchen_1": {"s": "on", "a": {}, "c": ANY, "lc": ANY},
+            }
+        },
+    }
+    assert instance._dropped_state_diffs == 0
+    assert "Client unable to keep up with pending messages" not in caplog.text
+
+
+async def test_backpressure_drop_oldest_without_state_diffs(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the drop oldest policy disconnects when no state diff can be dropped."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_BACKPRESSURE_POLICY: const.BackpressurePolicy.DROP_OLDEST
+            },
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 3):
+        for idx in range(3):
+            instance._send_message({"idx": idx})
+
+    msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.close
+    assert "Client unable to keep up with pending messages" in caplog.text
+
+
+async def test_connection_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the outgoing message stats of a connection are exposed."""
+    await websocket_client.send_json({"id": 5, "type": "connection/stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+    assert msg["result"] == {
+        "messages_coalesced": 0,
+        "messages_dropped": 0,
+        "peak_pending": ANY,
+    }
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -20,6 +20,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -41,6 +42,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -1707,6 +1709,62 @@ async def test_invalid_state(
     assert hass.states.get("test.test").state == "x" * 255
 
 
+async def test_async_batch_state_writes(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test state writes of entities are set at once when the batch exits."""
+    ent1 = entity.Entity()
+    ent1.entity_id = "test.one"
+    ent1.hass = hass
+    ent1._attr_state = "1"
+    ent2 = entity.Entity()
+    ent2.entity_id = "test.two"
+    ent2.hass = hass
+    ent2._attr_state = "2"
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with entity.async_batch_state_writes(hass):
+        ent1.async_write_ha_state()
+        with entity.async_batch_state_writes(hass):
+            ent2.async_write_ha_state()
+        # Nested batches are written by the outer batch
+        assert hass.states.get("test.two") is None
+        assert hass.states.get("test.one") is None
+
+    assert hass.states.get("test.one").state == "1"
+    assert hass.states.get("test.two").state == "2"
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert events[0].context.id != events[1].context.id
+
+    # The state of an entity removed inside the batch is not set
+    ent1._attr_state = "4"
+    with entity.async_batch_state_writes(hass):
+        ent1.async_write_ha_state()
+        ent2.async_write_ha_state()
+        ent2._platform_state = entity.EntityPlatformState.REMOVED
+        hass.states.async_remove("test.two")
+
+    assert hass.states.get("test.one").state == "4"
+    assert hass.states.get("test.two") is None
+    ent2._platform_state = entity.EntityPlatformState.NOT_ADDED
+
+    # An invalid state only makes that entity fall back to unknown
+    ent1._attr_state = "3"
+    ent2._attr_state = "x" * 256
+    with entity.async_batch_state_writes(hass):
+        ent1.async_write_ha_state()
+        ent2.async_write_ha_state()
+
+    assert hass.states.get("test.one").state == "3"
+    assert hass.states.get("test.two").state == STATE_UNKNOWN
+    assert (
+        "homeassistant.helpers.entity",
+        logging.ERROR,
+        f"Failed to set state for test.two, fall back to {STATE_UNKNOWN}",
+    ) in caplog.record_tuples
+
+
 async def test_suggest_report_issue_built_in(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -39,6 +39,7 @@ from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
     async_track_state_change_filtered,
+    async_track_state_change_pattern_event,
     async_track_state_removed_domain,
     async_track_state_report_event,
     async_track_sunrise,
@@ -537,6 +538,93 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_pattern_event(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_pattern_event."""
+    domain_tracker = []
+    power_tracker = []
+
+    @ha.callback
+    def domain_callback(event: Event[EventStateChangedData]) -> None:
+        domain_tracker.append(event.data["entity_id"])
+
+    @ha.callback
+    def power_callback(event: Event[EventStateChangedData]) -> None:
+        power_tracker.append(event.data["entity_id"])
+
+    @ha.callback
+    def callback_that_throws(event: Event[EventStateChangedData]) -> None:
+        raise ValueError
+
+    # Overlapping patterns only call the listener once per event
+    unsub_domain = async_track_state_change_pattern_event(
+        hass, ["Sensor.*", "sensor.power_*", "light.kitchen"], domain_callback
+    )
+    unsub_power = async_track_state_change_pattern_event(
+        hass, "sensor.power_?_phase_*", power_callback
+    )
+    unsub_throws = async_track_state_change_pattern_event(
+        hass, "sensor.*", callback_that_throws
+    )
+
+    hass.states.async_set("sensor.power_1_phase_a", "1")
+    hass.states.async_set("sensor.power_10_phase_a", "1")
+    hass.states.async_set("sensor.temperature", "20")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen_2", "on")
+    hass.states.async_set("switch.power_1_phase_a", "on")
+    await hass.async_block_till_done()
+
+    assert domain_tracker == [
+        "sensor.power_1_phase_a",
+        "sensor.power_10_phase_a",
+        "sensor.temperature",
+        "light.kitchen",
+    ]
+    assert power_tracker == ["sensor.power_1_phase_a"]
+
+    unsub_domain()
+    hass.states.async_remove("sensor.power_1_phase_a")
+    await hass.async_block_till_done()
+    assert len(domain_tracker) == 4
+    assert power_tracker == ["sensor.power_1_phase_a", "sensor.power_1_phase_a"]
+
+    unsub_power()
+    unsub_throws()
+    hass.states.async_set("sensor.power_2_phase_a", "1")
+    await hass.async_block_till_done()
+    assert len(power_tracker) == 2
+
+
+async def test_async_track_state_change_pattern_event_matches_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test the dispatcher reuses the jobs matched by the event filter."""
+    tracker = []
+
+    @ha.callback
+    def pattern_callback(event: Event[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    unsub = async_track_state_change_pattern_event(
+        hass, ["sensor.*", "sensor.power_*"], pattern_callback
+    )
+    callbacks = hass.data["track_state_change_pattern_data"].callbacks
+    with patch.object(
+        type(callbacks),
+        "_async_iter_matches",
+        autospec=True,
+        side_effect=type(callbacks)._async_iter_matches,
+    ) as mock_iter_matches:
+        hass.states.async_set("sensor.power_1", "1")
+        hass.states.async_set("light.kitchen", "on")
+        await hass.async_block_till_done()
+
+    # A listener matching several patterns is only called once
+    assert tracker == ["sensor.power_1"]
+    assert mock_iter_matches.call_count == 2
+    unsub()
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -1756,6 +1844,58 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_skips_unused_fields(hass: HomeAssistant) -> None:
+    """Test templates are not re-rendered when unused fields of a state change."""
+    renders = 0
+
+    def count_render() -> int:
+        nonlocal renders
+        renders += 1
+        return renders
+
+    template = Template(
+        "{{ states('sensor.power') }} {{ state_attr('sensor.power', 'phase') }}"
+        " {{ count_render() }}",
+        hass,
+    )
+    results = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        results.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template, {"count_render": count_render})],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+    assert renders == 1
+
+    hass.states.async_set("sensor.power", "5", {"phase": "a"})
+    await hass.async_block_till_done()
+    assert renders == 2
+    assert results == ["5 a 2"]
+
+    hass.states.async_set("sensor.power", "5", {"phase": "a", "voltage": 230})
+    await hass.async_block_till_done()
+    assert renders == 2
+
+    hass.states.async_set("sensor.power", "5", {"phase": "b", "voltage": 230})
+    await hass.async_block_till_done()
+    assert renders == 3
+
+    hass.states.async_set("sensor.power", "6", {"phase": "b", "voltage": 230})
+    await hass.async_block_till_done()
+    assert renders == 4
+    assert results == ["5 a 2", "5 b 3", "6 b 4"]
+
+    info.async_remove()
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
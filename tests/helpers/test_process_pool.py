@@ -0,0 +1,88 @@
+"""Test the process pool helper."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import process_pool
+
+
+async def test_async_add_process_job(hass: HomeAssistant) -> None:
+    """Test running jobs in worker processes with a snapshot of the states."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.living_room", "off")
+
+    assert await process_pool.async_add_process_job(hass, sorted) == [
+        "light.kitchen",
+        "light.living_room",
+    ]
+    pool = hass.data[process_pool.DATA_PROCESS_POOL]
+    snapshot = pool._snapshot
+    assert snapshot is not None
+
+    # The snapshot is reused until a state changed and it is too old
+    assert await process_pool.async_add_process_job(hass, len) == 2
+    assert pool._snapshot is snapshot
+
+    hass.states.async_set("light.bedroom", "on")
+    assert await process_pool.async_add_process_job(hass, len) == 2
+    assert pool._snapshot is snapshot
+
+    with patch.object(process_pool, "SNAPSHOT_MAX_AGE", 0):
+        assert await process_pool.async_add_process_job(hass, len) == 3
+        assert pool._snapshot is not snapshot
+        snapshot = pool._snapshot
+        assert await process_pool.async_add_process_job(hass, len) == 3
+        assert pool._snapshot is snapshot
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert pool._snapshot is None
+
+    with pytest.raises(RuntimeError, match="Process pool is shut down"):
+        await process_pool.async_add_process_job(hass, len)
+
+
+def _wait_for_release(
+    states: dict, started: threading.Event, release: threading.Event
+) -> int:
+    """Block until released."""
+    started.set()
+    release.wait()
+    return len(states)
+
+
+async def test_cancelled_job_keeps_snapshot(hass: HomeAssistant) -> None:
+    """Test the snapshot is only freed once a cancelled job is done."""
+    hass.states.async_set("light.kitchen", "on")
+    pool = process_pool._async_get_process_pool(hass)
+    executor = pool._executor = ThreadPoolExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    task = hass.async_create_task(
+        process_pool.async_add_process_job(hass, _wait_for_release, started, release)
+    )
+    await hass.async_add_executor_job(started.wait)
+    snapshot = pool._snapshot
+    pool._async_retire_snapshot()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The job is still running so the snapshot can not be freed yet
+    assert snapshot.users == 1
+    SharedMemory(name=snapshot.name).close()
+
+    release.set()
+    await hass.async_add_executor_job(executor.shutdown)
+    await hass.async_block_till_done()
+    assert snapshot.users == 0
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=snapshot.name)
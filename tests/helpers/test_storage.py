@@ -19,8 +19,13 @@ from homeassistant.const import (
 )
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    issue_registry as ir,
+    storage,
+)
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1185,146 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal_store(tmpdir: py.path.local) -> None:
+    """Test the journal store only appends the records which changed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        legacy = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        entities = [{"id": str(idx), "name": f"entity {idx}"} for idx in range(50)]
+        await legacy.async_save({"entities": entities, "deleted": [], "count": 50})
+
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        data = await store.async_load()
+        assert data == {"entities": entities, "deleted": [], "count": 50}
+
+        await store.async_save(data)
+        # The JSON file is kept for older versions
+        assert await hass.async_add_executor_job(os.path.exists, store.path)
+        size = await hass.async_add_executor_job(os.path.getsize, store.journal_path)
+
+        entities[1] = {"id": "1", "name": "renamed"}
+        deleted = [entities.pop(2)]
+        data = {"entities": entities, "deleted": deleted, "count": 49}
+        await store.async_save(data)
+        grown = (
+            await hass.async_add_executor_job(os.path.getsize, store.journal_path)
+            - size
+        )
+        # Only the renamed and deleted entity, the tombstone and count are added
+        assert 0 < grown < size / 10
+
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == data
+
+        # An incomplete write is ignored
+        def _append_garbage() -> None:
+            with open(store.journal_path, "ab") as fdesc:
+                fdesc.write(b"\x00\x00\x10\x00[")
+
+        await hass.async_add_executor_job(_append_garbage)
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == data
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_store_snapshot(tmpdir: py.path.local) -> None:
+    """Test the journal store keeps the JSON file usable by older versions."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        legacy = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        await legacy.async_save({"entities": [{"id": "1"}]})
+
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == {"entities": [{"id": "1"}]}
+        await store.async_save({"entities": [{"id": "1"}, {"id": "2"}]})
+
+        # The JSON file is only rewritten on the final write
+        assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == {
+            "entities": [{"id": "1"}]
+        }
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        legacy = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+        assert await legacy.async_load() == {"entities": [{"id": "1"}, {"id": "2"}]}
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == {"entities": [{"id": "1"}, {"id": "2"}]}
+
+        # A JSON file written by an older version after a downgrade is used
+        await legacy.async_save({"entities": [{"id": "3"}]})
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == {"entities": [{"id": "3"}]}
+        await store.async_save({"entities": [{"id": "3"}, {"id": "4"}]})
+        store = storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY)
+        assert await store.async_load() == {"entities": [{"id": "3"}, {"id": "4"}]}
+
+        with pytest.raises(ValueError):
+            storage.JournalStore(hass, MOCK_VERSION, MOCK_KEY, encoder=JSONEncoder)
+
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize(
+    ("store_class", "version", "minor_version", "key", "sections"),
+    [
+        (
+            er.EntityRegistryStore,
+            er.STORAGE_VERSION_MAJOR,
+            er.STORAGE_VERSION_MINOR,
+            er.STORAGE_KEY,
+            ("entities", "deleted_entities"),
+        ),
+        (
+            dr.DeviceRegistryStore,
+            dr.STORAGE_VERSION_MAJOR,
+            dr.STORAGE_VERSION_MINOR,
+            dr.STORAGE_KEY,
+            ("devices", "deleted_devices"),
+        ),
+    ],
+)
+async def test_registry_journal_store(
+    tmpdir: py.path.local,
+    store_class: type[storage.JournalStore],
+    version: int,
+    minor_version: int,
+    key: str,
+    sections: tuple[str, str],
+) -> None:
+    """Test the registries move to the journal and back after a downgrade."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    live, deleted = sections
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        legacy = storage.Store(hass, version, key, minor_version=minor_version)
+        data = {live: [{"id": str(idx)} for idx in range(10)], deleted: []}
+        await legacy.async_save(data)
+
+        store = store_class(hass, version, key, minor_version=minor_version)
+        assert await store.async_load() == data
+        data = {live: data[live][1:], deleted: data[live][:1]}
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # An older version loads the JSON file written on the final write
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        legacy = storage.Store(hass, version, key, minor_version=minor_version)
+        assert await legacy.async_load() == data
+        store = store_class(hass, version, key, minor_version=minor_version)
+        assert await store.async_load() == data
+
+        data = {live: data[live][1:], deleted: []}
+        await legacy.async_save(data)
+        store = store_class(hass, version, key, minor_version=minor_version)
+        assert await store.async_load() == data
+
+        await hass.async_stop(force=True)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
+import sys
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
@@ -21,6 +24,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -31,7 +35,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import (
     area_registry as ar,
@@ -5169,6 +5173,145 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_code_persisted(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled code of templates used while starting is persisted."""
+    hass.set_state(CoreState.not_running)
+    template.async_setup(hass)
+    await hass.async_block_till_done()
+
+    startup_template_string = "{{ 40 + 2 }}"
+    assert template.Template(startup_template_string, hass).async_render() == 42
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert template.Template("{{ 40 + 3 }}", hass).async_render() == 43
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.COMPILED_CODE_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[template.COMPILED_CODE_STORAGE_KEY]["data"]
+    assert data["runtime"].startswith(f"{template.HA_VERSION}-{sys.version}-")
+    assert list(data["code"]) == [
+        template._compiled_code_key("default", startup_template_string)
+    ]
+
+
+async def test_compiled_code_loaded(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test persisted compiled code is used instead of compiling again."""
+    template_string = "{{ 40 + 2 }}"
+    cache = template._CompiledCodeCache(hass)
+    compiled = template.TemplateEnvironment(hass).compile(template_string)
+    cache.add("default", template_string, compiled)
+    hass_storage[template.COMPILED_CODE_STORAGE_KEY] = {
+        "version": template.COMPILED_CODE_STORAGE_VERSION,
+        "key": template.COMPILED_CODE_STORAGE_KEY,
+        "data": cache._data_to_save(),
+    }
+
+    hass.set_state(CoreState.not_running)
+    template.async_setup(hass)
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.template.ImmutableSandboxedEnvironment.compile"
+    ) as mock_compile:
+        assert template.Template(template_string, hass).async_render() == 42
+    assert not mock_compile.called
+
+
+async def test_compiled_code_not_saved_when_unchanged(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the persisted code is not saved again when the same code was used."""
+    template_string = "{{ 40 + 2 }}"
+    cache = template._CompiledCodeCache(hass)
+    cache.add(
+        "default",
+        template_string,
+        template.TemplateEnvironment(hass).compile(template_string),
+    )
+    hass_storage[template.COMPILED_CODE_STORAGE_KEY] = {
+        "version": template.COMPILED_CODE_STORAGE_VERSION,
+        "key": template.COMPILED_CODE_STORAGE_KEY,
+        "data": cache._data_to_save(),
+    }
+
+    cache = template._CompiledCodeCache(hass)
+    await cache.async_load()
+    assert cache.get("default", template_string) is not None
+    with patch.object(cache._store, "async_delay_save") as mock_delay_save:
+        cache.async_started()
+    assert not mock_delay_save.called
+    # Nothing is served once started
+    assert cache.get("default", template_string) is None
+
+
+async def test_compiled_code_bounded(hass: HomeAssistant) -> None:
+    """Test the number of persisted compiled code is bounded."""
+    env = template.TemplateEnvironment(hass)
+    template_strings = ["{{ 1 }}", "{{ 2 }}", "{{ 3 }}"]
+    cache = template._CompiledCodeCache(hass)
+    with patch("homeassistant.helpers.template.MAX_PERSISTED_COMPILED_CODE", 2):
+        for template_string in template_strings:
+            cache.add("default", template_string, env.compile(template_string))
+
+    assert list(cache._data_to_save()["code"]) == [
+        template._compiled_code_key("default", template_strings[0]),
+        template._compiled_code_key("default", template_strings[1]),
+    ]
+
+
+async def test_compiled_code_runtime_changed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test persisted compiled code is discarded after an upgrade."""
+    template_string = "{{ 40 + 2 }}"
+    key = template._compiled_code_key("default", template_string)
+    hass_storage[template.COMPILED_CODE_STORAGE_KEY] = {
+        "version": template.COMPILED_CODE_STORAGE_VERSION,
+        "key": template.COMPILED_CODE_STORAGE_KEY,
+        "data": {"runtime": "2000.1.0-3.11.0-0000-1.0", "code": {key: "invalid"}},
+    }
+
+    cache = template._CompiledCodeCache(hass)
+    await cache.async_load()
+    assert cache.get("default", template_string) is None
+    assert template.COMPILED_CODE_STORAGE_KEY not in hass_storage
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "invalid",
+        base64.b64encode(b"garbage").decode(),
+        base64.b64encode(marshal.dumps({"not": "code"})).decode(),
+    ],
+)
+async def test_compiled_code_invalid(
+    hass: HomeAssistant, hass_storage: dict[str, Any], code: str
+) -> None:
+    """Test persisted data which is not compiled code is ignored."""
+    template_string = "{{ 40 + 2 }}"
+    cache = template._CompiledCodeCache(hass)
+    key = template._compiled_code_key("default", template_string)
+    hass_storage[template.COMPILED_CODE_STORAGE_KEY] = {
+        "version": template.COMPILED_CODE_STORAGE_VERSION,
+        "key": template.COMPILED_CODE_STORAGE_KEY,
+        "data": {"runtime": cache._runtime, "code": {key: code}},
+    }
+
+    await cache.async_load()
+    assert cache.get("default", template_string) is None
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -5604,6 +5747,42 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_collects_state_fields(hass: HomeAssistant) -> None:
+    """Test the fields of the states used by a render are collected."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.hallway", "off")
+    hass.states.async_set("sensor.power", "5")
+    hass.states.async_set("switch.fan", "on")
+    info = render_to_info(
+        hass,
+        "{{ states('light.kitchen') }} {{ state_attr('light.kitchen', 'brightness') }}"
+        " {{ states.light.hallway.domain }} {{ states.sensor.power }}"
+        " {{ states.switch | map(attribute='last_changed') | list }}",
+    )
+    assert info.entities == {"light.kitchen", "light.hallway"}
+    assert info.entity_fields == {
+        "light.kitchen": {"state", "attributes.brightness"},
+        "light.hallway": set(),
+        # The representation of a state depends on all of its fields
+        "sensor.power": None,
+    }
+    assert info.domains == {"switch"}
+    assert info.state_fields == {"last_changed"}
+
+    changed = frozenset({"last_updated", "context", "attributes", "attributes.color"})
+    assert not info.fields_trigger_rerender("light.kitchen", changed)
+    assert info.fields_trigger_rerender(
+        "light.kitchen", changed | {"attributes.brightness"}
+    )
+    assert not info.fields_trigger_rerender("light.hallway", changed | {"state"})
+    assert not info.fields_trigger_rerender("switch.fan", changed | {"state"})
+    assert info.fields_trigger_rerender("switch.fan", changed | {"last_changed"})
+
+    info = render_to_info(hass, "{{ states.light | list }}")
+    assert info.state_fields is None
+    assert info.fields_trigger_rerender("light.kitchen", frozenset({"context"}))
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
@@ -11,8 +11,8 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, STATE_UNKNOWN
+from homeassistant.core import CoreState, HomeAssistant, State, StateMachine, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import update_coordinator
 from homeassistant.util.dt import utcnow
@@ -747,3 +747,126 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_skip_unchanged_contexts(hass: HomeAssistant) -> None:
+    """Test listeners are skipped when the data of their context is unchanged."""
+    data = {"a": 1, "b": 1}
+
+    async def refresh() -> dict[str, int]:
+        return dict(data)
+
+    crd = update_coordinator.DataUpdateCoordinator[dict[str, int]](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=timedelta(seconds=10),
+        skip_unchanged_contexts=True,
+    )
+    updates: list[str | None] = []
+    unsubs = [
+        crd.async_add_listener(lambda: updates.append("a"), "a"),
+        crd.async_add_listener(lambda: updates.append("b"), "b"),
+        crd.async_add_listener(lambda: updates.append(None)),
+    ]
+
+    await crd.async_refresh()
+    assert updates == ["a", "b", None]
+    assert crd.metrics.listeners == 3
+    assert crd.metrics.listeners_updated == 3
+
+    updates.clear()
+    data["b"] = 2
+    await crd.async_refresh()
+    assert updates == ["b", None]
+    assert crd.metrics.listeners_updated == 2
+    assert crd.metrics.listeners_updated_ratio == 2 / 3
+    assert crd.metrics.refreshes == 2
+    assert crd.metrics.last_refresh_duration is not None
+    assert crd.metrics.total_refresh_duration >= crd.metrics.last_refresh_duration
+
+    # All listeners are called when the update fails or recovers
+    updates.clear()
+    crd.async_set_update_error(update_coordinator.UpdateFailed())
+    assert updates == ["a", "b", None]
+
+    updates.clear()
+    crd.async_set_updated_data({"a": 1, "b": 2})
+    assert updates == ["a", "b", None]
+
+    updates.clear()
+    crd.async_set_updated_data({"a": 2, "b": 2})
+    assert updates == ["a", None]
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_coordinator_entity_state_writes_batched(hass: HomeAssistant) -> None:
+    """Test coordinator entities write their states in one batch."""
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    crd.batch_state_writes = True
+    states_seen: list[State | None] = []
+    entities = []
+    for idx in range(3):
+        ent = update_coordinator.CoordinatorEntity(crd)
+        ent.hass = hass
+        ent.entity_id = f"sensor.test_{idx}"
+        entities.append(ent)
+        crd.async_add_listener(ent._handle_coordinator_update)
+
+    @callback
+    def _check_states() -> None:
+        states_seen.append(hass.states.get("sensor.test_0"))
+
+    crd.async_add_listener(_check_states)
+    await crd.async_refresh()
+
+    # States are only set after all listeners have been called
+    assert states_seen == [None]
+    assert [hass.states.get(ent.entity_id).state for ent in entities] == [
+        STATE_UNKNOWN
+    ] * 3
+    # Each entity keeps its own context
+    context_ids = {hass.states.get(ent.entity_id).context.id for ent in entities}
+    assert len(context_ids) == 3
+
+    # Entities removed by a listener are not written back
+    @callback
+    def _remove_entity() -> None:
+        hass.async_create_task(entities[1].async_remove())
+
+    crd.async_add_listener(_remove_entity)
+    async_set_many = StateMachine.async_set_many
+    with patch.object(
+        StateMachine, "async_set_many", autospec=True, side_effect=async_set_many
+    ) as mock_set_many:
+        await crd.async_refresh()
+    await hass.async_block_till_done()
+    assert [update.entity_id for update in mock_set_many.call_args[0][1]] == [
+        "sensor.test_0",
+        "sensor.test_2",
+    ]
+    assert hass.states.get(entities[1].entity_id) is None
+
+
+async def test_coordinator_entity_state_writes_not_batched(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test coordinator entities write their states one by one by default."""
+    states_seen: list[State | None] = []
+    ent = update_coordinator.CoordinatorEntity(crd)
+    ent.hass = hass
+    ent.entity_id = "sensor.test"
+    crd.async_add_listener(ent._handle_coordinator_update)
+
+    @callback
+    def _check_states() -> None:
+        states_seen.append(hass.states.get("sensor.test"))
+
+    crd.async_add_listener(_check_states)
+    await crd.async_refresh()
+
+    assert states_seen[0].state == STATE_UNKNOWN
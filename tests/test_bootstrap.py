@@ -23,7 +23,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration
-from homeassistant.setup import BASE_PLATFORMS
+from homeassistant.setup import BASE_PLATFORMS, SetupPhases, SetupSpan
 
 from .common import (
     MockConfigEntry,
@@ -1497,3 +1497,54 @@ def test_should_rollover_is_always_false() -> None:
         ).shouldRollover(Mock())
         is False
     )
+
+
+async def test_startup_critical_path_and_trace(hass: HomeAssistant) -> None:
+    """Test the critical path and Chrome trace of the startup."""
+    integration_cache = {
+        "http": Mock(dependencies=[], after_dependencies=[]),
+        "api": Mock(dependencies=["http"], after_dependencies=[]),
+        "zone": Mock(dependencies=[], after_dependencies=[]),
+        "automation": Mock(dependencies=["zone"], after_dependencies=["api"]),
+    }
+    assert bootstrap._async_order_by_dependencies(
+        set(integration_cache), integration_cache
+    ) == [
+        ("http", set()),
+        ("zone", set()),
+        ("api", {"http"}),
+        ("automation", {"zone", "api"}),
+    ]
+
+    setup_spans = [
+        SetupSpan("http", None, SetupPhases.SETUP, 10.0, 11.0),
+        SetupSpan("zone", None, SetupPhases.SETUP, 10.0, 10.5),
+        SetupSpan("api", None, SetupPhases.SETUP, 11.0, 12.0),
+        SetupSpan("automation", None, SetupPhases.SETUP, 12.0, 14.0),
+        SetupSpan("automation", "entry", SetupPhases.CONFIG_ENTRY_SETUP, 13.0, 13.5),
+    ]
+    critical_path = bootstrap._async_get_critical_path(setup_spans, integration_cache)
+    assert [span.integration for span in critical_path] == [
+        "http",
+        "api",
+        "automation",
+    ]
+
+    trace = bootstrap._async_startup_trace(
+        hass, [("stage 2", 9.5, 15.0)], setup_spans, critical_path
+    )
+    assert trace["otherData"]["critical_path"] == ["http", "api", "automation"]
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert events[0] == {
+        "name": "stage 2",
+        "cat": "stage",
+        "ph": "X",
+        "pid": 1,
+        "tid": 0,
+        "ts": 0,
+        "dur": 5_500_000,
+    }
+    assert {event["tid"] for event in events if event["name"] == "automation"} == {
+        4,
+        5,
+    }
@@ -1555,6 +1555,74 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.desk", "off")
+    bowl = hass.states.get("light.bowl")
+    desk = hass.states.get("light.desk")
+    events: list[ha.Event] = []
+
+    @callback
+    def _listener(event: ha.Event) -> None:
+        # All states of the batch are stored before the first listener runs
+        assert hass.states.get("light.kitchen") is not None
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _listener)
+    hass.bus.async_listen(EVENT_STATE_REPORTED, _listener)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ha.StateUpdate("light.bowl", "on", {"brightness": 200}),
+            ha.StateUpdate("light.desk", "off"),
+            ha.StateUpdate("Light.Kitchen", "on", context=context),
+            ha.StateUpdate("light.kitchen", "off"),
+        ],
+        timestamp=1000.0,
+    )
+    await hass.async_block_till_done()
+
+    assert [(event.event_type, event.data["entity_id"]) for event in events] == [
+        (EVENT_STATE_CHANGED, "light.bowl"),
+        (EVENT_STATE_REPORTED, "light.desk"),
+        (EVENT_STATE_CHANGED, "light.kitchen"),
+        (EVENT_STATE_CHANGED, "light.kitchen"),
+    ]
+    new_bowl = hass.states.get("light.bowl")
+    assert new_bowl.attributes == {"brightness": 200}
+    assert new_bowl.last_changed == bowl.last_changed
+    assert new_bowl.last_updated_timestamp == 1000.0
+    assert hass.states.get("light.desk") is desk
+    assert desk.last_reported_timestamp == 1000.0
+    assert events[2].data["old_state"] is None
+    assert events[2].context is context
+    assert events[3].data["old_state"] is events[2].data["new_state"]
+    assert hass.states.get("light.kitchen").state == "off"
+    # Each update without a context gets its own
+    assert events[0].context is not context
+    assert events[3].context is not context
+    assert events[0].context.id != events[3].context.id
+
+
+async def test_statemachine_async_set_many_invalid(hass: HomeAssistant) -> None:
+    """Test nothing is set when a state in the batch is invalid."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [
+                ha.StateUpdate("light.bowl", "on"),
+                ha.StateUpdate("invalid_entity_id", "on"),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl") is None
+    assert events == []
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -17,6 +17,7 @@ from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+from homeassistant.setup import async_set_domains_to_be_loaded
 from homeassistant.util.json import json_loads
 
 from .common import MockModule, async_get_persistent_notifications, mock_integration
@@ -1302,6 +1303,11 @@ async def test_async_get_component_preloads_config_and_config_flow(
     assert "homeassistant.components.executor_import" not in sys.modules
     assert "custom_components.executor_import" not in sys.modules
 
+    # Platforms are only preloaded for the integrations processing them
+    async_set_domains_to_be_loaded(
+        hass, set(loader.BASE_PRELOAD_PLATFORM_CONSUMERS.values())
+    )
+
     platform_exists_calls = []
 
     def mock_platforms_exists(platforms: list[str]) -> bool:
@@ -1335,6 +1341,34 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_async_get_component_skips_unneeded_preload_platforms(
+    hass: HomeAssistant,
+) -> None:
+    """Verify platforms of integrations which are not set up are not preloaded."""
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+    # A resolved integration is not necessarily set up
+    await loader.async_get_integration(hass, "repairs")
+    hass.config.components.add("diagnostics")
+
+    with (
+        patch("homeassistant.loader.importlib.import_module") as mock_import,
+        patch.object(executor_import_integration, "platforms_exists", side_effect=list),
+    ):
+        await executor_import_integration.async_get_component()
+
+    assert [call[0][0] for call in mock_import.call_args_list] == [
+        "homeassistant.components.executor_import",
+        "homeassistant.components.executor_import.config_flow",
+        "homeassistant.components.executor_import.diagnostics",
+    ]
+    timing = loader.async_get_import_timings(hass)[
+        "homeassistant.components.executor_import"
+    ]
+    assert timing.in_event_loop is False
+
+
 @pytest.mark.usefixtures("enable_custom_integrations")
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture